@@ -23,10 +23,15 @@ geometry
     Functions for geometry generation and analysis.
 io
     Functions for loading/saving GCS shapes.
+metrics
+    Functions for computing GCS metrics without meshing.
+sweep
+    Functions for sampling and evaluating GCS design spaces.
 verify
     Functions for verifying the validity of GCS shapes.
 
 """
+from .batch import GCSBatch
 from .named_shapes import Cylinder
 from .named_shapes import Iroko
 from .named_shapes import Willow
@@ -34,16 +39,21 @@ from .shape import GCS
 
 from . import geometry
 from . import io
+from . import metrics
+from . import sweep
 from . import verify
 
 submodules = [
     'geometry',
     'io',
+    'metrics',
+    'sweep',
     'verify',
 ]
 
 __all__ = submodules + [
     'GCS',
+    'GCSBatch',
     'Cylinder',
     'Iroko',
     'Willow',
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .geometry.meshing import CAP_TRIANGULATIONS, FACE_DTYPES, VERTEX_DTYPES, _cap_centres, _generate_vertices
+from .shape import GCS, PARAMETER_NAMES
+from .verify.verify_base_perimeter import MIN_BASE_PERIMETER
+from .verify.verify_radius import MIN_RADIUS, min_radius
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from numpy.typing import ArrayLike
+
+# Column data types of the parameters that are not floats
+_NON_FLOAT_DTYPES = {
+    'n_height_steps': int,
+    'triangulate_caps': bool,
+    'cap_triangulation': str,
+}
+
+# Parameter names and column data types, in ``gcs.GCS`` argument order
+PARAMETER_DTYPES = {name: _NON_FLOAT_DTYPES.get(name, float) for name in PARAMETER_NAMES}
+
+
+class GCSBatch:
+    """Batch of generalized cylindrical shells (GCS) stored as parameter columns.
+
+    Properties are computed for all shapes at once with vectorized operations.
+
+    """
+
+    def __init__(self,
+                 c4_base: ArrayLike,
+                 c8_base: ArrayLike,
+                 c4_top: ArrayLike,
+                 c8_top: ArrayLike,
+                 twist_linear: ArrayLike,
+                 twist_amplitude: ArrayLike,
+                 twist_cycles: ArrayLike,
+                 perimeter_ratio: ArrayLike,
+                 height: ArrayLike,
+                 mass: ArrayLike,
+                 thickness: ArrayLike,
+                 n_height_steps: ArrayLike = 100,
+                 theta_step: ArrayLike = 0.01,
+                 density: ArrayLike = 0.0012,
+                 triangulate_caps: ArrayLike = True,
+                 cap_triangulation: ArrayLike = 'earcut',
+                 adaptive_tolerance: ArrayLike = 0.0,
+                 vertex_dtype: str = 'float64',
+                 face_dtype: str = 'int64') -> None:
+        """Initialize ``GCSBatch``.
+
+        Each parameter is either a scalar shared by all shapes or an array with one
+        value per shape. Refer to ``gcs.GCS`` for the meaning of each parameter. The
+        vertex and face data types are output options shared by all shapes.
+
+        Parameters
+        ----------
+        c4_base, c8_base, c4_top, c8_top : {float, (N,) array_like}
+            Base and top lobe parameters.
+        twist_linear, twist_amplitude, twist_cycles : {float, (N,) array_like}
+            Twist parameters.
+        perimeter_ratio : {float, (N,) array_like}
+            Ratios between the top and base perimeters.
+        height : {float, (N,) array_like}
+            Heights (mm).
+        mass : {float, (N,) array_like}
+            Masses (g).
+        thickness : {float, (N,) array_like}
+            Wall thicknesses (mm).
+        n_height_steps : {int, (N,) array_like} (default=`100`)
+            Number of sampled cross-sections along the height.
+        theta_step : {float, (N,) array_like} (default=`0.01`)
+            Angular step sizes used to sample each cross-section in radians.
+        density : {float, (N,) array_like} (default=`0.0012`)
+            Material densities (g/mm^3).
+        triangulate_caps : {bool, (N,) array_like} (default=`True`)
+            Set to `True` to triangulate the top and bottom faces.
+        cap_triangulation : {str, (N,) array_like} (default=`'earcut'`)
+            Methods used to triangulate the top and bottom faces (``'earcut'`` or ``'fan'``).
+        adaptive_tolerance : {float, (N,) array_like} (default=`0.0`)
+            Maximum chord deviations (mm) of curvature-adaptive sampling. Set to `0` to sample uniformly.
+        vertex_dtype : str (default=`'float64'`)
+            Data type of the vertex coordinates (``'float32'`` or ``'float64'``).
+        face_dtype : str (default=`'int64'`)
+            Data type of the face indices (``'int32'``, ``'int64'`` or ``'uint32'``).
+
+        Raises
+        ------
+        ValueError
+            If the parameter arrays cannot be broadcast to a common 1-D shape.
+            If any ``n_height_steps`` is less than 2.
+            If any ``theta_step`` is not in the range (0,2π/3].
+            If any ``density`` is not positive.
+            If any ``cap_triangulation`` is not a supported method.
+            If any ``adaptive_tolerance`` is negative.
+            If ``vertex_dtype`` or ``face_dtype`` is not a supported data type.
+
+        Examples
+        --------
+        >>> batch = gcs.GCSBatch(c4_base=[0.3, 0.1], c8_base=-0.2, c4_top=0.4, c8_top=-0.1, twist_linear=1.2, twist_amplitude=0.1, twist_cycles=2.0, perimeter_ratio=1.3, height=25, mass=[2, 3], thickness=0.5)
+        >>> len(batch)
+        2
+
+        """
+        values = [c4_base, c8_base, c4_top, c8_top, twist_linear, twist_amplitude, twist_cycles,
+                  perimeter_ratio, height, mass, thickness, n_height_steps, theta_step, density,
+                  triangulate_caps, cap_triangulation, adaptive_tolerance]
+
+        columns = np.broadcast_arrays(*(np.asarray(value) for value in values))
+
+        if columns[0].ndim != 1:
+            raise ValueError(f'parameters must broadcast to a 1-D shape, got {columns[0].shape}.')
+
+        columns = {
+            name: np.ascontiguousarray(column, dtype=dtype)
+            for (name, dtype), column in zip(PARAMETER_DTYPES.items(), columns)
+        }
+
+        invalid = columns['n_height_steps'] < 2
+        if np.any(invalid):
+            raise ValueError(f'n_height_steps ({columns["n_height_steps"][invalid][0]}) must be at least 2.')
+        invalid = (columns['theta_step'] <= 0) | (columns['theta_step'] > 2 * np.pi / 3)
+        if np.any(invalid):
+            raise ValueError(f'theta_step ({columns["theta_step"][invalid][0]}) must be in range (0, 2π/3].')
+        invalid = columns['density'] <= 0
+        if np.any(invalid):
+            raise ValueError(f'density ({columns["density"][invalid][0]}) must be positive.')
+        invalid = ~np.isin(columns['cap_triangulation'], CAP_TRIANGULATIONS)
+        if np.any(invalid):
+            raise ValueError(f'cap_triangulation ({columns["cap_triangulation"][invalid][0]}) '
+                             f'must be one of {CAP_TRIANGULATIONS}.')
+        invalid = columns['adaptive_tolerance'] < 0
+        if np.any(invalid):
+            raise ValueError(f'adaptive_tolerance ({columns["adaptive_tolerance"][invalid][0]}) must be non-negative.')
+        if vertex_dtype not in VERTEX_DTYPES:
+            raise ValueError(f'vertex_dtype ({vertex_dtype}) must be one of {VERTEX_DTYPES}.')
+        if face_dtype not in FACE_DTYPES:
+            raise ValueError(f'face_dtype ({face_dtype}) must be one of {FACE_DTYPES}.')
+
+        for name, column in columns.items():
+            setattr(self, f'{name}_', column)
+
+        self.vertex_dtype_ = vertex_dtype
+        self.face_dtype_ = face_dtype
+
+    @classmethod
+    def from_shapes(cls,
+                    shapes: Iterable[GCS],
+                    vertex_dtype: str = 'float64',
+                    face_dtype: str = 'int64') -> GCSBatch:
+        """Creates a ``GCSBatch`` from individual GCS shapes.
+
+        Parameters
+        ----------
+        shapes : Iterable[gcs.GCS]
+            GCS shapes.
+        vertex_dtype : str (default=`'float64'`)
+            Data type of the vertex coordinates (``'float32'`` or ``'float64'``).
+        face_dtype : str (default=`'int64'`)
+            Data type of the face indices (``'int32'``, ``'int64'`` or ``'uint32'``).
+
+        Returns
+        -------
+        batch : gcs.GCSBatch
+            Batch containing ``shapes`` in order.
+
+        Examples
+        --------
+        >>> batch = gcs.GCSBatch.from_shapes([gcs.Iroko(), gcs.Willow()])
+
+        """
+        rows = [tuple(shape.parameters.values()) for shape in shapes]
+
+        columns = zip(*rows) if rows else ([] for _ in PARAMETER_DTYPES)
+
+        return cls(**{
+            name: np.array(list(column), dtype=dtype)
+            for (name, dtype), column in zip(PARAMETER_DTYPES.items(), columns)
+        }, vertex_dtype=vertex_dtype, face_dtype=face_dtype)
+
+    @property
+    def parameters(self) -> dict:
+        """GCS parameter columns.
+
+        """
+        return {name: getattr(self, f'{name}_') for name in PARAMETER_NAMES}
+
+    @property
+    def valid_base_perimeter(self) -> np.ndarray:
+        """Checks whether each GCS has a sufficiently large base perimeter.
+
+        Refer to ``gcs.verify.verify_base_perimeter`` for full documentation.
+
+        """
+        return self.base_perimeter >= MIN_BASE_PERIMETER
+
+    @property
+    def valid_radius(self) -> np.ndarray:
+        """Checks whether the minimum radius of each GCS stays above a printable threshold.
+
+        Refer to ``gcs.verify.verify_radius`` for full documentation.
+
+        """
+        return self.min_radius >= MIN_RADIUS
+
+    @property
+    def min_radius(self) -> np.ndarray:
+        """Minimum radius (mm) of the base and top cross-sections of each GCS.
+
+        The minimum is found analytically. Refer to ``gcs.verify.verify_radius`` for full documentation.
+
+        """
+        min_r = np.empty(shape=(len(self), 2), dtype=float)
+
+        # Shapes sharing an angular resolution are checked together
+        theta_steps, inverse = np.unique(self.theta_step_, return_inverse=True)
+
+        for index, theta_step in enumerate(theta_steps):
+            mask = inverse.reshape(-1) == index
+
+            thetas = np.arange(start=0, stop=2 * np.pi, step=theta_step)
+
+            min_r[mask, 0] = min_radius(thetas=thetas,
+                                        perimeter=self.base_perimeter[mask],
+                                        c4=self.c4_base_[mask],
+                                        c8=self.c8_base_[mask])
+            min_r[mask, 1] = min_radius(thetas=thetas,
+                                        perimeter=self.top_perimeter[mask],
+                                        c4=self.c4_top_[mask],
+                                        c8=self.c8_top_[mask])
+
+        return np.min(min_r, axis=1, initial=np.inf)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Runs all verification checks for each GCS.
+
+        Refer to ``gcs.verify.verify`` for full documentation.
+
+        """
+        return self.valid_base_perimeter & self.valid_radius
+
+    @property
+    def base_perimeter(self) -> np.ndarray:
+        """Base perimeters (mm).
+
+        """
+        numerator = 2 * self.mass_
+        denominator = self.density_ * self.height_ * self.thickness_ * (1 + self.perimeter_ratio_)
+
+        return numerator / denominator
+
+    @property
+    def top_perimeter(self) -> np.ndarray:
+        """Top perimeters (mm).
+
+        """
+        numerator = 2 * self.mass_ * self.perimeter_ratio_
+        denominator = self.density_ * self.height_ * self.thickness_ * (1 + self.perimeter_ratio_)
+
+        return numerator / denominator
+
+    @cached_property
+    def vertices(self) -> np.ndarray:
+        """Vertices of each GCS, stacked into a (N, V, 3) array.
+
+        Requires all shapes to share ``n_height_steps``, ``theta_step``, and whether
+        the caps are fan-triangulated, and to be sampled uniformly (``adaptive_tolerance`` of 0).
+
+        """
+        if np.any(self.adaptive_tolerance_ > 0):
+            raise ValueError('vertices requires uniformly sampled shapes (adaptive_tolerance of 0).')
+
+        n_height_steps = np.unique(self.n_height_steps_)
+        theta_step = np.unique(self.theta_step_)
+        fan_caps = np.unique(self.triangulate_caps_ & (self.cap_triangulation_ == 'fan'))
+
+        if n_height_steps.size != 1 or theta_step.size != 1 or fan_caps.size != 1:
+            raise ValueError('vertices requires a non-empty batch with a single n_height_steps and theta_step, '
+                             'and either all or no caps triangulated with fan.')
+
+        vertices = _generate_vertices(c4_base=self.c4_base_,
+                                      c8_base=self.c8_base_,
+                                      c4_top=self.c4_top_,
+                                      c8_top=self.c8_top_,
+                                      twist_linear=self.twist_linear_,
+                                      twist_amplitude=self.twist_amplitude_,
+                                      twist_cycles=self.twist_cycles_,
+                                      base_perimeter=self.base_perimeter,
+                                      top_perimeter=self.top_perimeter,
+                                      height=self.height_,
+                                      n_height_steps=n_height_steps.item(),
+                                      theta_step=theta_step.item(),
+                                      dtype=self.vertex_dtype_)
+        vertices = vertices.reshape(len(self), -1, 3)
+
+        if fan_caps.item():
+            centres = _cap_centres(heights=np.stack((np.zeros_like(self.height_), self.height_), axis=-1),
+                                   dtype=vertices.dtype)
+            vertices = np.concatenate((vertices, centres), axis=1)
+
+        return vertices
+
+    def __len__(self) -> int:
+        """Returns the number of shapes in the batch.
+
+        """
+        return self.c4_base_.size
+
+    def __getitem__(self, index: int | slice | np.ndarray) -> GCS | GCSBatch:
+        """Selects one shape or a sub-batch.
+
+        Parameters
+        ----------
+        index : {int, slice, numpy.ndarray}
+            Integer position, slice, integer index array, or boolean mask.
+
+        Returns
+        -------
+        selection : {gcs.GCS, gcs.GCSBatch}
+            ``gcs.GCS`` for an integer position, otherwise a ``gcs.GCSBatch``.
+
+        """
+        dtypes = {'vertex_dtype': self.vertex_dtype_, 'face_dtype': self.face_dtype_}
+
+        if isinstance(index, (int, np.integer)):
+            return GCS(**{name: column[index].item() for name, column in self.parameters.items()}, **dtypes)
+
+        return GCSBatch(**{name: column[index] for name, column in self.parameters.items()}, **dtypes)
+
+    def __iter__(self) -> Iterator[GCS]:
+        """Iterates over the shapes in the batch.
+
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """Returns a developer-friendly representation of the batch.
+
+        """
+        return f'{type(self).__name__}(n_shapes={len(self)})'
@@ -16,13 +16,30 @@ Parameterized Curves
 
     summed_cosine
 
+    summed_cosine_derivative
+
+    min_summed_cosine
+
 Polar curves
 ------------
 
     arc_length
 
+    unit_arc_length
+
     optimal_scaling_factor
 
+    optimal_scaling_factors
+
+Cross-sections
+--------------
+
+    Rings
+
+    adaptive_sampling
+
+    uniform_resolution
+
 Meshing
 -------
 
@@ -30,18 +47,55 @@ Meshing
 
     generate_faces
 
+    generate_lod
+
+    generate_lods
+
+    iter_rings
+
+    mesh_size
+
+Regions
+-------
+
+    generate_cross_section
+
+    generate_band
+
+    generate_sector
+
 """
 from .coordinates import cart2pol, pol2cart
-from .meshing import generate_faces, generate_vertices
-from .polar_curves import arc_length, optimal_scaling_factor
-from .summed_cosine import summed_cosine
+from .meshing import generate_faces, generate_lod, generate_lods, generate_vertices, iter_rings, mesh_size
+from .polar_curves import arc_length
+from .polar_curves import optimal_scaling_factor
+from .polar_curves import optimal_scaling_factors
+from .polar_curves import unit_arc_length
+from .regions import generate_band, generate_cross_section, generate_sector
+from .rings import Rings
+from .sampling import adaptive_sampling, uniform_resolution
+from .summed_cosine import min_summed_cosine, summed_cosine, summed_cosine_derivative
 
 __all__ = [
+    'Rings',
+    'adaptive_sampling',
     'arc_length',
     'cart2pol',
+    'generate_band',
+    'generate_cross_section',
     'generate_faces',
+    'generate_lod',
+    'generate_lods',
+    'generate_sector',
     'generate_vertices',
+    'iter_rings',
+    'mesh_size',
+    'min_summed_cosine',
     'optimal_scaling_factor',
+    'optimal_scaling_factors',
     'pol2cart',
     'summed_cosine',
+    'summed_cosine_derivative',
+    'uniform_resolution',
+    'unit_arc_length',
 ]
@@ -1,85 +1,471 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable
 
 import mapbox_earcut as earcut
 import numpy as np
 
-from .coordinates import pol2cart
-from .polar_curves import optimal_scaling_factor
-from .summed_cosine import summed_cosine
+from .polar_curves import optimal_scaling_factors
+from .rings import _ring_parameters, _ring_radii, _ring_vertices
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from numpy.typing import DTypeLike
+
     from ..shape import GCS
 
+# Supported cap triangulation methods
+CAP_TRIANGULATIONS = ('earcut', 'fan')
+
+# Supported vertex coordinate and face index data types
+VERTEX_DTYPES = ('float32', 'float64')
+FACE_DTYPES = ('int32', 'int64', 'uint32')
+
+# Maximum total size (bytes) of the face templates shared between shapes
+FACE_CACHE_MAX_BYTES = 2**27
 
-def generate_vertices(shape: GCS) -> np.ndarray:
+
+def generate_vertices(shape: GCS, dtype: DTypeLike | None = None, out: np.ndarray | None = None) -> np.ndarray:
     """Generates the vertices of a GCS.
 
     Parameters
     ----------
     shape : gcs.GCS
         GCS shape.
+    dtype : DTypeLike (default=`None`)
+        Vertex coordinate data type (``'float32'`` or ``'float64'``). Coordinates are
+        written directly in this type from radii computed in bounded chunks of rings
+        (see ``gcs.geometry.Rings.vertices``), without a full-size float64 copy. If
+        `None`, the shape's ``vertex_dtype`` is used.
+    out : (N, 3) numpy.ndarray (default=`None`)
+        C-contiguous floating-point array the vertices are written to, e.g., a slice
+        of a larger preallocated array or a ``numpy.memmap``. Its data type overrides
+        ``dtype``. See ``gcs.geometry.mesh_size`` for ``N``.
 
     Returns
     -------
     vertices : (N, 3) np.ndarray
+        Vertices. Caps triangulated with ``'fan'`` add the base and top centres as
+        the last two vertices. ``out`` if given.
+
+    Raises
+    ------
+    ValueError
+        If ``dtype`` is not a supported data type.
+        If ``out`` does not have the shape of the vertices, or is not a C-contiguous
+        floating-point array.
+
+    Examples
+    --------
+    >>> shapes = [gcs.Iroko(), gcs.Willow()]
+    >>> n_vertices = gcs.geometry.mesh_size(shape=shapes[0])[0]
+    >>> arena = np.lib.format.open_memmap('vertices.npy', mode='w+', dtype=np.float32, shape=(2, n_vertices, 3))
+    >>> for shape, out in zip(shapes, arena):
+    ...     _ = gcs.geometry.generate_vertices(shape=shape, out=out)
+
+    """
+    return _mesh_vertices(shape=shape, rings=slice(None), angles=slice(None), dtype=dtype, out=out)
+
+
+def _generate_vertices(c4_base: np.ndarray,
+                       c8_base: np.ndarray,
+                       c4_top: np.ndarray,
+                       c8_top: np.ndarray,
+                       twist_linear: np.ndarray,
+                       twist_amplitude: np.ndarray,
+                       twist_cycles: np.ndarray,
+                       base_perimeter: np.ndarray,
+                       top_perimeter: np.ndarray,
+                       height: np.ndarray,
+                       n_height_steps: int,
+                       theta_step: float,
+                       dtype: DTypeLike = float) -> np.ndarray:
+    """Generates the vertices of one or more GCS sharing the same resolution.
+
+    Parameters
+    ----------
+    c4_base, c8_base, c4_top, c8_top : (M,) numpy.ndarray
+        Base and top lobe parameters.
+    twist_linear, twist_amplitude, twist_cycles : (M,) numpy.ndarray
+        Twist parameters.
+    base_perimeter, top_perimeter : (M,) numpy.ndarray
+        Base and top perimeters (mm).
+    height : (M,) numpy.ndarray
+        Heights (mm).
+    n_height_steps : int
+        Number of sampled cross-sections along the height.
+    theta_step : float
+        Angular step size used to sample each cross-section in radians.
+    dtype : DTypeLike (default=`float`)
+        Vertex coordinate data type.
+
+    Returns
+    -------
+    vertices : (M, n_height_steps, n_thetas, 3) np.ndarray
+        Vertices of each shape.
+
+    """
+    thetas = np.arange(start=0, stop=2 * np.pi, step=theta_step)
+    fractions = np.linspace(start=0, stop=1, num=n_height_steps)
+
+    c4s, c8s, perimeters, twists, heights = _ring_parameters(c4_base=c4_base,
+                                                             c8_base=c8_base,
+                                                             c4_top=c4_top,
+                                                             c8_top=c8_top,
+                                                             twist_linear=twist_linear,
+                                                             twist_amplitude=twist_amplitude,
+                                                             twist_cycles=twist_cycles,
+                                                             base_perimeter=base_perimeter,
+                                                             top_perimeter=top_perimeter,
+                                                             height=height,
+                                                             fractions=fractions)
+
+    # Scaling factors for all cross-sections of all shapes solved as one batch
+    r0s = optimal_scaling_factors(lengths=perimeters.ravel(),
+                                  c4s=c4s.ravel(),
+                                  c8s=c8s.ravel(),
+                                  n_steps=thetas.size).reshape(perimeters.shape)
+
+    radii = _ring_radii(thetas=thetas, twists=twists, r0s=r0s, c4s=c4s, c8s=c8s)
+
+    return _ring_vertices(radii=radii, thetas=thetas, heights=heights, dtype=dtype)
+
+
+def generate_faces(shape: GCS, dtype: DTypeLike | None = None, out: np.ndarray | None = None) -> np.ndarray:
+    """Generates the faces of a GCS.
+
+    The side faces depend only on the mesh resolution and are shared between
+    shapes. Caps triangulated with ``'earcut'`` are triangulated for each shape,
+    while ``'fan'`` caps connect each cap outline to its centre, so the whole
+    topology is shared between shapes of the same resolution.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    dtype : DTypeLike (default=`None`)
+        Face index data type (``'int32'``, ``'int64'`` or ``'uint32'``). If `None`, the
+        shape's ``face_dtype`` is used.
+    out : (N, 3) numpy.ndarray (default=`None`)
+        C-contiguous integer array the faces are written to, e.g., a slice of a larger
+        preallocated array or a ``numpy.memmap``. Its data type overrides ``dtype``.
+        See ``gcs.geometry.mesh_size`` for ``N``.
+
+    Returns
+    -------
+    faces : (N, 3) np.ndarray
+        Faces. Read-only unless the caps are triangulated with ``'earcut'``.
+        ``out`` if given.
+
+    Raises
+    ------
+    ValueError
+        If ``dtype`` is not a supported data type.
+        If the vertex indices do not fit in the face data type.
+        If ``out`` does not have the shape of the faces, or is not a C-contiguous
+        integer array.
+
+    """
+    return _mesh_faces(shape=shape, rings=slice(None), angles=slice(None), dtype=dtype, out=out)
+
+
+def mesh_size(shape: GCS) -> tuple[int, int]:
+    """Computes the number of vertices and faces of a GCS mesh without generating it.
+
+    Used to preallocate the ``out`` arrays of ``gcs.geometry.generate_vertices`` and
+    ``gcs.geometry.generate_faces``. Caps triangulated with ``'earcut'`` are assumed
+    to be simple polygons, whose triangulations have two faces fewer than vertices.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+
+    Returns
+    -------
+    n_vertices : int
+        Number of vertices.
+    n_faces : int
+        Number of faces.
+
+    Examples
+    --------
+    >>> n_vertices, n_faces = gcs.geometry.mesh_size(shape=gcs.Willow())
+
+    """
+    n_height_steps = shape.rings.fractions_.size
+    n_vertices_per_step = shape.rings.thetas_.size
+
+    n_vertices = n_height_steps * n_vertices_per_step
+    n_faces = 2 * (n_height_steps - 1) * n_vertices_per_step
+
+    if shape.triangulate_caps_ and shape.cap_triangulation_ == 'fan':
+        return n_vertices + 2, n_faces + 2 * n_vertices_per_step
+    if shape.triangulate_caps_:
+        return n_vertices, n_faces + 2 * (n_vertices_per_step - 2)
+
+    return n_vertices, n_faces
+
+
+def generate_lod(shape: GCS, level: int, factor: int = 2) -> tuple[np.ndarray, np.ndarray]:
+    """Generates one level of detail of a GCS mesh.
+
+    Level ``k`` keeps every ``factor**k``-th ring (and the top ring) and every
+    ``factor**k``-th angle of the shape's sampling grid, so each level is an exact
+    subsample of the finer levels. Levels share the scaling factors and radii
+    cached by ``shape.rings``: a coarse level only solves its own rings, and finer
+    levels (including ``shape.vertices``) reuse those solves.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    level : int
+        Level of detail, from 0 (``shape.vertices`` and ``shape.faces``) to coarser levels.
+    factor : int (default=`2`)
+        Subsampling factor between consecutive levels.
+
+    Returns
+    -------
+    vertices : (N, 3) numpy.ndarray
         Vertices.
+    faces : (M, 3) numpy.ndarray
+        Faces.
+
+    Raises
+    ------
+    ValueError
+        If ``level`` is negative.
+        If ``factor`` is less than 2.
+
+    Examples
+    --------
+    >>> shape = gcs.Willow()
+    >>> preview = gcs.geometry.generate_lod(shape=shape, level=2)
+    >>> vertices, faces = shape.vertices, shape.faces
 
     """
-    parameters = shape.parameters
+    if level < 0:
+        raise ValueError(f'level ({level}) must be non-negative.')
+    if factor < 2:
+        raise ValueError(f'factor ({factor}) must be at least 2.')
+
+    if level == 0:
+        return shape.vertices, shape.faces
+
+    n_rings = shape.rings.fractions_.size
+    n_thetas = shape.rings.thetas_.size
+
+    rings = np.unique(np.append(np.arange(start=0, stop=n_rings, step=factor**level), n_rings - 1))
+
+    # Cross-sections keep at least 3 angles, so angular subsampling stops early
+    angular_level = level
+    while -(-n_thetas // factor**angular_level) < 3:
+        angular_level -= 1
+    angles = slice(None, None, factor**angular_level)
 
-    thetas = np.arange(start=0, stop=2 * np.pi, step=parameters['theta_step'])
-    c4s = np.linspace(start=parameters['c4_base'],
-                      stop=parameters['c4_top'],
-                      num=parameters['n_height_steps'])
-    c8s = np.linspace(start=parameters['c8_base'],
-                      stop=parameters['c8_top'],
-                      num=parameters['n_height_steps'])
-    perimeters = np.linspace(start=shape.base_perimeter,
-                             stop=shape.top_perimeter,
-                             num=parameters['n_height_steps'])
-    twists_linear = np.linspace(start=0,
-                                stop=parameters['twist_linear'],
-                                num=parameters['n_height_steps'])
-    frequencies = np.linspace(start=0,
-                              stop=2 * np.pi * parameters['twist_cycles'],
-                              num=parameters['n_height_steps'])
-    twists_oscillating = parameters['twist_amplitude'] * np.sin(frequencies)
+    return _mesh_vertices(shape=shape, rings=rings, angles=angles), _mesh_faces(shape=shape, rings=rings, angles=angles)
 
-    height_per_step = parameters['height'] / (parameters['n_height_steps'] - 1)
 
-    vertices = np.empty(shape=(parameters['n_height_steps'], thetas.size, 3), dtype=float)
+def generate_lods(shape: GCS, n_levels: int = 3, factor: int = 2) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Generates a level-of-detail pyramid of GCS meshes.
 
-    for step in range(parameters['n_height_steps']):
-        c4 = c4s[step]
-        c8 = c8s[step]
-        perimeter = perimeters[step]
-        twist_linear = twists_linear[step]
-        twist_oscillating = twists_oscillating[step]
-        height = height_per_step * step
+    Refer to ``gcs.geometry.generate_lod`` for full documentation.
 
-        r0 = optimal_scaling_factor(length=perimeter, c4=c4, c8=c8, n_steps=thetas.size)
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    n_levels : int (default=`3`)
+        Number of levels.
+    factor : int (default=`2`)
+        Subsampling factor between consecutive levels.
 
-        step_thetas = thetas + twist_linear + twist_oscillating
-        r = summed_cosine(theta=step_thetas, r0=r0, c4=c4, c8=c8)
+    Returns
+    -------
+    meshes : list[tuple[numpy.ndarray, numpy.ndarray]]
+        Vertices and faces of each level, from the coarsest to the finest
+        (``shape.vertices`` and ``shape.faces``).
 
-        x, y = pol2cart(r=r, theta=thetas)
+    Raises
+    ------
+    ValueError
+        If ``n_levels`` is less than 1.
+        If ``factor`` is less than 2.
 
-        vertices[step, :, 0] = x
-        vertices[step, :, 1] = y
-        vertices[step, :, 2] = height
+    Examples
+    --------
+    >>> thumbnail, preview, mesh = gcs.geometry.generate_lods(shape=gcs.Willow(), n_levels=3, factor=4)
 
-    return vertices.reshape(-1, 3)
+    """
+    if n_levels < 1:
+        raise ValueError(f'n_levels ({n_levels}) must be at least 1.')
 
+    return [generate_lod(shape=shape, level=level, factor=factor) for level in reversed(range(n_levels))]
 
-def generate_faces(shape: GCS) -> np.ndarray:
-    """Generates the faces of a GCS.
+
+def iter_rings(shape: GCS,
+               chunk: int = 1,
+               faces: bool = False) -> Iterator[np.ndarray] | Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Lazily generates the rings of a GCS wall, ``chunk`` rings at a time.
+
+    Only the rings of the current chunk are evaluated, so consumers can process or
+    write the shell while it is generated, with peak memory bounded by the chunk
+    size. The concatenated chunks equal the wall vertices of ``shape.vertices``
+    (which also contain the fan cap centres when present). Caps are not generated.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    chunk : int (default=`1`)
+        Number of rings generated at a time.
+    faces : bool (default=`False`)
+        Set to `True` to also yield the side faces connecting each chunk to the
+        previous rings.
+
+    Yields
+    ------
+    vertices : (chunk * T, 3) numpy.ndarray
+        Vertices of the chunk's rings, ordered ring by ring. The last chunk may be smaller.
+    faces : (M, 3) numpy.ndarray
+        If ``faces`` is `True`, side faces between the last ring of the previous chunk and
+        the chunk's rings, indexing the concatenated vertices of all chunks.
+
+    Raises
+    ------
+    ValueError
+        If ``chunk`` is less than 1.
+
+    Examples
+    --------
+    >>> for vertices, faces in gcs.geometry.iter_rings(shape=gcs.Willow(), chunk=10, faces=True):
+    ...     pass
+
+    """
+    if chunk < 1:
+        raise ValueError(f'chunk ({chunk}) must be at least 1.')
+
+    # Arguments are validated on call, before the generator is first advanced
+    return _iter_rings(shape=shape, chunk=chunk, faces=faces)
+
+
+def _iter_rings(shape: GCS,
+                chunk: int,
+                faces: bool) -> Iterator[np.ndarray] | Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Lazily generates the rings of a GCS wall (see ``gcs.geometry.iter_rings``).
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    chunk : int
+        Number of rings generated at a time.
+    faces : bool
+        Set to `True` to also yield the side faces connecting each chunk to the
+        previous rings.
+
+    Yields
+    ------
+    vertices : (chunk * T, 3) numpy.ndarray
+        Vertices of the chunk's rings, ordered ring by ring.
+    faces : (M, 3) numpy.ndarray
+        If ``faces`` is `True`, side faces between the last ring of the previous chunk and
+        the chunk's rings, indexing the concatenated vertices of all chunks.
+
+    """
+    rings = shape.rings
+
+    n_rings = rings.fractions_.size
+    n_vertices_per_step = rings.thetas_.size
+
+    for start in range(0, n_rings, chunk):
+        stop = min(start + chunk, n_rings)
+
+        vertices = rings.vertices(rings=slice(start, stop), dtype=shape.vertex_dtype_)
+
+        if not faces:
+            yield vertices
+            continue
+
+        # Strips from the last ring of the previous chunk, offset to global vertex indices
+        first = max(start - 1, 0)
+        strips = _side_faces(n_height_steps=stop - first,
+                             n_vertices_per_step=n_vertices_per_step,
+                             dtype=shape.face_dtype_)
+
+        yield vertices, strips + first * n_vertices_per_step
+
+
+def _mesh_vertices(shape: GCS,
+                   rings: slice | np.ndarray,
+                   angles: slice | np.ndarray,
+                   dtype: DTypeLike | None = None,
+                   out: np.ndarray | None = None) -> np.ndarray:
+    """Generates the vertices of a GCS mesh on a subset of its sampling grid.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    rings : {slice, numpy.ndarray}
+        Selected rings, including the base and top rings.
+    angles : {slice, numpy.ndarray}
+        Selected angles.
+    dtype : DTypeLike (default=`None`)
+        Vertex coordinate data type. If `None`, the shape's ``vertex_dtype`` is used.
+    out : (N, 3) numpy.ndarray (default=`None`)
+        Output array. Allocated with ``dtype`` if `None`.
+
+    Returns
+    -------
+    vertices : (N, 3) np.ndarray
+        Vertices.
+
+    """
+    ring_indices = np.arange(shape.rings.fractions_.size)[rings]
+    n_ring_vertices = ring_indices.size * shape.rings.thetas_[angles].size
+
+    fan_caps = shape.triangulate_caps_ and shape.cap_triangulation_ == 'fan'
+    n_vertices = n_ring_vertices + 2 if fan_caps else n_ring_vertices
+
+    if out is None:
+        dtype = _mesh_dtype(dtype=dtype, default=shape.vertex_dtype_, supported=VERTEX_DTYPES, name='vertex dtype')
+        out = np.empty(shape=(n_vertices, 3), dtype=dtype)
+    else:
+        _check_out(out=out, shape=(n_vertices, 3), kinds='f', name='vertices')
+
+    shape.rings.vertices(rings=rings, angles=angles, out=out[:n_ring_vertices])
+
+    if fan_caps:
+        out[n_ring_vertices:] = _cap_centres(heights=shape.rings.heights_[ring_indices[[0, -1]]], dtype=out.dtype)
+
+    return out
+
+
+def _mesh_faces(shape: GCS,
+                rings: slice | np.ndarray,
+                angles: slice | np.ndarray,
+                dtype: DTypeLike | None = None,
+                out: np.ndarray | None = None) -> np.ndarray:
+    """Generates the faces of a GCS mesh on a subset of its sampling grid.
 
     Parameters
     ----------
     shape : gcs.GCS
         GCS shape.
+    rings : {slice, numpy.ndarray}
+        Selected rings, including the base and top rings.
+    angles : {slice, numpy.ndarray}
+        Selected angles.
+    dtype : DTypeLike (default=`None`)
+        Face index data type. If `None`, the shape's ``face_dtype`` is used.
+    out : (N, 3) numpy.ndarray (default=`None`)
+        Output array. Shared templates or a new array with ``dtype`` are returned if `None`.
 
     Returns
     -------
@@ -87,45 +473,357 @@ def generate_faces(shape: GCS) -> np.ndarray:
         Faces.
 
     """
-    parameters = shape.parameters
+    ring_indices = np.arange(shape.rings.fractions_.size)[rings]
 
-    vertices = shape.vertices
+    n_height_steps = ring_indices.size
+    n_vertices_per_step = shape.rings.thetas_[angles].size
+    if out is None:
+        dtype = _mesh_dtype(dtype=dtype, default=shape.face_dtype_, supported=FACE_DTYPES, name='face dtype')
+    else:
+        dtype = out.dtype
 
-    n_vertices_per_step = vertices.shape[0] // parameters['n_height_steps']
+    if dtype.kind not in 'iu':
+        raise ValueError(f'faces out array has unsupported data type {dtype}.')
 
-    vertex_indicies = np.arange(start=0, stop=vertices.shape[0], dtype=int)
-    vertex_grid = vertex_indicies.reshape(parameters['n_height_steps'], n_vertices_per_step)
+    # Fan caps add the base and top centres
+    n_vertices = n_height_steps * n_vertices_per_step + 2
+    if n_vertices - 1 > np.iinfo(dtype).max:
+        raise ValueError(f'face_dtype ({dtype}) cannot index {n_vertices} vertices.')
 
-    bottom_right = vertex_grid[:-1, :]
-    bottom_left = np.roll(a=bottom_right, shift=1, axis=1)
-    top_right = vertex_grid[1:, :]
-    top_left = np.roll(a=top_right, shift=1, axis=1)
+    if not shape.triangulate_caps_ or shape.cap_triangulation_ == 'fan':
+        template = _side_faces if not shape.triangulate_caps_ else _fan_faces
+        faces = template(n_height_steps=n_height_steps, n_vertices_per_step=n_vertices_per_step, dtype=dtype)
 
-    lower_faces = np.stack((bottom_right, top_left, bottom_left), axis=-1).reshape(-1, 3)
-    upper_faces = np.stack((bottom_right, top_right, top_left), axis=-1).reshape(-1, 3)
+        if out is None:
+            return faces
 
-    faces = np.vstack((lower_faces, upper_faces))
+        _check_out(out=out, shape=faces.shape, kinds='iu', name='faces')
+        out[...] = faces
 
-    if parameters['triangulate_caps']:
-        base_vertices = vertices[:n_vertices_per_step:, :2]
-        top_vertices = vertices[-n_vertices_per_step:, :2]
+        return out
 
-        # from mapbox_earcut:
-        # An array of end-indices for each ring (1st ring is outer contour of the polygon).
-        rings = np.array([n_vertices_per_step])
+    side_faces = _side_faces(n_height_steps=n_height_steps, n_vertices_per_step=n_vertices_per_step, dtype=dtype)
 
-        triangles_indices_base = earcut.triangulate_float32(base_vertices, rings)
-        triangles_indices_top = earcut.triangulate_float32(top_vertices, rings)
+    # Only the base and top rings are needed for the caps
+    ends = shape.rings.vertices(rings=ring_indices[[0, -1]], angles=angles)
 
-        # offset top indices to correct indices
-        triangles_indices_top += (vertices.shape[0] - n_vertices_per_step)
+    faces_base = _cap_faces(ring=ends[:n_vertices_per_step], base=True, dtype=dtype)
+    faces_top = _cap_faces(ring=ends[n_vertices_per_step:], base=False, dtype=dtype)
 
-        faces_base = triangles_indices_base.reshape(-1, 3)
-        faces_top = triangles_indices_top.reshape(-1, 3)
+    n_side_faces = side_faces.shape[0]
+    n_base_faces = faces_base.shape[0]
+
+    n_faces = n_side_faces + n_base_faces + faces_top.shape[0]
+
+    if out is None:
+        faces = np.empty(shape=(n_faces, 3), dtype=dtype)
+    else:
+        faces = _check_out(out=out, shape=(n_faces, 3), kinds='iu', name='faces')
+
+    faces[:n_side_faces] = side_faces
+    faces[n_side_faces:n_side_faces + n_base_faces] = faces_base
+
+    # offset top indices to correct indices
+    np.add(faces_top, (n_height_steps - 1) * n_vertices_per_step, out=faces[n_side_faces + n_base_faces:])
+
+    return faces
+
+
+def _mesh_dtype(dtype: DTypeLike | None, default: str, supported: tuple[str, ...], name: str) -> np.dtype:
+    """Resolves the data type of a generated mesh array.
+
+    Parameters
+    ----------
+    dtype : {DTypeLike, None}
+        Requested data type, or `None` to use ``default``.
+    default : str
+        Data type of the shape.
+    supported : tuple[str, ...]
+        Supported data type names.
+    name : str
+        Name of the data type, used in error messages.
+
+    Returns
+    -------
+    dtype : numpy.dtype
+        Data type.
+
+    Raises
+    ------
+    ValueError
+        If the data type is not supported.
+
+    """
+    dtype = np.dtype(default if dtype is None else dtype)
+
+    if dtype.name not in supported:
+        raise ValueError(f'{name} ({dtype}) must be one of {supported}.')
+
+    return dtype
+
+
+def _check_out(out: np.ndarray, shape: tuple[int, int], kinds: str, name: str) -> np.ndarray:
+    """Validates a caller-provided output array.
+
+    Parameters
+    ----------
+    out : numpy.ndarray
+        Output array.
+    shape : tuple[int, int]
+        Expected shape.
+    kinds : str
+        Accepted data type kinds (e.g., ``'f'`` or ``'iu'``).
+    name : str
+        Name of the output, used in error messages.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        Validated output array.
+
+    Raises
+    ------
+    ValueError
+        If ``out`` does not have the expected shape or data type kind, or is not C-contiguous.
+
+    """
+    if out.shape != shape:
+        raise ValueError(f'{name} out array has shape {out.shape}, expected {shape}.')
+    if out.dtype.kind not in kinds:
+        raise ValueError(f'{name} out array has unsupported data type {out.dtype}.')
+    if not out.flags.c_contiguous:
+        raise ValueError(f'{name} out array must be C-contiguous.')
+
+    return out
+
+
+def _face_cache(function: Callable[..., np.ndarray]) -> Callable[..., np.ndarray]:
+    """Caches the read-only face arrays returned by a function, bounded by their total size.
+
+    The least recently used arrays are evicted once the cached arrays exceed
+    ``FACE_CACHE_MAX_BYTES``, and arrays larger than the limit are rebuilt on each
+    call instead of being cached. The cache is cleared with ``cache_clear()``.
+
+    Parameters
+    ----------
+    function : Callable[..., numpy.ndarray]
+        Function returning a read-only face array.
+
+    Returns
+    -------
+    cached_function : Callable[..., numpy.ndarray]
+        Cached function.
+
+    """
+    cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+    lock = Lock()
+
+    @wraps(function)
+    def cached_function(*args: Any, **kwargs: Any) -> np.ndarray:
+        key = args + tuple(sorted(kwargs.items()))
+
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+        faces = function(*args, **kwargs)
+
+        if faces.nbytes <= FACE_CACHE_MAX_BYTES:
+            with lock:
+                cache[key] = faces
+
+                n_bytes = sum(cached_faces.nbytes for cached_faces in cache.values())
+                while n_bytes > FACE_CACHE_MAX_BYTES:
+                    n_bytes -= cache.popitem(last=False)[1].nbytes
+
+        return faces
+
+    def cache_clear() -> None:
+        """Removes all cached face arrays.
+
+        """
+        with lock:
+            cache.clear()
+
+    cached_function.cache_clear = cache_clear
+
+    return cached_function
+
+
+@_face_cache
+def _side_faces(n_height_steps: int, n_vertices_per_step: int, dtype: DTypeLike = int) -> np.ndarray:
+    """Generates the side faces connecting consecutive rings.
+
+    Side faces depend only on the mesh resolution, so they are built once per
+    resolution (and data type) and shared (read-only) between shapes, within
+    ``FACE_CACHE_MAX_BYTES``.
+
+    Parameters
+    ----------
+    n_height_steps : int
+        Number of rings.
+    n_vertices_per_step : int
+        Number of vertices per ring.
+    dtype : DTypeLike (default=`int`)
+        Face index data type.
+
+    Returns
+    -------
+    faces : (2 * (n_height_steps - 1) * n_vertices_per_step, 3) np.ndarray
+        Side faces (read-only), indexing vertices ordered ring by ring.
+
+    """
+    faces = np.empty(shape=(2, n_height_steps - 1, n_vertices_per_step, 3), dtype=dtype)
+
+    # First vertex index of each lower ring, and vertex positions within a ring
+    bottom = np.arange(start=0, stop=n_height_steps - 1, dtype=dtype)[:, np.newaxis] * n_vertices_per_step
+    top = bottom + n_vertices_per_step
+    right = np.arange(start=0, stop=n_vertices_per_step, dtype=dtype)
+    left = np.roll(a=right, shift=1)
+
+    # Lower faces
+    np.add(bottom, right, out=faces[0, ..., 0])
+    np.add(top, left, out=faces[0, ..., 1])
+    np.add(bottom, left, out=faces[0, ..., 2])
+
+    # Upper faces
+    faces[1, ..., 0] = faces[0, ..., 0]
+    np.add(top, right, out=faces[1, ..., 1])
+    faces[1, ..., 2] = faces[0, ..., 1]
+
+    faces = faces.reshape(-1, 3)
+    faces.flags.writeable = False
+
+    return faces
+
+
+@_face_cache
+def _fan_faces(n_height_steps: int, n_vertices_per_step: int, dtype: DTypeLike = int) -> np.ndarray:
+    """Generates the faces of a GCS with fan-triangulated caps.
+
+    Parameters
+    ----------
+    n_height_steps : int
+        Number of rings.
+    n_vertices_per_step : int
+        Number of vertices per ring.
+    dtype : DTypeLike (default=`int`)
+        Face index data type.
+
+    Returns
+    -------
+    faces : (2 * n_height_steps * n_vertices_per_step, 3) np.ndarray
+        Side, base and top faces (read-only), indexing vertices ordered ring by
+        ring followed by the base and top centres.
+
+    """
+    n_ring_vertices = n_height_steps * n_vertices_per_step
+
+    side_faces = _side_faces(n_height_steps=n_height_steps, n_vertices_per_step=n_vertices_per_step, dtype=dtype)
+
+    faces = np.empty(shape=(side_faces.shape[0] + 2 * n_vertices_per_step, 3), dtype=dtype)
+
+    faces[:side_faces.shape[0]] = side_faces
+    faces[side_faces.shape[0]:-n_vertices_per_step] = _fan_cap_faces(n_vertices_per_step=n_vertices_per_step,
+                                                                      start=0,
+                                                                      centre=n_ring_vertices,
+                                                                      base=True)
+    faces[-n_vertices_per_step:] = _fan_cap_faces(n_vertices_per_step=n_vertices_per_step,
+                                                  start=n_ring_vertices - n_vertices_per_step,
+                                                  centre=n_ring_vertices + 1,
+                                                  base=False)
+
+    faces.flags.writeable = False
+
+    return faces
+
+
+def _fan_cap_faces(n_vertices_per_step: int, start: int, centre: int, base: bool) -> np.ndarray:
+    """Triangulates a base or top cap as a fan around its centre.
+
+    Each cross-section is a polar curve with a positive radius, so the cap is
+    star-shaped with respect to its centre and the fan is always a valid triangulation.
+
+    Parameters
+    ----------
+    n_vertices_per_step : int
+        Number of vertices of the cap outline.
+    start : int
+        Index of the first outline vertex.
+    centre : int
+        Index of the cap centre.
+    base : bool
+        Set to `True` for the base cap, whose faces are flipped for outward facing normals.
+
+    Returns
+    -------
+    faces : (n_vertices_per_step, 3) np.ndarray
+        Cap faces.
+
+    """
+    current = np.arange(start=start, stop=start + n_vertices_per_step, dtype=int)
+    following = np.roll(a=current, shift=-1)
+
+    faces = np.empty(shape=(n_vertices_per_step, 3), dtype=int)
+
+    faces[:, 0] = centre
+    faces[:, 1] = following if base else current
+    faces[:, 2] = current if base else following
+
+    return faces
 
-        # Flip order of base vertices for outward facing normals
-        faces_base = np.fliplr(m=faces_base)
 
-        faces = np.vstack((faces, faces_base, faces_top))
+def _cap_centres(heights: np.ndarray, dtype: DTypeLike = float) -> np.ndarray:
+    """Centres of the base and top caps.
+
+    Parameters
+    ----------
+    heights : (..., 2) np.ndarray
+        Base and top heights.
+    dtype : DTypeLike (default=`float`)
+        Vertex coordinate data type.
+
+    Returns
+    -------
+    centres : (..., 2, 3) np.ndarray
+        Base and top centres.
+
+    """
+    centres = np.zeros(shape=heights.shape + (3,), dtype=dtype)
+    centres[..., 2] = heights
+
+    return centres
+
+
+def _cap_faces(ring: np.ndarray, base: bool, dtype: DTypeLike = int) -> np.ndarray:
+    """Triangulates a base or top cap.
+
+    Parameters
+    ----------
+    ring : (N, 2+) np.ndarray
+        Vertices of the cap outline. Only the x and y coordinates are used.
+    base : bool
+        Set to `True` for the base cap, whose faces are flipped for outward facing normals.
+    dtype : DTypeLike (default=`int`)
+        Face index data type.
+
+    Returns
+    -------
+    faces : (M, 3) np.ndarray
+        Cap faces, indexing ``ring``.
+
+    """
+    # from mapbox_earcut:
+    # An array of end-indices for each ring (1st ring is outer contour of the polygon).
+    rings = np.array([ring.shape[0]])
+
+    triangles_indices = earcut.triangulate_float32(ring[:, :2], rings)
+
+    faces = triangles_indices.reshape(-1, 3).astype(dtype, copy=False)
+
+    if base:
+        # Flip order of base vertices for outward facing normals
+        faces = np.fliplr(m=faces)
 
     return faces
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 from scipy.optimize import minimize
 from scipy.integrate import simpson
@@ -7,24 +9,27 @@ from scipy.integrate import simpson
 from .summed_cosine import summed_cosine
 
 
-def arc_length(r0: float, c4: float, c8: float, n_steps: int) -> float:
+def arc_length(r0: float | np.ndarray,
+               c4: float | np.ndarray,
+               c8: float | np.ndarray,
+               n_steps: int) -> float | np.ndarray:
     """Approximate arc length of a summed cosine polar equation using Simpson's rule.
 
     Parameters
     ----------
-    r0 : float
-        Scaling factor.
-    c4 : float
-        4-lobe parameter.
-    c8 : float
-        8-lobe parameter.
+    r0 : {float, (N,) numpy.ndarray}
+        Scaling factor(s).
+    c4 : {float, (N,) numpy.ndarray}
+        4-lobe parameter(s).
+    c8 : {float, (N,) numpy.ndarray}
+        8-lobe parameter(s).
     n_steps : float
         Number of angular discritization steps.
 
     Returns
     -------
-    length : float
-       Approximate arc length.
+    length : {float, (N,) numpy.ndarray}
+       Approximate arc length(s).
 
     References
     ----------
@@ -34,16 +39,52 @@ def arc_length(r0: float, c4: float, c8: float, n_steps: int) -> float:
 
     """
     theta = np.linspace(start=0, stop=2 * np.pi, num=n_steps)
-    r = np.apply_along_axis(func1d=summed_cosine, axis=0, arr=theta, r0=r0, c4=c4, c8=c8)
+
+    # Broadcast curve parameters against the sampled angles
+    r0 = np.asarray(r0, dtype=float)[..., np.newaxis]
+    c4 = np.asarray(c4, dtype=float)[..., np.newaxis]
+    c8 = np.asarray(c8, dtype=float)[..., np.newaxis]
+
+    r = summed_cosine(theta=theta, r0=r0, c4=c4, c8=c8)
 
     d_radius_d_theta = -4 * r0 * (c4 * np.sin(4 * theta) + 2 * c8 * np.sin(8 * theta))
 
     arc_length_element = np.hypot(d_radius_d_theta, r)
 
-    return simpson(y=arc_length_element, x=theta)
+    return simpson(y=arc_length_element, x=theta, axis=-1)
+
 
+@lru_cache(maxsize=4096)
+def unit_arc_length(c4: float, c8: float, n_steps: int) -> float:
+    """Approximate arc length of a summed cosine polar equation with unit scaling factor.
 
-def optimal_scaling_factor(length: float, c4: float, c8: float, n_steps: int) -> float:
+    The arc length of a summed cosine polar equation is linear in the scaling factor,
+    so the arc length for any scaling factor ``r0`` is ``r0 * unit_arc_length(c4, c8, n_steps)``.
+    Results are cached per ``(c4, c8, n_steps)``.
+
+    Parameters
+    ----------
+    c4 : float
+        4-lobe parameter.
+    c8 : float
+        8-lobe parameter.
+    n_steps : float
+        Number of angular discritization steps.
+
+    Returns
+    -------
+    length : float
+       Approximate arc length for ``r0=1``.
+
+    """
+    return float(arc_length(r0=1.0, c4=c4, c8=c8, n_steps=n_steps))
+
+
+def optimal_scaling_factor(length: float,
+                           c4: float,
+                           c8: float,
+                           n_steps: int,
+                           method: str = 'closed-form') -> float:
     """Finds the optimal summed-cosine scale factor that produces a target arc length.
 
     Parameters
@@ -56,13 +97,35 @@ def optimal_scaling_factor(length: float, c4: float, c8: float, n_steps: int) ->
         8-lobe parameter.
     n_steps : float
         Number of angular discritization steps.
+    method : str (default=`'closed-form'`)
+        Solver to use. ``'closed-form'`` divides the target length by the unit-scale
+        arc length (see ``gcs.geometry.unit_arc_length``) and falls back to
+        ``'nelder-mead'`` if the unit-scale arc length is not finite and positive.
+        ``'nelder-mead'`` minimizes the arc length error numerically.
 
     Returns
     -------
     r0 : float
-        Optimal scaling factor.
+        Optimal scaling factor. Arc lengths are never negative, so a negative
+        ``length`` is best matched by, and returns, a zero scaling factor with
+        either solver.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is not ``'closed-form'`` or ``'nelder-mead'``.
 
     """
+    if method not in ('closed-form', 'nelder-mead'):
+        raise ValueError(f'method ({method}) must be \'closed-form\' or \'nelder-mead\'.')
+
+    if method == 'closed-form':
+        length_per_r0 = unit_arc_length(c4=float(c4), c8=float(c8), n_steps=int(n_steps))
+
+        if np.isfinite(length_per_r0) and length_per_r0 > 0:
+            # Negative target lengths are best matched by a zero scaling factor
+            return max(length, 0.0) / length_per_r0
+
     def absolute_error(r0: np.ndarray) -> float:
         """Absolute difference between the target and computed arc lengths.
 
@@ -94,3 +157,51 @@ def optimal_scaling_factor(length: float, c4: float, c8: float, n_steps: int) ->
                       })
 
     return abs(result.x[0])
+
+
+def optimal_scaling_factors(lengths: np.ndarray,
+                            c4s: np.ndarray,
+                            c8s: np.ndarray,
+                            n_steps: int) -> np.ndarray:
+    """Finds the optimal summed-cosine scale factors for a batch of target arc lengths.
+
+    Vectorized counterpart of ``gcs.geometry.optimal_scaling_factor`` using the
+    closed-form solver. Entries whose unit-scale arc length is not finite and
+    positive fall back to ``gcs.geometry.optimal_scaling_factor``.
+
+    Parameters
+    ----------
+    lengths : (N,) numpy.ndarray
+        Target arc lengths.
+    c4s : (N,) numpy.ndarray
+        4-lobe parameters.
+    c8s : (N,) numpy.ndarray
+        8-lobe parameters.
+    n_steps : float
+        Number of angular discritization steps.
+
+    Returns
+    -------
+    r0s : (N,) numpy.ndarray
+        Optimal scaling factors. Negative ``lengths`` return a zero scaling factor.
+
+    """
+    lengths, c4s, c8s = np.broadcast_arrays(np.asarray(lengths, dtype=float),
+                                            np.asarray(c4s, dtype=float),
+                                            np.asarray(c8s, dtype=float))
+
+    lengths_per_r0 = arc_length(r0=1.0, c4=c4s, c8=c8s, n_steps=n_steps)
+
+    solvable = np.isfinite(lengths_per_r0) & (lengths_per_r0 > 0)
+
+    r0s = np.zeros(shape=lengths.shape, dtype=float)
+    np.divide(np.maximum(lengths, 0.0), lengths_per_r0, out=r0s, where=solvable)
+
+    for index in zip(*np.nonzero(~solvable)):
+        r0s[index] = optimal_scaling_factor(length=lengths[index],
+                                            c4=c4s[index],
+                                            c8=c8s[index],
+                                            n_steps=n_steps,
+                                            method='nelder-mead')
+
+    return r0s
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .meshing import _side_faces
+from .rings import Rings
+
+if TYPE_CHECKING:
+    from ..shape import GCS
+
+
+def generate_cross_section(shape: GCS, z: float) -> np.ndarray:
+    """Generates the cross-section of a GCS at a height.
+
+    Only the requested cross-section is evaluated, with the ring parameters interpolated
+    at ``z`` as in ``gcs.geometry.generate_vertices``.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    z : float
+        Height (mm) in [0, ``height``].
+
+    Returns
+    -------
+    vertices : (T, 3) numpy.ndarray
+        Vertices of the cross-section, at the angles of the shape's rings, with the shape's ``vertex_dtype``.
+
+    Raises
+    ------
+    ValueError
+        If ``z`` is not in the range [0, ``height``].
+
+    Examples
+    --------
+    >>> contour = gcs.geometry.generate_cross_section(shape=gcs.Willow(), z=10)
+
+    """
+    fraction = _height_fraction(shape=shape, z=z)
+
+    rings = Rings(shape=shape, fractions=np.array([fraction]), thetas=shape.rings.thetas_)
+
+    return rings.vertices(dtype=shape.vertex_dtype_)
+
+
+def generate_band(shape: GCS, z0: float, z1: float) -> tuple[np.ndarray, np.ndarray]:
+    """Generates the mesh of a GCS wall between two heights.
+
+    The band contains the cross-sections at ``z0`` and ``z1`` and the rings of the
+    shape in between, so it coincides with the corresponding part of the full mesh.
+    Only the rings of the band are evaluated.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    z0 : float
+        Bottom height (mm) in [0, ``height``].
+    z1 : float
+        Top height (mm) in [0, ``height``], greater than ``z0``.
+
+    Returns
+    -------
+    vertices : (N, 3) numpy.ndarray
+        Vertices, ordered ring by ring.
+    faces : (M, 3) numpy.ndarray
+        Side faces.
+
+    Raises
+    ------
+    ValueError
+        If ``z0`` or ``z1`` is not in the range [0, ``height``].
+        If ``z1`` is not greater than ``z0``.
+
+    Examples
+    --------
+    >>> vertices, faces = gcs.geometry.generate_band(shape=gcs.Willow(), z0=5, z1=10)
+
+    """
+    fraction0 = _height_fraction(shape=shape, z=z0)
+    fraction1 = _height_fraction(shape=shape, z=z1)
+
+    if fraction1 <= fraction0:
+        raise ValueError(f'z1 ({z1}) must be greater than z0 ({z0}).')
+
+    inner = _between(values=shape.rings.fractions_, start=fraction0, stop=fraction1)
+    fractions = np.concatenate(([fraction0], inner, [fraction1]))
+
+    rings = Rings(shape=shape, fractions=fractions, thetas=shape.rings.thetas_)
+
+    faces = _side_faces(n_height_steps=fractions.size,
+                        n_vertices_per_step=rings.thetas_.size,
+                        dtype=shape.face_dtype_)
+
+    return rings.vertices(dtype=shape.vertex_dtype_), faces
+
+
+def generate_sector(shape: GCS, theta0: float, theta1: float) -> tuple[np.ndarray, np.ndarray]:
+    """Generates the mesh of a GCS wall between two angles.
+
+    The sector contains the angles ``theta0`` and ``theta1`` and the angles of the
+    shape's rings in between, on every ring, so it coincides with the corresponding
+    part of the full mesh. Only the angles of the sector are evaluated.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    theta0 : float
+        Start angle (rad).
+    theta1 : float
+        End angle (rad), greater than ``theta0`` by at most 2π.
+
+    Returns
+    -------
+    vertices : (N, 3) numpy.ndarray
+        Vertices, ordered ring by ring.
+    faces : (M, 3) numpy.ndarray
+        Side faces. The sector is open, so no faces connect ``theta1`` back to ``theta0``.
+
+    Raises
+    ------
+    ValueError
+        If ``theta1 - theta0`` is not in the range (0, 2π].
+
+    Examples
+    --------
+    >>> vertices, faces = gcs.geometry.generate_sector(shape=gcs.Willow(), theta0=0, theta1=np.pi / 2)
+
+    """
+    if theta1 <= theta0 or theta1 - theta0 > 2 * np.pi:
+        raise ValueError(f'theta1 - theta0 ({theta1 - theta0}) must be in range (0, 2π].')
+
+    # Angles of the shape's rings, measured from ``theta0``
+    offsets = np.sort(np.mod(shape.rings.thetas_ - theta0, 2 * np.pi))
+    inner = _between(values=offsets, start=0, stop=theta1 - theta0) + theta0
+    thetas = np.concatenate(([theta0], inner, [theta1]))
+
+    rings = Rings(shape=shape, fractions=shape.rings.fractions_, thetas=thetas)
+
+    # Closed side faces without the faces wrapping around from the last angle to the first
+    faces = _side_faces(n_height_steps=rings.fractions_.size,
+                        n_vertices_per_step=thetas.size,
+                        dtype=shape.face_dtype_)
+    faces = faces.reshape(2, -1, thetas.size, 3)[:, :, 1:].reshape(-1, 3)
+
+    return rings.vertices(dtype=shape.vertex_dtype_), faces
+
+
+def _height_fraction(shape: GCS, z: float) -> float:
+    """Converts a height to a height fraction.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    z : float
+        Height (mm).
+
+    Returns
+    -------
+    fraction : float
+        Height fraction in [0,1].
+
+    Raises
+    ------
+    ValueError
+        If ``z`` is not in the range [0, ``height``].
+
+    """
+    if z < 0 or z > shape.height_:
+        raise ValueError(f'z ({z}) must be in range [0, {shape.height_}].')
+
+    return z / shape.height_
+
+
+def _between(values: np.ndarray, start: float, stop: float) -> np.ndarray:
+    """Selects the values strictly between two bounds.
+
+    Values within floating-point tolerance of a bound are excluded, so that regions
+    starting or ending on the shape's sampling grid do not duplicate grid samples.
+
+    Parameters
+    ----------
+    values : (N,) numpy.ndarray
+        Sorted values.
+    start : float
+        Lower bound.
+    stop : float
+        Upper bound.
+
+    Returns
+    -------
+    inner : (n,) numpy.ndarray
+        Values between ``start`` and ``stop``.
+
+    """
+    inside = (values > start) & (values < stop) & ~np.isclose(values, start) & ~np.isclose(values, stop)
+
+    return values[inside]
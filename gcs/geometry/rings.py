@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .polar_curves import optimal_scaling_factors
+from .summed_cosine import summed_cosine
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
+
+    from ..shape import GCS
+
+# Maximum number of radii computed at a time when generating vertices
+RADII_CHUNK_SIZE = 2**16
+
+
+class Rings:
+    """Cross-sections (rings) of a GCS sampled along the height.
+
+    Per-ring parameters are interpolated linearly between the base and top of the shape.
+    Scaling factors are solved lazily, at most once per ring, so that verification and
+    meshing share intermediate results. The full radius grid is only cached once
+    requested with ``radii``; vertices are computed from radii in chunks of rings.
+
+    """
+
+    def __init__(self,
+                 shape: GCS,
+                 fractions: np.ndarray | None = None,
+                 thetas: np.ndarray | None = None) -> None:
+        """Initialize ``Rings``.
+
+        Parameters
+        ----------
+        shape : gcs.GCS
+            GCS shape.
+        fractions : (H,) numpy.ndarray (default=`None`)
+            Height fractions in [0,1] of the sampled rings.
+            If `None`, ``n_height_steps`` evenly spaced fractions are used.
+        thetas : (T,) numpy.ndarray (default=`None`)
+            Angles sampled on each ring.
+            If `None`, angles are sampled from 0 to 2π with step ``theta_step``.
+
+        """
+        # Perimeters are always computed at the shape's angular resolution
+        shape_thetas = np.arange(start=0, stop=2 * np.pi, step=shape.theta_step_)
+
+        if fractions is None:
+            fractions = np.linspace(start=0, stop=1, num=shape.n_height_steps_)
+        if thetas is None:
+            thetas = shape_thetas
+
+        self.fractions_ = np.asarray(fractions, dtype=float)
+        self.thetas_ = np.asarray(thetas, dtype=float)
+        self.n_steps_ = shape_thetas.size
+
+        (self.c4s_,
+         self.c8s_,
+         self.perimeters_,
+         self.twists_,
+         self.heights_) = _ring_parameters(c4_base=shape.c4_base_,
+                                           c8_base=shape.c8_base_,
+                                           c4_top=shape.c4_top_,
+                                           c8_top=shape.c8_top_,
+                                           twist_linear=shape.twist_linear_,
+                                           twist_amplitude=shape.twist_amplitude_,
+                                           twist_cycles=shape.twist_cycles_,
+                                           base_perimeter=shape.base_perimeter,
+                                           top_perimeter=shape.top_perimeter,
+                                           height=shape.height_,
+                                           fractions=self.fractions_)
+
+        # Unsolved scaling factors are marked with NaN
+        self._scaling_factors = np.full(shape=self.fractions_.shape, fill_value=np.nan)
+
+    def scaling_factors(self, rings: slice | np.ndarray = slice(None)) -> np.ndarray:
+        """Scaling factors of the selected rings.
+
+        Only rings that have not been solved before are solved.
+
+        Parameters
+        ----------
+        rings : {slice, numpy.ndarray} (default=`slice(None)`)
+            Selected rings.
+
+        Returns
+        -------
+        r0s : (h,) numpy.ndarray
+            Scaling factors.
+
+        """
+        indices = np.arange(self.fractions_.size)[rings]
+        missing = indices[np.isnan(self._scaling_factors[indices])]
+
+        if missing.size > 0:
+            self._scaling_factors[missing] = optimal_scaling_factors(lengths=self.perimeters_[missing],
+                                                                     c4s=self.c4s_[missing],
+                                                                     c8s=self.c8s_[missing],
+                                                                     n_steps=self.n_steps_)
+
+        return self._scaling_factors[indices]
+
+    def subset(self, rings: slice | np.ndarray = slice(None), angles: slice | np.ndarray = slice(None)) -> Rings:
+        """Selects some of the rings and angles.
+
+        Scaling factors solved so far (and the radius grid, if cached) are carried over,
+        so they are not computed again for the subset.
+
+        Parameters
+        ----------
+        rings : {slice, numpy.ndarray} (default=`slice(None)`)
+            Selected rings.
+        angles : {slice, numpy.ndarray} (default=`slice(None)`)
+            Selected angles, indexing ``thetas_``.
+
+        Returns
+        -------
+        subset : gcs.geometry.Rings
+            Selected rings, sampled at the selected angles.
+
+        """
+        subset = object.__new__(Rings)
+
+        subset.fractions_ = self.fractions_[rings]
+        subset.thetas_ = self.thetas_[angles]
+        subset.n_steps_ = self.n_steps_
+
+        subset.c4s_ = self.c4s_[rings]
+        subset.c8s_ = self.c8s_[rings]
+        subset.perimeters_ = self.perimeters_[rings]
+        subset.twists_ = self.twists_[rings]
+        subset.heights_ = self.heights_[rings]
+
+        subset._scaling_factors = self._scaling_factors[rings].copy()
+
+        if '_radii' in self.__dict__:
+            radii = self._radii[rings][:, angles]
+            radii.flags.writeable = False
+            subset.__dict__['_radii'] = radii
+
+        return subset
+
+    def radii(self,
+              rings: slice | np.ndarray = slice(None),
+              angles: slice | np.ndarray = slice(None)) -> np.ndarray:
+        """Radii of the selected rings at the selected angles.
+
+        Parameters
+        ----------
+        rings : {slice, numpy.ndarray} (default=`slice(None)`)
+            Selected rings. Selecting all rings and angles returns the cached radius grid.
+        angles : {slice, numpy.ndarray} (default=`slice(None)`)
+            Selected angles, indexing ``thetas_``.
+
+        Returns
+        -------
+        radii : (h, t) numpy.ndarray
+            Radii.
+
+        """
+        if _selects_all(rings) and _selects_all(angles):
+            return self._radii
+
+        # Subsample the radius grid if it is already cached
+        if '_radii' in self.__dict__:
+            return self._radii[rings][:, angles]
+
+        return self._compute_radii(rings=rings, angles=angles)
+
+    def vertices(self,
+                 rings: slice | np.ndarray = slice(None),
+                 angles: slice | np.ndarray = slice(None),
+                 dtype: DTypeLike = float,
+                 out: np.ndarray | None = None) -> np.ndarray:
+        """Vertices of the selected rings at the selected angles.
+
+        Radii are computed for at most ``RADII_CHUNK_SIZE`` vertices at a time (unless
+        the radius grid is cached) and converted straight into the output array.
+
+        Parameters
+        ----------
+        rings : {slice, numpy.ndarray} (default=`slice(None)`)
+            Selected rings.
+        angles : {slice, numpy.ndarray} (default=`slice(None)`)
+            Selected angles, indexing ``thetas_``.
+        dtype : DTypeLike (default=`float`)
+            Vertex coordinate data type. Coordinates are written directly in this type.
+        out : (h * t, 3) numpy.ndarray (default=`None`)
+            C-contiguous array the vertices are written to, whose data type overrides ``dtype``.
+
+        Returns
+        -------
+        vertices : (h * t, 3) numpy.ndarray
+            Vertices, ordered ring by ring. A view of ``out`` if given.
+
+        Raises
+        ------
+        ValueError
+            If ``out`` is not C-contiguous.
+
+        """
+        ring_indices = np.arange(self.fractions_.size)[rings]
+        thetas = self.thetas_[angles]
+
+        if out is None:
+            out = np.empty(shape=(ring_indices.size * thetas.size, 3), dtype=dtype)
+        elif not out.flags.c_contiguous:
+            raise ValueError('out must be C-contiguous.')
+
+        # Chunks of rings are contiguous in the C-contiguous output
+        vertices = out.reshape(ring_indices.size, thetas.size, 3)
+        chunk = max(RADII_CHUNK_SIZE // max(thetas.size, 1), 1)
+
+        for start in range(0, ring_indices.size, chunk):
+            chunk_rings = ring_indices[start:start + chunk]
+
+            if '_radii' in self.__dict__:
+                radii = self._radii[chunk_rings][:, angles]
+            else:
+                radii = self._compute_radii(rings=chunk_rings, angles=angles)
+
+            _ring_vertices(radii=radii,
+                           thetas=thetas,
+                           heights=self.heights_[chunk_rings],
+                           out=vertices[start:start + chunk])
+
+        return out.reshape(-1, 3)
+
+    @cached_property
+    def _radii(self) -> np.ndarray:
+        """Cached radius grid of all rings.
+
+        """
+        radii = self._compute_radii(rings=slice(None), angles=slice(None))
+        radii.flags.writeable = False
+
+        return radii
+
+    def _compute_radii(self, rings: slice | np.ndarray, angles: slice | np.ndarray) -> np.ndarray:
+        """Computes the radii of the selected rings at the selected angles.
+
+        Parameters
+        ----------
+        rings : {slice, numpy.ndarray}
+            Selected rings.
+        angles : {slice, numpy.ndarray}
+            Selected angles, indexing ``thetas_``.
+
+        Returns
+        -------
+        radii : (h, t) numpy.ndarray
+            Radii.
+
+        """
+        return _ring_radii(thetas=self.thetas_[angles],
+                           twists=self.twists_[rings],
+                           r0s=self.scaling_factors(rings=rings),
+                           c4s=self.c4s_[rings],
+                           c8s=self.c8s_[rings])
+
+
+def _selects_all(index: slice | np.ndarray) -> bool:
+    """Checks whether an index is the full slice.
+
+    Parameters
+    ----------
+    index : {slice, numpy.ndarray}
+        Index.
+
+    Returns
+    -------
+    selects_all : bool
+        `True` if ``index`` is ``slice(None)``.
+
+    """
+    return isinstance(index, slice) and index == slice(None)
+
+
+def _ring_parameters(c4_base: float | np.ndarray,
+                     c8_base: float | np.ndarray,
+                     c4_top: float | np.ndarray,
+                     c8_top: float | np.ndarray,
+                     twist_linear: float | np.ndarray,
+                     twist_amplitude: float | np.ndarray,
+                     twist_cycles: float | np.ndarray,
+                     base_perimeter: float | np.ndarray,
+                     top_perimeter: float | np.ndarray,
+                     height: float | np.ndarray,
+                     fractions: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Interpolates ring parameters at height fractions.
+
+    Shape parameters are scalars or (M,) arrays (one value per shape) and are broadcast
+    against the trailing ``fractions`` axis.
+
+    Parameters
+    ----------
+    c4_base, c8_base, c4_top, c8_top : {float, (M,) numpy.ndarray}
+        Base and top lobe parameters.
+    twist_linear, twist_amplitude, twist_cycles : {float, (M,) numpy.ndarray}
+        Twist parameters.
+    base_perimeter, top_perimeter : {float, (M,) numpy.ndarray}
+        Base and top perimeters (mm).
+    height : {float, (M,) numpy.ndarray}
+        Heights (mm).
+    fractions : (H,) numpy.ndarray
+        Height fractions in [0,1].
+
+    Returns
+    -------
+    c4s, c8s, perimeters, twists, heights : ([M,] H) numpy.ndarray
+        Ring lobe parameters, perimeters, twist angles, and heights.
+
+    """
+    def interpolate(base: float | np.ndarray, top: float | np.ndarray) -> np.ndarray:
+        base = np.asarray(base, dtype=float)[..., np.newaxis]
+        top = np.asarray(top, dtype=float)[..., np.newaxis]
+
+        return base + (top - base) * fractions
+
+    c4s = interpolate(base=c4_base, top=c4_top)
+    c8s = interpolate(base=c8_base, top=c8_top)
+    perimeters = interpolate(base=base_perimeter, top=top_perimeter)
+
+    twists_linear = interpolate(base=0.0, top=twist_linear)
+    frequencies = interpolate(base=0.0, top=2 * np.pi * np.asarray(twist_cycles))
+    twists = twists_linear + np.asarray(twist_amplitude)[..., np.newaxis] * np.sin(frequencies)
+
+    heights = interpolate(base=0.0, top=height)
+
+    return c4s, c8s, perimeters, twists, heights
+
+
+def _ring_radii(thetas: np.ndarray,
+                twists: np.ndarray,
+                r0s: np.ndarray,
+                c4s: np.ndarray,
+                c8s: np.ndarray) -> np.ndarray:
+    """Evaluates ring radii on a grid of angles.
+
+    Parameters
+    ----------
+    thetas : (T,) numpy.ndarray
+        Angles.
+    twists, r0s, c4s, c8s : (..., H) numpy.ndarray
+        Ring twist angles, scaling factors, and lobe parameters.
+
+    Returns
+    -------
+    radii : (..., H, T) numpy.ndarray
+        Radii.
+
+    """
+    # Grid of twisted angles, overwritten in place by the radii
+    radii = thetas + twists[..., np.newaxis]
+
+    return summed_cosine(theta=radii,
+                         r0=r0s[..., np.newaxis],
+                         c4=c4s[..., np.newaxis],
+                         c8=c8s[..., np.newaxis],
+                         out=radii)
+
+
+def _ring_vertices(radii: np.ndarray,
+                   thetas: np.ndarray,
+                   heights: np.ndarray,
+                   dtype: DTypeLike = float,
+                   out: np.ndarray | None = None) -> np.ndarray:
+    """Converts ring radii to cartesian vertices.
+
+    Parameters
+    ----------
+    radii : (..., H, T) numpy.ndarray
+        Radii.
+    thetas : (T,) numpy.ndarray
+        Angles.
+    heights : (..., H) numpy.ndarray
+        Ring heights.
+    dtype : DTypeLike (default=`float`)
+        Vertex coordinate data type.
+    out : numpy.ndarray (default=`None`)
+        C-contiguous array with ``radii.size * 3`` elements the vertices are written to.
+
+    Returns
+    -------
+    vertices : (..., H, T, 3) numpy.ndarray
+        Vertices. A view of ``out`` if given.
+
+    """
+    if out is None:
+        vertices = np.empty(shape=radii.shape + (3,), dtype=dtype)
+    else:
+        # Reshaping a C-contiguous array always returns a view
+        vertices = out.reshape(radii.shape + (3,))
+
+    np.multiply(radii, np.cos(thetas), out=vertices[..., 0])
+    np.multiply(radii, np.sin(thetas), out=vertices[..., 1])
+    vertices[..., 2] = heights[..., np.newaxis]
+
+    return vertices
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .rings import Rings
+from .summed_cosine import summed_cosine_derivative
+
+if TYPE_CHECKING:
+    from ..shape import GCS
+
+# Finest resolution used to evaluate sample densities in ``uniform_resolution``
+REFERENCE_N_HEIGHT_STEPS = 1000
+REFERENCE_THETA_STEP = 0.01
+
+
+def adaptive_sampling(shape: GCS, tolerance: float) -> tuple[np.ndarray, np.ndarray]:
+    """Selects curvature-adaptive height fractions and angles of a GCS.
+
+    Samples are selected from the uniform grid of ``n_height_steps`` rings and
+    ``theta_step`` angles, so the adaptive mesh is never finer than the uniform one.
+    A segment of length ``s`` on a curve of curvature ``κ`` deviates from its chord
+    by at most ``κ s^2 / 8``, which gives a local sample density bounding the deviation
+    by ``tolerance``:
+
+    - Along each cross-section, the curvature of the summed cosine is evaluated analytically.
+    - Along the height, the radii are compared with a linear interpolation between rings,
+      using second differences of the radii over the uniform rings.
+
+    Samples are then placed so that the largest density between consecutive samples,
+    times their spacing, is at most one. Angles are shared by all rings, so the densest
+    ring sets the angles. Curvatures are evaluated on the uniform grid, so the bound
+    holds up to the variation of the curvature between grid points.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    tolerance : float
+        Maximum chord deviation (mm).
+
+    Returns
+    -------
+    fractions : (H,) numpy.ndarray
+        Height fractions of the selected rings, including the base and top.
+    thetas : (T,) numpy.ndarray
+        Selected angles, including 0.
+
+    Raises
+    ------
+    ValueError
+        If ``tolerance`` is not positive.
+
+    Examples
+    --------
+    >>> fractions, thetas = gcs.geometry.adaptive_sampling(shape=gcs.Willow(), tolerance=0.01)
+    >>> rings = gcs.geometry.Rings(shape=gcs.Willow(), fractions=fractions, thetas=thetas)
+
+    """
+    rings = _adaptive_rings(shape=shape, tolerance=tolerance)
+
+    return rings.fractions_, rings.thetas_
+
+
+def _adaptive_rings(shape: GCS, tolerance: float) -> Rings:
+    """Selects the curvature-adaptive rings of a GCS (see ``gcs.geometry.adaptive_sampling``).
+
+    The adaptive rings are a subset of the uniform rings, so the scaling factors
+    solved to evaluate the sample densities are reused instead of solved again.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    tolerance : float
+        Maximum chord deviation (mm).
+
+    Returns
+    -------
+    rings : gcs.geometry.Rings
+        Selected rings, sampled at the selected angles.
+
+    Raises
+    ------
+    ValueError
+        If ``tolerance`` is not positive.
+
+    """
+    if tolerance <= 0:
+        raise ValueError(f'tolerance ({tolerance}) must be positive.')
+
+    rings = Rings(shape=shape)
+
+    fractions = rings.fractions_
+    thetas = rings.thetas_
+
+    height_density, theta_density = _sample_densities(rings=rings, tolerance=tolerance)
+
+    # Angles wrap around, so the last interval ends at 2π
+    theta_intervals = np.diff(np.append(thetas, 2 * np.pi))
+    theta_interval_density = np.maximum(theta_density, np.roll(theta_density, -1))
+    height_intervals = np.diff(fractions)
+    height_interval_density = np.maximum(height_density[:-1], height_density[1:])
+
+    # At least 3 angles are kept so that cross-sections remain polygons
+    theta_indices = _select_samples(intervals=theta_intervals,
+                                    densities=theta_interval_density,
+                                    max_step=-(-thetas.size // 3))[:-1]
+    height_indices = _select_samples(intervals=height_intervals,
+                                     densities=height_interval_density,
+                                     max_step=fractions.size)
+
+    return rings.subset(rings=height_indices, angles=theta_indices)
+
+
+def uniform_resolution(shape: GCS, tolerance: float) -> tuple[int, float]:
+    """Finds the coarsest uniform resolution of a GCS within a chord deviation tolerance.
+
+    Sample densities are evaluated as in ``gcs.geometry.adaptive_sampling``, on a
+    reference grid at least as fine as ``REFERENCE_N_HEIGHT_STEPS`` rings and
+    ``REFERENCE_THETA_STEP`` angular steps, and the uniform steps are set by the
+    largest densities.
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    tolerance : float
+        Maximum chord deviation (mm).
+
+    Returns
+    -------
+    n_height_steps : int
+        Number of sampled cross-sections along the height.
+    theta_step : float
+        Angular step size used to sample each cross-section in radians.
+
+    Raises
+    ------
+    ValueError
+        If ``tolerance`` is not positive.
+
+    Examples
+    --------
+    >>> n_height_steps, theta_step = gcs.geometry.uniform_resolution(shape=gcs.Willow(), tolerance=0.05)
+
+    """
+    if tolerance <= 0:
+        raise ValueError(f'tolerance ({tolerance}) must be positive.')
+
+    reference = shape.replace(n_height_steps=max(shape.n_height_steps_, REFERENCE_N_HEIGHT_STEPS),
+                              theta_step=min(shape.theta_step_, REFERENCE_THETA_STEP))
+
+    height_density, theta_density = _sample_densities(rings=Rings(shape=reference), tolerance=tolerance)
+
+    # One interval per sample of the largest density
+    n_height_steps = max(int(np.ceil(np.max(height_density))) + 1, 2)
+    theta_step = float(min(1 / np.max(theta_density), 2 * np.pi / 3))
+
+    return n_height_steps, theta_step
+
+
+def _select_samples(intervals: np.ndarray, densities: np.ndarray, max_step: int) -> np.ndarray:
+    """Greedily selects grid points so that each selected span holds at most one sample of its largest density.
+
+    Using the largest density over a span, rather than its average, bounds the chord
+    deviation by the largest curvature between the selected points.
+
+    Parameters
+    ----------
+    intervals : (N,) numpy.ndarray
+        Lengths of the grid intervals.
+    densities : (N,) numpy.ndarray
+        Sample density over each interval of the grid.
+    max_step : int
+        Maximum number of grid intervals between selected points.
+
+    Returns
+    -------
+    indices : (M,) numpy.ndarray
+        Selected grid point indices, including the first (0) and last (N) points.
+
+    """
+    cumulative = np.concatenate(([0.0], np.cumsum(intervals)))
+
+    indices = [0]
+    while indices[-1] < intervals.size:
+        start = indices[-1]
+        stops = np.arange(start + 1, min(start + max_step, intervals.size) + 1)
+
+        # Furthest point whose span, at the largest density since ``start``, holds at most one sample
+        samples = np.maximum.accumulate(densities[start:stops[-1]]) * (cumulative[stops] - cumulative[start])
+        n_within = np.searchsorted(samples, 1, side='right')
+
+        indices.append(stops[max(n_within - 1, 0)])
+
+    return np.array(indices)
+
+
+def _sample_densities(rings: Rings, tolerance: float) -> tuple[np.ndarray, np.ndarray]:
+    """Sample densities bounding the chord deviation of uniformly sampled rings.
+
+    Parameters
+    ----------
+    rings : gcs.geometry.Rings
+        Uniformly sampled rings.
+    tolerance : float
+        Maximum chord deviation (mm).
+
+    Returns
+    -------
+    height_density : (H,) numpy.ndarray
+        Samples per unit height fraction at each ring.
+    theta_density : (T,) numpy.ndarray
+        Samples per radian at each angle, maximized over the rings.
+
+    """
+    fractions = rings.fractions_
+    thetas = rings.thetas_
+
+    # The radius grid is only needed here, so it is not cached in ``rings``
+    radii = rings._compute_radii(rings=slice(None), angles=slice(None))
+
+    # Curvature of each cross-section, in terms of the angles of the untwisted curve
+    parameters = {
+        'theta': thetas + rings.twists_[:, np.newaxis],
+        'r0': rings.scaling_factors()[:, np.newaxis],
+        'c4': rings.c4s_[:, np.newaxis],
+        'c8': rings.c8s_[:, np.newaxis],
+    }
+    dr = summed_cosine_derivative(**parameters, order=1)
+    ddr = summed_cosine_derivative(**parameters, order=2)
+
+    # Samples per radian: sqrt(κ / (8 tolerance)) times the arc length per radian
+    speed = np.hypot(radii, dr)
+    theta_density = np.sqrt(np.abs(radii**2 + 2 * dr**2 - radii * ddr) / (8 * tolerance * speed))
+    theta_density = np.max(theta_density, axis=0)
+
+    # Samples per unit height fraction, from the radial deviation of the uniform rings
+    if fractions.size > 2:
+        fraction_step = fractions[1] - fractions[0]
+        ddr_height = np.max(np.abs(np.diff(radii, n=2, axis=0)), axis=1) / fraction_step**2
+        height_density = np.sqrt(np.pad(ddr_height, pad_width=1, mode='edge') / (8 * tolerance))
+    else:
+        height_density = np.zeros_like(fractions)
+
+    return height_density, theta_density
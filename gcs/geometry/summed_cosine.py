@@ -3,19 +3,28 @@ from __future__ import annotations
 import numpy as np
 
 
-def summed_cosine(theta: float | np.ndarray, r0: float, c4: float, c8: float) -> float | np.ndarray:
+def summed_cosine(theta: float | np.ndarray,
+                  r0: float | np.ndarray,
+                  c4: float | np.ndarray,
+                  c8: float | np.ndarray,
+                  out: np.ndarray | None = None) -> float | np.ndarray:
     """Summed cosine polar equation.
 
+    Parameters ``theta``, ``r0``, ``c4``, and ``c8`` are broadcast against each other.
+
     Parameters
     ----------
     theta : {float, (N,) numpy.ndarray}
         Angle(s).
-    r0 : float
-        Scaling factor.
-    c4 : float
-        4-lobe parameter.
-    c8 : float
-        8-lobe parameter.
+    r0 : {float, numpy.ndarray}
+        Scaling factor(s).
+    c4 : {float, numpy.ndarray}
+        4-lobe parameter(s).
+    c8 : {float, numpy.ndarray}
+        8-lobe parameter(s).
+    out : numpy.ndarray (default=`None`)
+        Array to store the radius values in. ``out`` may be ``theta`` itself.
+        If `None`, a new array is allocated.
 
     Returns
     -------
@@ -29,4 +38,102 @@ def summed_cosine(theta: float | np.ndarray, r0: float, c4: float, c8: float) ->
         https://doi.org/10.1016/j.jmps.2013.11.014.
 
     """
-    return r0 * (1 + c4 * np.cos(4 * theta) + c8 * np.cos(8 * theta))
+    if out is None:
+        return r0 * (1 + c4 * np.cos(4 * theta) + c8 * np.cos(8 * theta))
+
+    # Evaluate in place with a single temporary (8-lobe term computed before ``out`` is written)
+    lobes_8 = np.cos(8 * theta)
+    lobes_8 *= c8
+
+    np.multiply(theta, 4, out=out)
+    np.cos(out, out=out)
+    out *= c4
+    out += 1
+    out += lobes_8
+    out *= r0
+
+    return out
+
+
+def min_summed_cosine(r0: float | np.ndarray,
+                      c4: float | np.ndarray,
+                      c8: float | np.ndarray) -> float | np.ndarray:
+    """Exact minimum over all angles of the summed cosine polar equation.
+
+    With ``x = cos(4θ)`` the equation becomes the quadratic ``r0 * (1 - c8 + c4 x + 2 c8 x^2)``
+    on ``x ∈ [-1, 1]``, so the minimum is attained at ``x = ±1`` or at the vertex
+    ``x = -c4 / (4 c8)`` when ``c8 > 0``.
+
+    Parameters
+    ----------
+    r0 : {float, numpy.ndarray}
+        Non-negative scaling factor(s).
+    c4 : {float, numpy.ndarray}
+        4-lobe parameter(s).
+    c8 : {float, numpy.ndarray}
+        8-lobe parameter(s).
+
+    Returns
+    -------
+    r : {float, numpy.ndarray}
+        Minimum radius value(s).
+
+    """
+    r0, c4, c8 = np.broadcast_arrays(np.asarray(r0, dtype=float),
+                                     np.asarray(c4, dtype=float),
+                                     np.asarray(c8, dtype=float))
+
+    # Endpoints x = 1 and x = -1
+    min_r = np.minimum(1 + c4 + c8, 1 - c4 + c8)
+
+    # Interior vertex of the upward-opening parabola
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_vertex = -c4 / (4 * c8)
+        r_vertex = 1 - c8 - c4**2 / (8 * c8)
+
+    interior = (c8 > 0) & (np.abs(x_vertex) <= 1)
+    min_r = np.where(interior, np.minimum(min_r, r_vertex), min_r)
+
+    return (r0 * min_r)[()]
+
+
+def summed_cosine_derivative(theta: float | np.ndarray,
+                             r0: float | np.ndarray,
+                             c4: float | np.ndarray,
+                             c8: float | np.ndarray,
+                             order: int = 1) -> float | np.ndarray:
+    """Derivative with respect to the angle of the summed cosine polar equation.
+
+    Uses ``d^n/dθ^n cos(kθ) = k^n cos(kθ + nπ/2)``. Parameters ``theta``, ``r0``,
+    ``c4``, and ``c8`` are broadcast against each other.
+
+    Parameters
+    ----------
+    theta : {float, (N,) numpy.ndarray}
+        Angle(s).
+    r0 : {float, numpy.ndarray}
+        Scaling factor(s).
+    c4 : {float, numpy.ndarray}
+        4-lobe parameter(s).
+    c8 : {float, numpy.ndarray}
+        8-lobe parameter(s).
+    order : int (default=`1`)
+        Order of the derivative.
+
+    Returns
+    -------
+    dr : {float, (N,) numpy.ndarray}
+        Derivative value(s).
+
+    Raises
+    ------
+    ValueError
+        If ``order`` is less than 1.
+
+    """
+    if order < 1:
+        raise ValueError(f'order ({order}) must be at least 1.')
+
+    phase = order * np.pi / 2
+
+    return r0 * (c4 * 4**order * np.cos(4 * theta + phase) + c8 * 8**order * np.cos(8 * theta + phase))
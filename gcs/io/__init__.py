@@ -11,18 +11,79 @@ Saving GCS
 
    save_mesh
 
+   save_mesh_streaming
+
+   save_ply
+
+   save_obj
+
+   save_glb
+
+   save_meshes
+
+Toolpaths
+---------
+
+   save_gcode
+
 Loading GCS
 -----------
 
    load_parameters
 
+   iter_parameters
+
+   load_ply
+
+Columnar storage
+----------------
+
+   save_parameters_columnar
+
+   load_parameters_columnar
+
+   save_columns
+
+   load_columns
+
+Caching GCS meshes
+------------------
+
+   MeshCache
+
 """
+from .cache import MeshCache
+from .columnar import load_columns
+from .columnar import load_parameters_columnar
+from .columnar import save_columns
+from .columnar import save_parameters_columnar
+from .gcode import save_gcode
+from .load import iter_parameters
 from .load import load_parameters
+from .load import load_ply
 from .save import save_parameters
 from .save import save_mesh
+from .save import save_mesh_streaming
+from .save import save_glb
+from .save import save_meshes
+from .save import save_obj
+from .save import save_ply
 
 __all__ = [
+    'MeshCache',
+    'load_columns',
+    'load_parameters_columnar',
+    'save_columns',
+    'save_parameters_columnar',
+    'save_gcode',
+    'iter_parameters',
     'load_parameters',
+    'load_ply',
     'save_parameters',
     'save_mesh',
+    'save_mesh_streaming',
+    'save_glb',
+    'save_meshes',
+    'save_obj',
+    'save_ply',
 ]
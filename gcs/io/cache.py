@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from contextlib import suppress
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..batch import PARAMETER_DTYPES
+from ..geometry.meshing import generate_faces, generate_vertices
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from ..shape import GCS
+
+try:
+    VERSION = version('gcs-shape')
+except PackageNotFoundError:
+    VERSION = 'unknown'
+
+# Default cache size limit (bytes)
+DEFAULT_MAX_BYTES = 2**30
+
+# Age (s) after which a temporary file is considered left by an interrupted write
+STALE_TEMPORARY_AGE = 3600
+
+# Data types of the cached vertices and faces, whatever the data types of the shapes
+VERTEX_DTYPE = 'float64'
+FACE_DTYPE = 'int64'
+
+
+class MeshCache:
+    """Persistent, content-addressed cache of GCS meshes.
+
+    Vertices and faces are stored as uncompressed ``.npy`` files keyed by a hash of
+    the GCS parameters and the library version, and are memory-mapped on reload.
+    Meshes are stored with ``VERTEX_DTYPE`` vertices and ``FACE_DTYPE`` faces, and
+    converted to the data types of each shape on load, so precision does not depend
+    on which shape filled an entry.
+
+    The least recently used meshes are evicted when the cache exceeds its size limit.
+    The cache size is tracked across writes, so the directory is only scanned when
+    the limit may be exceeded. Writes are atomic, so several processes can share one
+    cache directory; each process only tracks its own writes between scans.
+
+    """
+
+    def __init__(self,
+                 directory: str | PathLike[str],
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 mmap: bool = True) -> None:
+        """Initialize ``MeshCache``.
+
+        Parameters
+        ----------
+        directory : {str, PathLike[str]}
+            Cache directory. Created if it does not exist.
+        max_bytes : int (default=`2**30`)
+            Maximum total size (bytes) of the cached files.
+        mmap : bool (default=`True`)
+            Set to `True` to memory-map cached arrays (read-only) instead of reading them into memory.
+
+        Raises
+        ------
+        ValueError
+            If ``max_bytes`` is negative.
+
+        Examples
+        --------
+        >>> cache = gcs.io.MeshCache(directory='mesh_cache')
+        >>> vertices, faces = cache.mesh(shape=gcs.Iroko())
+
+        """
+        if max_bytes < 0:
+            raise ValueError(f'max_bytes ({max_bytes}) must be non-negative.')
+
+        self.directory_ = Path(directory)
+        self.max_bytes_ = max_bytes
+        self.mmap_ = mmap
+
+        self.directory_.mkdir(parents=True, exist_ok=True)
+
+        # Size of the cached files, as of the last scan plus the writes since
+        self._size = self.size
+
+    @property
+    def size(self) -> int:
+        """Total size (bytes) of the cached files.
+
+        """
+        return sum(file.stat().st_size for file in self.directory_.glob('*.npy'))
+
+    def key(self, shape: GCS) -> str:
+        """Stable cache key of a GCS.
+
+        Parameters
+        ----------
+        shape : gcs.GCS
+            GCS shape.
+
+        Returns
+        -------
+        key : str
+            Hex digest of the GCS parameters and library version.
+
+        """
+        # Normalize value types so that equal shapes share a key (e.g., 0 and 0.0)
+        parameters = {
+            name: dtype(value) for (name, dtype), value in zip(PARAMETER_DTYPES.items(), shape.parameters.values())
+        }
+
+        content = json.dumps(obj={'version': VERSION, 'parameters': parameters}, sort_keys=True)
+
+        return sha256(content.encode()).hexdigest()
+
+    def load(self, shape: GCS) -> tuple[np.ndarray, np.ndarray] | None:
+        """Loads a cached GCS mesh.
+
+        Parameters
+        ----------
+        shape : gcs.GCS
+            GCS shape.
+
+        Returns
+        -------
+        mesh : {tuple[numpy.ndarray, numpy.ndarray], None}
+            Vertices and faces, or `None` if the mesh is not cached.
+
+        """
+        files = self._files(key=self.key(shape=shape))
+
+        try:
+            arrays = tuple(np.load(file, mmap_mode='r' if self.mmap_ else None) for file in files)
+        except FileNotFoundError:
+            return None
+
+        # Mark as recently used, unless evicted concurrently by another process
+        for file in files:
+            with suppress(FileNotFoundError):
+                os.utime(file)
+
+        return arrays
+
+    def save(self, shape: GCS, vertices: np.ndarray, faces: np.ndarray) -> None:
+        """Saves a GCS mesh to the cache.
+
+        Vertices and faces are stored as ``VERTEX_DTYPE`` and ``FACE_DTYPE`` arrays, so
+        vertices should be generated in ``VERTEX_DTYPE`` to be cached at full precision.
+        Least recently used meshes are evicted if the cache may exceed its size limit.
+
+        Parameters
+        ----------
+        shape : gcs.GCS
+            GCS shape.
+        vertices : (N, 3) numpy.ndarray
+            Vertices of ``shape``.
+        faces : (M, 3) numpy.ndarray
+            Faces of ``shape``.
+
+        """
+        files = self._files(key=self.key(shape=shape))
+
+        for file, array, dtype in zip(files, (vertices, faces), (VERTEX_DTYPE, FACE_DTYPE)):
+            # Write to a temporary file and atomically move it into place
+            descriptor, temporary_file = tempfile.mkstemp(dir=self.directory_, suffix='.tmp')
+
+            try:
+                with os.fdopen(descriptor, 'wb') as f:
+                    np.save(f, np.ascontiguousarray(array, dtype=dtype))
+                    size = f.tell()
+
+                # Overwritten files no longer count towards the cache size
+                with suppress(FileNotFoundError):
+                    size -= file.stat().st_size
+
+                os.replace(temporary_file, file)
+            except BaseException:
+                os.remove(temporary_file)
+                raise
+
+            self._size += size
+
+        if self._size > self.max_bytes_:
+            self.evict()
+
+    def mesh(self, shape: GCS) -> tuple[np.ndarray, np.ndarray]:
+        """Loads a GCS mesh from the cache, generating and caching it on a miss.
+
+        The mesh is also attached to ``shape``, so ``shape.vertices`` and
+        ``shape.faces`` return the cached arrays, converted to the shape's
+        ``vertex_dtype`` and ``face_dtype``. On a miss, the mesh is generated and
+        cached with ``VERTEX_DTYPE`` vertices and ``FACE_DTYPE`` faces.
+
+        Parameters
+        ----------
+        shape : gcs.GCS
+            GCS shape.
+
+        Returns
+        -------
+        vertices : (N, 3) numpy.ndarray
+            Vertices.
+        faces : (M, 3) numpy.ndarray
+            Faces.
+
+        """
+        mesh = self.load(shape=shape)
+
+        if mesh is None:
+            # Meshes of shapes with other data types are generated again for the cache
+            if shape.vertex_dtype_ == VERTEX_DTYPE:
+                vertices = shape.vertices
+            else:
+                vertices = generate_vertices(shape=shape, dtype=VERTEX_DTYPE)
+
+            if shape.face_dtype_ == FACE_DTYPE:
+                faces = shape.faces
+            else:
+                faces = generate_faces(shape=shape, dtype=FACE_DTYPE)
+
+            self.save(shape=shape, vertices=vertices, faces=faces)
+
+            mesh = vertices, faces
+
+        shape.attach_mesh(vertices=mesh[0], faces=mesh[1])
+
+        return shape.vertices, shape.faces
+
+    def evict(self) -> None:
+        """Removes the least recently used meshes until the cache fits its size limit.
+
+        Temporary files left by interrupted writes are removed once they are older than
+        ``STALE_TEMPORARY_AGE`` seconds, so that writes in progress in other processes
+        are not affected.
+
+        """
+        stale_time = time.time() - STALE_TEMPORARY_AGE
+        for file in self.directory_.glob('*.tmp'):
+            with suppress(OSError):
+                if file.stat().st_mtime < stale_time:
+                    file.unlink()
+
+        entries = {}
+        for file in self.directory_.glob('*.npy'):
+            # Files may be removed concurrently by another process
+            with suppress(FileNotFoundError):
+                stat = file.stat()
+
+                key = file.name.split('-')[0]
+                last_used, size, files = entries.get(key, (0.0, 0, []))
+                entries[key] = (max(last_used, stat.st_mtime), size + stat.st_size, files + [file])
+
+        total_size = sum(size for _, size, _ in entries.values())
+
+        for _, size, files in sorted(entries.values(), key=lambda entry: entry[0]):
+            if total_size <= self.max_bytes_:
+                break
+
+            for file in files:
+                # Files may be removed concurrently or still be open (e.g., memory-mapped on Windows)
+                with suppress(OSError):
+                    file.unlink()
+
+            total_size -= size
+
+        self._size = total_size
+
+    def clear(self) -> None:
+        """Removes all cached meshes.
+
+        """
+        for file in self.directory_.glob('*.npy'):
+            file.unlink(missing_ok=True)
+
+        self._size = 0
+
+    def _files(self, key: str) -> tuple[Path, Path]:
+        """Cache files of a key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        files : tuple[pathlib.Path, pathlib.Path]
+            Vertices and faces files.
+
+        """
+        return self.directory_ / f'{key}-vertices.npy', self.directory_ / f'{key}-faces.npy'
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..batch import PARAMETER_DTYPES, GCSBatch
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from numpy.typing import ArrayLike
+
+    from ..shape import GCS
+
+# Columnar store metadata file name
+METADATA_FILE = 'metadata.json'
+
+# Columnar store column file suffix
+COLUMN_SUFFIX = '.bin'
+
+# Width of string parameter columns, so that appended parameter values are never truncated
+PARAMETER_STRING_WIDTH = 16
+
+
+def save_columns(directory: str | PathLike[str], columns: dict[str, ArrayLike], append: bool = False) -> None:
+    """Saves a table to a binary columnar store.
+
+    Each column is stored as a raw little-endian binary file, and a JSON metadata
+    file records the column data types and the number of rows. The metadata is
+    replaced atomically after the columns are written, so readers never see a
+    partially written append.
+
+    Parameters
+    ----------
+    directory : {str, PathLike[str]}
+        Store directory. Created if it does not exist.
+    columns : dict[str, array_like]
+        1-D columns of equal length.
+    append : bool (default=`False`)
+        Set to `True` to append rows to an existing store instead of replacing it.
+
+    Raises
+    ------
+    ValueError
+        If the columns are not 1-D or do not have equal lengths.
+        If appending columns whose names or data types do not match the store, or
+        strings longer than the stored width.
+
+    Examples
+    --------
+    >>> gcs.io.save_columns(directory='table', columns={'x': [1.0, 2.0], 'valid': [True, False]})
+    >>> gcs.io.save_columns(directory='table', columns={'x': [3.0], 'valid': [True]}, append=True)
+
+    """
+    directory = Path(directory)
+
+    arrays = {name: np.asarray(column) for name, column in columns.items()}
+
+    lengths = {array.shape for array in arrays.values()}
+    if len(lengths) > 1 or any(len(shape) != 1 for shape in lengths):
+        raise ValueError(f'columns must be 1-D with equal lengths, got {sorted(lengths)}.')
+    n_new_rows = lengths.pop()[0] if lengths else 0
+
+    if append and (directory / METADATA_FILE).exists():
+        n_rows, dtypes = _read_metadata(directory=directory)
+
+        if list(arrays) != list(dtypes):
+            raise ValueError(f'columns {list(arrays)} do not match the stored columns {list(dtypes)}.')
+
+        for name, array in arrays.items():
+            # Strings are never truncated, while numbers may be cast within their kind
+            casting = 'safe' if array.dtype.kind in 'SU' else 'same_kind'
+
+            if not np.can_cast(array.dtype, dtypes[name], casting=casting):
+                raise ValueError(f'{name} column ({array.dtype}) cannot be stored as {dtypes[name]}.')
+    else:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        n_rows = 0
+        dtypes = {name: array.dtype.newbyteorder('<') for name, array in arrays.items()}
+
+        # Remove columns of a replaced store
+        for file in directory.glob(f'*{COLUMN_SUFFIX}'):
+            if file.stem not in dtypes:
+                file.unlink()
+
+    for name, array in arrays.items():
+        with open(directory / f'{name}{COLUMN_SUFFIX}', 'ab' if n_rows else 'wb') as f:
+            # Discard rows left by an interrupted append
+            f.truncate(n_rows * dtypes[name].itemsize)
+            array.astype(dtypes[name], copy=False).tofile(f)
+
+    _write_metadata(directory=directory, n_rows=n_rows + n_new_rows, dtypes=dtypes)
+
+
+def load_columns(directory: str | PathLike[str],
+                 names: list[str] | None = None,
+                 rows: ArrayLike | slice | None = None,
+                 mmap: bool = True) -> dict[str, np.ndarray]:
+    """Loads a table from a binary columnar store.
+
+    Columns are memory-mapped, so only the selected columns and rows are read.
+
+    Parameters
+    ----------
+    directory : {str, PathLike[str]}
+        Store directory.
+    names : {list[str], None} (default=`None`)
+        Names of the columns to load. Loads all columns if `None`.
+    rows : {array_like, slice, None} (default=`None`)
+        Indices, boolean mask or slice of the rows to load. Loads all rows if `None`.
+    mmap : bool (default=`True`)
+        Set to `True` to memory-map the columns (read-only) instead of reading them into memory.
+
+    Returns
+    -------
+    columns : dict[str, numpy.ndarray]
+        Loaded columns.
+
+    Raises
+    ------
+    ValueError
+        If a column is not in the store.
+
+    Examples
+    --------
+    >>> columns = gcs.io.load_columns(directory='table', names=['x'], rows=slice(0, 2))
+
+    """
+    directory = Path(directory)
+
+    n_rows, dtypes = _read_metadata(directory=directory)
+
+    if names is None:
+        names = list(dtypes)
+
+    unknown = [name for name in names if name not in dtypes]
+    if unknown:
+        raise ValueError(f'{unknown} are not stored columns.')
+
+    columns = {}
+    for name in names:
+        if n_rows == 0:
+            # Empty files cannot be memory-mapped
+            column = np.empty(shape=0, dtype=dtypes[name])
+        else:
+            column = np.memmap(directory / f'{name}{COLUMN_SUFFIX}', dtype=dtypes[name], mode='r', shape=(n_rows,))
+
+        if rows is not None:
+            column = column[rows]
+
+        if not mmap:
+            column = np.array(column)
+
+        columns[name] = column
+
+    return columns
+
+
+def save_parameters_columnar(directory: str | PathLike[str],
+                             shapes: list[GCS] | GCSBatch,
+                             append: bool = False) -> None:
+    """Saves one or more GCS parameters to a binary columnar store.
+
+    Each parameter is stored as a typed contiguous column, avoiding the text
+    formatting and parsing of CSV files.
+
+    Parameters
+    ----------
+    directory : {str, PathLike[str]}
+        Store directory. Created if it does not exist.
+    shapes : {list[gcs.GCS], gcs.GCSBatch}
+        GCS shapes to save.
+    append : bool (default=`False`)
+        Set to `True` to append the shapes to an existing store instead of replacing it.
+
+    Examples
+    --------
+    >>> gcs.io.save_parameters_columnar(directory='archive', shapes=[gcs.Iroko(), gcs.Willow()])
+    >>> gcs.io.save_parameters_columnar(directory='archive', shapes=[gcs.Iroko()], append=True)
+
+    """
+    if not isinstance(shapes, GCSBatch):
+        shapes = GCSBatch.from_shapes(shapes)
+
+    save_columns(directory=directory, columns=_stored_parameters(shapes=shapes), append=append)
+
+
+def load_parameters_columnar(directory: str | PathLike[str],
+                             rows: ArrayLike | slice | None = None,
+                             mmap: bool = True) -> GCSBatch:
+    """Loads GCS parameters from a binary columnar store.
+
+    Parameters
+    ----------
+    directory : {str, PathLike[str]}
+        Store directory.
+    rows : {array_like, slice, None} (default=`None`)
+        Indices, boolean mask or slice of the shapes to load. Loads all shapes if `None`.
+    mmap : bool (default=`True`)
+        Set to `True` to memory-map the parameter columns (read-only) instead of reading them into memory.
+
+    Returns
+    -------
+    shapes : gcs.GCSBatch
+        Loaded GCS shapes.
+
+    Examples
+    --------
+    >>> shapes = gcs.io.load_parameters_columnar(directory='archive', rows=slice(0, 1000))
+    >>> shape = shapes[0]
+
+    """
+    _, dtypes = _read_metadata(directory=Path(directory))
+
+    # Parameters missing from older stores use the ``gcs.GCS`` defaults
+    names = [name for name in PARAMETER_DTYPES if name in dtypes]
+
+    columns = load_columns(directory=directory, names=names, rows=rows, mmap=mmap)
+
+    return GCSBatch(**columns)
+
+
+def _stored_parameters(shapes: GCSBatch) -> dict[str, np.ndarray]:
+    """Parameter columns of a batch, as stored in a columnar store.
+
+    Parameters
+    ----------
+    shapes : gcs.GCSBatch
+        GCS shapes.
+
+    Returns
+    -------
+    columns : dict[str, numpy.ndarray]
+        Parameter columns, with string columns padded to ``PARAMETER_STRING_WIDTH``.
+
+    """
+    return {
+        name: column.astype(f'U{PARAMETER_STRING_WIDTH}') if column.dtype.kind == 'U' else column
+        for name, column in shapes.parameters.items()
+    }
+
+
+def _read_metadata(directory: Path) -> tuple[int, dict[str, np.dtype]]:
+    """Reads the metadata of a columnar store.
+
+    Parameters
+    ----------
+    directory : pathlib.Path
+        Store directory.
+
+    Returns
+    -------
+    n_rows : int
+        Number of rows.
+    dtypes : dict[str, numpy.dtype]
+        Column data types.
+
+    """
+    metadata = json.loads((directory / METADATA_FILE).read_text())
+
+    return metadata['n_rows'], {name: np.dtype(dtype) for name, dtype in metadata['columns'].items()}
+
+
+def _write_metadata(directory: Path, n_rows: int, dtypes: dict[str, np.dtype]) -> None:
+    """Atomically writes the metadata of a columnar store.
+
+    Parameters
+    ----------
+    directory : pathlib.Path
+        Store directory.
+    n_rows : int
+        Number of rows.
+    dtypes : dict[str, numpy.dtype]
+        Column data types.
+
+    """
+    content = json.dumps(obj={'n_rows': n_rows, 'columns': {name: dtype.str for name, dtype in dtypes.items()}})
+
+    descriptor, temporary_file = tempfile.mkstemp(dir=directory, suffix='.tmp')
+
+    try:
+        with os.fdopen(descriptor, 'w') as f:
+            f.write(content)
+        os.replace(temporary_file, directory / METADATA_FILE)
+    except BaseException:
+        os.remove(temporary_file)
+        raise
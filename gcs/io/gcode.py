@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..geometry.rings import Rings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from os import PathLike
+
+    from ..shape import GCS
+
+
+def save_gcode(file: str | PathLike[str],
+               shape: GCS,
+               layer_height: float = 0.2,
+               spiral: bool = True,
+               print_speed: float = 30.0,
+               filament_diameter: float = 1.75,
+               chunk: int = 100) -> None:
+    """Saves a vase-mode toolpath of a GCS wall to a G-code file.
+
+    The toolpath is generated directly from the parametric form, without meshing and
+    slicing. The shape is split into ``round(height / layer_height)`` layers of equal
+    height (at least one), and the nozzle traces the cross-section at its own height,
+    sampled with the shape's ``theta_step``. Each extrusion deposits a bead of width
+    ``thickness`` and the layer height. Layers are generated and written ``chunk``
+    at a time, so peak memory does not depend on the number of layers.
+
+    Parameters
+    ----------
+    file : {str, PathLike[str]}
+        Output G-code file path.
+    shape : gcs.GCS
+        GCS shape to print. Only the wall is printed.
+    layer_height : float (default=`0.2`)
+        Target layer height (mm).
+    spiral : bool (default=`True`)
+        Set to `True` to print a flat first layer followed by a continuous spiral, in
+        which the nozzle rises by one layer per revolution. Set to `False` to print
+        closed layers, moving up between layers without extruding.
+    print_speed : float (default=`30.0`)
+        Nozzle speed (mm/s).
+    filament_diameter : float (default=`1.75`)
+        Filament diameter (mm), used to convert deposited volumes to extrusion lengths.
+    chunk : int (default=`100`)
+        Number of layers generated and written at a time.
+
+    Raises
+    ------
+    ValueError
+        If ``layer_height``, ``print_speed`` or ``filament_diameter`` is not positive.
+        If ``chunk`` is less than 1.
+
+    Examples
+    --------
+    >>> shape = gcs.Iroko()
+    >>> gcs.io.save_gcode(file='saved.gcode', shape=shape, layer_height=0.2)
+
+    Notes
+    -----
+    Extrusion is relative (``M83``), and no printer-specific start or end sequences
+    (homing, heating, priming) are written.
+
+    """
+    if layer_height <= 0:
+        raise ValueError(f'layer_height ({layer_height}) must be positive.')
+    if print_speed <= 0:
+        raise ValueError(f'print_speed ({print_speed}) must be positive.')
+    if filament_diameter <= 0:
+        raise ValueError(f'filament_diameter ({filament_diameter}) must be positive.')
+    if chunk < 1:
+        raise ValueError(f'chunk ({chunk}) must be at least 1.')
+
+    n_layers = max(round(shape.height_ / layer_height), 1)
+    layer_height = shape.height_ / n_layers
+
+    # Each layer traces the cross-section at the nozzle height
+    rings = Rings(shape=shape, fractions=np.arange(1, n_layers + 1) / n_layers)
+
+    filament_area = np.pi * filament_diameter**2 / 4
+    extrusion_per_length = shape.thickness_ * layer_height / filament_area
+
+    header = '\n'.join([
+        '; gcs vase-mode toolpath',
+        f'; mode: {"spiral" if spiral else "layers"}',
+        f'; layers: {n_layers}',
+        f'; layer_height: {layer_height:.6g}',
+        f'; line_width: {shape.thickness_:.6g}',
+        'G21 ; millimetres',
+        'G90 ; absolute positioning',
+        'M83 ; relative extrusion',
+        f'G1 F{60 * print_speed:.6g}',
+    ]) + '\n'
+
+    with open(file, 'w', encoding='ascii') as f:
+        f.write(header)
+
+        previous = None
+        for points, extrude in _toolpath(rings=rings, spiral=spiral, chunk=chunk):
+            # Each move starts at the previous point, and the first move starts in place
+            starts = np.vstack((points[:1] if previous is None else previous, points[:-1]))
+            extrusions = np.linalg.norm(points - starts, axis=1) * extrusion_per_length
+
+            f.writelines(
+                f'G1 X{x:.4f} Y{y:.4f} Z{z:.4f} E{e:.5f}\n' if extruding else f'G0 X{x:.4f} Y{y:.4f} Z{z:.4f}\n'
+                for (x, y, z), e, extruding in zip(points.tolist(), extrusions.tolist(), extrude.tolist()))
+
+            previous = points[-1:]
+
+
+def _toolpath(rings: Rings, spiral: bool, chunk: int) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Generates the toolpath points of a GCS wall, a chunk of layers at a time.
+
+    Parameters
+    ----------
+    rings : gcs.geometry.Rings
+        Cross-sections traced by the layers, at the nozzle heights.
+    spiral : bool
+        Set to `True` to generate a flat first layer followed by a continuous spiral.
+    chunk : int
+        Number of layers generated at a time.
+
+    Yields
+    ------
+    points : (N, 3) numpy.ndarray
+        Consecutive toolpath points. The path continues from the last point of the previous chunk.
+    extrude : (N,) numpy.ndarray
+        `True` where the move to the point extrudes, and `False` for travel moves.
+
+    """
+    n_layers = rings.fractions_.size
+    n_angles = rings.thetas_.size
+
+    if not spiral:
+        for start in range(0, n_layers, chunk):
+            stop = min(start + chunk, n_layers)
+
+            # Closed loops, reached by a travel move to their first point
+            layers = rings.vertices(rings=slice(start, stop)).reshape(stop - start, n_angles, 3)
+            loops = np.concatenate((layers, layers[:, :1]), axis=1)
+
+            extrude = np.ones(shape=loops.shape[:2], dtype=bool)
+            extrude[:, 0] = False
+
+            yield loops.reshape(-1, 3), extrude.ravel()
+
+        return
+
+    # Flat first layer, closed by the start of the spiral
+    yield rings.vertices(rings=slice(0, 1)), np.arange(n_angles) > 0
+
+    # Each revolution rises linearly with the angle, from one layer to the next
+    weights = (rings.thetas_ / (2 * np.pi))[:, np.newaxis]
+
+    for start in range(0, n_layers - 1, chunk):
+        stop = min(start + chunk, n_layers - 1)
+
+        layers = rings.vertices(rings=slice(start, stop + 1)).reshape(stop - start + 1, n_angles, 3)
+        revolutions = (1 - weights) * layers[:-1] + weights * layers[1:]
+
+        yield revolutions.reshape(-1, 3), np.ones(shape=revolutions.shape[0] * n_angles, dtype=bool)
+
+    # Close the last revolution
+    yield rings.vertices(rings=slice(n_layers - 1, n_layers), angles=slice(0, 1)), np.ones(shape=1, dtype=bool)
@@ -2,27 +2,38 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from ..batch import PARAMETER_DTYPES, GCSBatch
 from ..shape import GCS
+from .save import PLY_TYPES
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from os import PathLike
 
 
-def load_parameters(file: str | PathLike[str]) -> list[GCS]:
+def load_parameters(file: str | PathLike[str], batch: bool = False) -> list[GCS] | GCSBatch:
     """Loads one or more GCS parameters from a CSV file.
 
     Parameters
     ----------
     file : {str, PathLike[str]}
         Input CSV file path.
+    batch : bool (default=`False`)
+        Set to `True` to return a ``gcs.GCSBatch`` instead of individual shapes.
 
     Returns
     -------
-    shapes : list[gcs.GCS]
+    shapes : {list[gcs.GCS], gcs.GCSBatch}
         Loaded GCS shapes.
 
+    Raises
+    ------
+    ValueError
+        If a column is not a GCS parameter or cannot be converted to the parameter type.
+
     Examples
     --------
     >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
@@ -40,11 +51,229 @@ def load_parameters(file: str | PathLike[str]) -> list[GCS]:
     """
     csv_data = pd.read_csv(filepath_or_buffer=file, sep=',', header=0)
 
-    shapes = []
-    for _, row in csv_data.iterrows():
-        parameters = row.to_dict()
-        shape = GCS(**parameters)
+    columns = _parameter_columns(data=csv_data)
+
+    if batch:
+        return GCSBatch(**columns)
+
+    return _parameter_shapes(columns=columns)
+
+
+def iter_parameters(file: str | PathLike[str],
+                    chunk_size: int = 10000,
+                    batch: bool = False) -> Iterator[GCS] | Iterator[GCSBatch]:
+    """Lazily loads GCS parameters from a CSV file, one chunk of rows at a time.
+
+    Only ``chunk_size`` rows are held in memory at once, so files larger than
+    memory can be processed.
+
+    Parameters
+    ----------
+    file : {str, PathLike[str]}
+        Input CSV file path.
+    chunk_size : int (default=`10000`)
+        Number of rows read at a time.
+    batch : bool (default=`False`)
+        Set to `True` to yield one ``gcs.GCSBatch`` per chunk instead of individual shapes.
+
+    Yields
+    ------
+    shapes : {gcs.GCS, gcs.GCSBatch}
+        Loaded GCS shapes, or batches of at most ``chunk_size`` shapes.
+
+    Raises
+    ------
+    ValueError
+        If ``chunk_size`` is less than 1.
+        If a column is not a GCS parameter or cannot be converted to the parameter type.
+
+    Examples
+    --------
+    >>> for batch in gcs.io.iter_parameters(file='saved.csv', batch=True):
+    ...     valid = batch.valid
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size ({chunk_size}) must be at least 1.')
+
+    # Arguments are validated on call, before the generator is first advanced
+    return _iter_parameters(file=file, chunk_size=chunk_size, batch=batch)
+
+
+def _iter_parameters(file: str | PathLike[str],
+                     chunk_size: int,
+                     batch: bool) -> Iterator[GCS] | Iterator[GCSBatch]:
+    """Lazily loads GCS parameters from a CSV file (see ``gcs.io.iter_parameters``).
+
+    Parameters
+    ----------
+    file : {str, PathLike[str]}
+        Input CSV file path.
+    chunk_size : int
+        Number of rows read at a time.
+    batch : bool
+        Set to `True` to yield one ``gcs.GCSBatch`` per chunk instead of individual shapes.
+
+    Yields
+    ------
+    shapes : {gcs.GCS, gcs.GCSBatch}
+        Loaded GCS shapes, or batches of at most ``chunk_size`` shapes.
+
+    """
+    with pd.read_csv(filepath_or_buffer=file, sep=',', header=0, chunksize=chunk_size) as reader:
+        for csv_data in reader:
+            columns = _parameter_columns(data=csv_data)
+
+            if batch:
+                yield GCSBatch(**columns)
+            else:
+                yield from _parameter_shapes(columns=columns)
+
+
+def _parameter_columns(data: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Validates and converts the columns of a parameter table.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        Parameter table with one row per shape. Omitted columns use the ``gcs.GCS`` defaults.
+
+    Returns
+    -------
+    columns : dict[str, numpy.ndarray]
+        Parameter columns, converted to the parameter types.
+
+    Raises
+    ------
+    ValueError
+        If a column is not a GCS parameter or cannot be converted to the parameter type.
+
+    """
+    unknown = [name for name in data.columns if name not in PARAMETER_DTYPES]
+    if unknown:
+        raise ValueError(f'{unknown} are not GCS parameters.')
+
+    columns = {}
+    for name, dtype in PARAMETER_DTYPES.items():
+        if name not in data.columns:
+            continue
+
+        column = data[name].to_numpy()
+
+        # Any object is truthy, so only genuine boolean columns are accepted
+        if dtype is bool and column.dtype != bool and column.size:
+            raise ValueError(f'{name} column must contain only True or False.')
+
+        try:
+            converted = column.astype(dtype)
+        except (TypeError, ValueError) as error:
+            raise ValueError(f'{name} column cannot be converted to {dtype.__name__}.') from error
+
+        if dtype is int and np.any(converted != column):
+            raise ValueError(f'{name} column must contain only integers.')
+
+        columns[name] = converted
+
+    return columns
+
+
+def _parameter_shapes(columns: dict[str, np.ndarray]) -> list[GCS]:
+    """Creates GCS shapes from parameter columns.
+
+    Parameters
+    ----------
+    columns : dict[str, numpy.ndarray]
+        Parameter columns.
+
+    Returns
+    -------
+    shapes : list[gcs.GCS]
+        One GCS shape per row.
+
+    """
+    names = list(columns)
+    # Converting whole columns yields Python scalars without boxing each row
+    rows = zip(*(column.tolist() for column in columns.values()))
+
+    return [GCS(**dict(zip(names, row))) for row in rows]
+
+
+def load_ply(file: str | PathLike[str], mmap: bool = True) -> tuple[np.ndarray, np.ndarray]:
+    """Loads a triangle mesh from a binary (little-endian) PLY file.
+
+    Vertices and faces are read directly from the binary buffers without parsing.
+
+    Parameters
+    ----------
+    file : {str, PathLike[str]}
+        Input PLY file path.
+    mmap : bool (default=`True`)
+        Set to `True` to memory-map the arrays (read-only) instead of reading them into memory.
+
+    Returns
+    -------
+    vertices : (N, 3) numpy.ndarray
+        Vertices.
+    faces : (M, 3) numpy.ndarray
+        Faces.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a binary little-endian PLY file with the layout
+        written by ``gcs.io.save_ply``.
+
+    Examples
+    --------
+    >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+    >>> gcs.io.save_ply(file='saved.ply', shape=shape)
+    >>> vertices, faces = gcs.io.load_ply(file='saved.ply')
+
+    """
+    numpy_types = {ply_type: dtype.newbyteorder('<') for dtype, ply_type in PLY_TYPES.items()}
+
+    with open(file, 'rb') as f:
+        lines = []
+        while not lines or lines[-1] != 'end_header':
+            line = f.readline()
+            if not line:
+                raise ValueError(f'{file} is missing a PLY header.')
+            lines.append(line.decode('ascii').strip())
+
+        offset = f.tell()
+
+    expected_lines = [
+        'ply',
+        'format binary_little_endian 1.0',
+        'element vertex',
+        'property',
+        'property',
+        'property',
+        'element face',
+        'property list uchar',
+        'end_header',
+    ]
+    lines = [line for line in lines if not line.startswith('comment')]
+
+    if len(lines) != len(expected_lines) or not all(map(str.startswith, lines, expected_lines)):
+        raise ValueError(f'{file} does not have the PLY layout written by gcs.io.save_ply.')
+
+    try:
+        n_vertices = int(lines[2].split()[2])
+        vertex_dtype = numpy_types[lines[3].split()[1]]
+        n_faces = int(lines[6].split()[2])
+        face_dtype = numpy_types[lines[7].split()[3]]
+    except (IndexError, KeyError, ValueError) as error:
+        raise ValueError(f'{file} has unsupported PLY properties.') from error
+
+    face_record_dtype = np.dtype([('count', 'u1'), ('indices', face_dtype, (3,))])
+    face_offset = offset + n_vertices * 3 * vertex_dtype.itemsize
 
-        shapes.append(shape)
+    if mmap:
+        vertices = np.memmap(file, dtype=vertex_dtype, mode='r', offset=offset, shape=(n_vertices, 3))
+        face_records = np.memmap(file, dtype=face_record_dtype, mode='r', offset=face_offset, shape=(n_faces,))
+    else:
+        vertices = np.fromfile(file, dtype=vertex_dtype, count=3 * n_vertices, offset=offset).reshape(-1, 3)
+        face_records = np.fromfile(file, dtype=face_record_dtype, count=n_faces, offset=face_offset)
 
-    return shapes
+    return vertices, face_records['indices']
@@ -1,17 +1,56 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+import json
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
-from stl import Mode
 from stl.mesh import Mesh
 
+from ..geometry.meshing import _cap_centres, _cap_faces, _fan_cap_faces, iter_rings
+
 if TYPE_CHECKING:
     from os import PathLike
+    from typing import BinaryIO
+
+    from numpy.typing import DTypeLike
 
     from ..shape import GCS
 
+# Supported mesh file formats
+MESH_FORMATS = ('stl', 'ply', 'obj', 'glb')
+
+# Binary STL header text
+STL_HEADER = b'gcs binary STL'
+
+# PLY property types of supported vertex and face data types
+PLY_TYPES = {
+    np.dtype('float32'): 'float',
+    np.dtype('float64'): 'double',
+    np.dtype('int32'): 'int',
+    np.dtype('uint32'): 'uint',
+}
+
+# glTF constants
+GLTF_MAGIC = b'glTF'
+GLTF_VERSION = 2
+GLTF_JSON_CHUNK = 0x4E4F534A
+GLTF_BIN_CHUNK = 0x004E4942
+GLTF_FLOAT = 5126
+GLTF_UNSIGNED_INT = 5125
+GLTF_ARRAY_BUFFER = 34962
+GLTF_ELEMENT_ARRAY_BUFFER = 34963
+GLTF_TRIANGLES = 4
+
+# Change of basis from GCS coordinates (millimetres, z-up) to glTF coordinates (metres, y-up)
+GLTF_TRANSFORM = 1e-3 * np.array([
+    [1, 0, 0],
+    [0, 0, -1],
+    [0, 1, 0],
+])
+
 
 def save_parameters(file: str | PathLike[str], shapes: list[GCS]) -> None:
     """Saves one or more GCS parameters to a CSV file.
@@ -40,7 +79,11 @@ def save_parameters(file: str | PathLike[str], shapes: list[GCS]) -> None:
 
 
 def save_mesh(file: str | PathLike[str], shape: GCS) -> None:
-    """Saves a GCS mesh to an STL file.
+    """Saves a GCS mesh to a binary STL file.
+
+    Triangles are gathered from the vertices in a single vectorized pass and
+    written directly, using numpy-stl's record layout without constructing a
+    ``stl.mesh.Mesh`` object.
 
     Parameters
     ----------
@@ -56,16 +99,407 @@ def save_mesh(file: str | PathLike[str], shape: GCS) -> None:
 
     References
     ----------
-    .. [1] https://github.com/wolph/numpy-stl/tree/develop#creating-mesh-objects-from-a-list-of-vertices-and-faces
+    .. [1] https://en.wikipedia.org/wiki/STL_(file_format)#Binary
+
+    """
+    records = _stl_records(vertices=shape.vertices, faces=shape.faces)
+
+    with open(file, 'wb') as f:
+        _write_stl_header(f=f, n_triangles=records.size)
+        records.tofile(f)
+
+
+def save_mesh_streaming(file: str | PathLike[str], shape: GCS, chunk: int = 1) -> None:
+    """Saves a GCS mesh to a binary STL file ring by ring.
+
+    Rings and the side faces between consecutive rings are generated and written
+    incrementally (see ``gcs.geometry.iter_rings``), so peak memory is bounded by
+    ``chunk + 1`` rings rather than the full mesh. The cap triangulations are computed first so that the triangle count
+    can be written in the header.
+
+    Parameters
+    ----------
+    file : {str, PathLike[str]}
+        Output STL file path.
+    shape : gcs.GCS
+        GCS shape to save.
+    chunk : int (default=`1`)
+        Number of rings generated and written at a time.
+
+    Raises
+    ------
+    ValueError
+        If ``chunk`` is less than 1.
+
+    Examples
+    --------
+    >>> shape = gcs.Iroko(n_height_steps=1000, theta_step=0.001)
+    >>> gcs.io.save_mesh_streaming(file='saved.stl', shape=shape)
+
+    """
+    if chunk < 1:
+        raise ValueError(f'chunk ({chunk}) must be at least 1.')
+
+    rings = shape.rings
+
+    n_strips = rings.fractions_.size - 1
+    n_vertices_per_step = rings.thetas_.size
+
+    caps = []
+    if shape.triangulate_caps_:
+        for index, base in ((0, True), (n_strips, False)):
+            ring = rings.vertices(rings=slice(index, index + 1))
+
+            if shape.cap_triangulation_ == 'fan':
+                ring = np.vstack((ring, _cap_centres(heights=rings.heights_[index])))
+                faces = _fan_cap_faces(n_vertices_per_step=n_vertices_per_step,
+                                       start=0,
+                                       centre=n_vertices_per_step,
+                                       base=base)
+            else:
+                faces = _cap_faces(ring=ring, base=base)
+
+            caps.append((ring, faces))
+
+    n_triangles = 2 * n_strips * n_vertices_per_step + sum(faces.shape[0] for _, faces in caps)
+
+    with open(file, 'wb') as f:
+        _write_stl_header(f=f, n_triangles=n_triangles)
+
+        for ring, faces in caps[:1]:
+            _stl_records(vertices=ring, faces=faces).tofile(f)
+
+        # Each chunk is written with the last ring of the previous chunk, which its first strip connects to
+        offset = 0
+        window = np.empty(shape=(0, 3), dtype=float)
+        for vertices, faces in iter_rings(shape=shape, chunk=chunk, faces=True):
+            window = np.vstack((window[-n_vertices_per_step:], vertices))
+
+            _stl_records(vertices=window, faces=faces - offset).tofile(f)
+
+            offset += window.shape[0] - n_vertices_per_step
+
+        for ring, faces in caps[1:]:
+            _stl_records(vertices=ring, faces=faces).tofile(f)
+
+
+def save_ply(file: str | PathLike[str],
+             shape: GCS,
+             vertex_dtype: DTypeLike = np.float32,
+             face_dtype: DTypeLike = np.uint32) -> None:
+    """Saves a GCS mesh to a binary (little-endian) PLY file.
+
+    Vertices and faces are written as contiguous buffers with a shared index,
+    so the file can be memory-mapped on reload (see ``gcs.io.load_ply``).
+
+    Parameters
+    ----------
+    file : {str, PathLike[str]}
+        Output PLY file path.
+    shape : gcs.GCS
+        GCS shape to save.
+    vertex_dtype : DTypeLike (default=`numpy.float32`)
+        Vertex coordinate data type (``float32`` or ``float64``).
+    face_dtype : DTypeLike (default=`numpy.uint32`)
+        Face index data type (``uint32`` or ``int32``).
+
+    Raises
+    ------
+    ValueError
+        If ``vertex_dtype`` or ``face_dtype`` is not supported.
+
+    Examples
+    --------
+    >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+    >>> gcs.io.save_ply(file='saved.ply', shape=shape)
+
+    References
+    ----------
+    .. [1] https://paulbourke.net/dataformats/ply/
 
     """
+    vertex_dtype = np.dtype(vertex_dtype)
+    face_dtype = np.dtype(face_dtype)
+
+    if vertex_dtype.kind != 'f' or vertex_dtype not in PLY_TYPES:
+        raise ValueError(f'vertex_dtype ({vertex_dtype}) must be float32 or float64.')
+    if face_dtype.kind not in 'iu' or face_dtype not in PLY_TYPES:
+        raise ValueError(f'face_dtype ({face_dtype}) must be uint32 or int32.')
+
     vertices = shape.vertices
     faces = shape.faces
 
-    mesh = Mesh(data=np.zeros(shape=(faces.shape[0],), dtype=Mesh.dtype))
+    header = '\n'.join([
+        'ply',
+        'format binary_little_endian 1.0',
+        'comment gcs',
+        f'element vertex {vertices.shape[0]}',
+        f'property {PLY_TYPES[vertex_dtype]} x',
+        f'property {PLY_TYPES[vertex_dtype]} y',
+        f'property {PLY_TYPES[vertex_dtype]} z',
+        f'element face {faces.shape[0]}',
+        f'property list uchar {PLY_TYPES[face_dtype]} vertex_indices',
+        'end_header',
+    ]) + '\n'
+
+    # Each face record is a vertex count followed by the vertex indices
+    face_records = np.empty(shape=(faces.shape[0],),
+                            dtype=[('count', 'u1'), ('indices', face_dtype.newbyteorder('<'), (3,))])
+    face_records['count'] = 3
+    face_records['indices'] = faces
+
+    with open(file, 'wb') as f:
+        f.write(header.encode('ascii'))
+        np.ascontiguousarray(vertices, dtype=vertex_dtype.newbyteorder('<')).tofile(f)
+        face_records.tofile(f)
+
+
+def save_obj(file: str | PathLike[str], shape: GCS) -> None:
+    """Saves a GCS mesh to a Wavefront OBJ file.
+
+    Parameters
+    ----------
+    file : {str, PathLike[str]}
+        Output OBJ file path.
+    shape : gcs.GCS
+        GCS shape to save.
+
+    Examples
+    --------
+    >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+    >>> gcs.io.save_obj(file='saved.obj', shape=shape)
+
+    References
+    ----------
+    .. [1] https://en.wikipedia.org/wiki/Wavefront_.obj_file
+
+    """
+    with open(file, 'w', encoding='ascii') as f:
+        np.savetxt(f, shape.vertices, fmt='v %.9g %.9g %.9g')
+        # OBJ indices are 1-based
+        np.savetxt(f, shape.faces + 1, fmt='f %d %d %d')
+
+
+def save_glb(file: str | PathLike[str], shape: GCS) -> None:
+    """Saves a GCS mesh to a binary glTF (GLB) file.
+
+    Vertices are stored as ``float32`` positions and faces as ``uint32`` indices,
+    as required by glTF. Coordinates are converted to the glTF conventions of metres
+    and +Y up, mapping ``(x, y, z)`` in millimetres to ``(x, z, -y) / 1000``. The
+    change of basis is a rotation, so the face winding is preserved.
+
+    Parameters
+    ----------
+    file : {str, PathLike[str]}
+        Output GLB file path.
+    shape : gcs.GCS
+        GCS shape to save.
+
+    Examples
+    --------
+    >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+    >>> gcs.io.save_glb(file='saved.glb', shape=shape)
+
+    References
+    ----------
+    .. [1] https://registry.khronos.org/glTF/specs/2.0/glTF-2.0.html#binary-gltf-layout
+
+    """
+    vertices = np.ascontiguousarray(shape.vertices @ GLTF_TRANSFORM, dtype='<f4')
+    indices = np.ascontiguousarray(shape.faces, dtype='<u4')
+
+    gltf = {
+        'asset': {'version': '2.0', 'generator': 'gcs'},
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': [{'mesh': 0}],
+        'meshes': [{'primitives': [{'attributes': {'POSITION': 0}, 'indices': 1, 'mode': GLTF_TRIANGLES}]}],
+        'accessors': [
+            {
+                'bufferView': 0,
+                'componentType': GLTF_FLOAT,
+                'count': vertices.shape[0],
+                'type': 'VEC3',
+                'min': vertices.min(axis=0).tolist(),
+                'max': vertices.max(axis=0).tolist(),
+            },
+            {
+                'bufferView': 1,
+                'componentType': GLTF_UNSIGNED_INT,
+                'count': indices.size,
+                'type': 'SCALAR',
+            },
+        ],
+        'bufferViews': [
+            {'buffer': 0, 'byteOffset': 0, 'byteLength': vertices.nbytes, 'target': GLTF_ARRAY_BUFFER},
+            {
+                'buffer': 0,
+                'byteOffset': vertices.nbytes,
+                'byteLength': indices.nbytes,
+                'target': GLTF_ELEMENT_ARRAY_BUFFER,
+            },
+        ],
+        'buffers': [{'byteLength': vertices.nbytes + indices.nbytes}],
+    }
+
+    # Chunks are padded to 4-byte boundaries (JSON with spaces)
+    json_chunk = json.dumps(obj=gltf, separators=(',', ':')).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    bin_length = vertices.nbytes + indices.nbytes
+
+    total_length = 12 + 8 + len(json_chunk) + 8 + bin_length
+
+    with open(file, 'wb') as f:
+        f.write(GLTF_MAGIC)
+        f.write(np.array([GLTF_VERSION, total_length], dtype='<u4').tobytes())
+        f.write(np.array([len(json_chunk), GLTF_JSON_CHUNK], dtype='<u4').tobytes())
+        f.write(json_chunk)
+        f.write(np.array([bin_length, GLTF_BIN_CHUNK], dtype='<u4').tobytes())
+        vertices.tofile(f)
+        indices.tofile(f)
+
+
+def save_meshes(directory: str | PathLike[str],
+                shapes: list[GCS],
+                file_format: str = 'stl',
+                workers: int | None = None) -> dict[int, BaseException]:
+    """Saves the meshes of multiple GCS in parallel.
+
+    Shapes are pickled without their cached results (keeping their class,
+    ``vertex_dtype`` and ``face_dtype``), so only their parameters are sent to the
+    worker processes, which generate and write the meshes. Files are named ``shape_<index>.<file_format>``,
+    with the index of the shape in ``shapes`` zero-padded to 6 digits.
+
+    Parameters
+    ----------
+    directory : {str, PathLike[str]}
+        Output directory. Created if it does not exist.
+    shapes : list[gcs.GCS]
+        GCS shapes to save.
+    file_format : str (default=`'stl'`)
+        Mesh file format: ``'stl'``, ``'ply'``, ``'obj'``, or ``'glb'``.
+    workers : int (default=`None`)
+        Number of worker processes. If `None`, the number of processors is used.
+        If 1, meshes are saved in the current process.
+
+    Returns
+    -------
+    errors : dict[int, BaseException]
+        Exceptions raised while saving, keyed by the index of the shape in ``shapes``.
+        Empty if all meshes were saved.
+
+    Raises
+    ------
+    ValueError
+        If ``file_format`` is not supported.
+
+    Examples
+    --------
+    >>> shapes = [gcs.Iroko(), gcs.Willow()]
+    >>> errors = gcs.io.save_meshes(directory='meshes', shapes=shapes, workers=2)
+    >>> errors
+    {}
+
+    """
+    if file_format not in MESH_FORMATS:
+        raise ValueError(f'file_format ({file_format}) must be one of {MESH_FORMATS}.')
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    jobs = [
+        (shape, directory / f'shape_{index:06d}.{file_format}', file_format)
+        for index, shape in enumerate(shapes)
+    ]
+
+    errors = {}
+
+    if workers == 1:
+        for index, job in enumerate(jobs):
+            try:
+                _save_mesh_job(*job)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                errors[index] = error
+
+        return errors
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_save_mesh_job, *job) for job in jobs]
+
+        for index, future in enumerate(futures):
+            error = future.exception()
+            if error is not None:
+                errors[index] = error
+
+    return errors
+
+
+def _save_mesh_job(shape: GCS, file: Path, file_format: str) -> None:
+    """Generates and saves one GCS mesh (worker process entry point).
+
+    Parameters
+    ----------
+    shape : gcs.GCS
+        GCS shape.
+    file : pathlib.Path
+        Output file path.
+    file_format : str
+        Mesh file format.
+
+    """
+    writers = {
+        'stl': save_mesh,
+        'ply': save_ply,
+        'obj': save_obj,
+        'glb': save_glb,
+    }
 
-    for i, face in enumerate(faces):
-        for dim in range(3):
-            mesh.vectors[i][dim] = vertices[face[dim], :]
+    writers[file_format](file=file, shape=shape)
 
-    mesh.save(filename=file, mode=Mode.BINARY)
+
+def _stl_records(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Builds binary STL triangle records.
+
+    Parameters
+    ----------
+    vertices : (N, 3) numpy.ndarray
+        Vertices.
+    faces : (M, 3) numpy.ndarray
+        Faces.
+
+    Returns
+    -------
+    records : (M,) numpy.ndarray
+        Triangle records with unit normals, using the ``stl.mesh.Mesh.dtype`` layout.
+
+    """
+    records = np.zeros(shape=(faces.shape[0],), dtype=Mesh.dtype)
+
+    # Gather all triangle corners at once
+    triangles = records['vectors']
+    np.take(vertices, faces, axis=0, out=triangles)
+
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+
+    # Degenerate triangles keep a zero normal
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+    records['normals'] = normals
+
+    return records
+
+
+def _write_stl_header(f: BinaryIO, n_triangles: int) -> None:
+    """Writes the header and triangle count of a binary STL file.
+
+    Parameters
+    ----------
+    f : BinaryIO
+        Output binary file.
+    n_triangles : int
+        Number of triangles.
+
+    """
+    # Binary STL headers must not start with "solid"
+    f.write(STL_HEADER.ljust(80, b' '))
+    f.write(np.array(n_triangles, dtype='<u4').tobytes())
@@ -0,0 +1,45 @@
+"""
+``gcs.metrics``
+===============
+
+Functions present in ``gcs.metrics`` are listed below. Each function accepts a
+``gcs.GCS`` or a ``gcs.GCSBatch``, and is evaluated from the parametric form
+without generating a mesh.
+
+Volume
+------
+
+   enclosed_volume
+
+   centroid
+
+Surface
+-------
+
+   wall_area
+
+Printing
+--------
+
+   material_volume
+
+   toolpath_length
+
+   print_time
+
+"""
+from .area import wall_area
+from .printing import material_volume
+from .printing import print_time
+from .printing import toolpath_length
+from .volume import centroid
+from .volume import enclosed_volume
+
+__all__ = [
+    'centroid',
+    'enclosed_volume',
+    'material_volume',
+    'print_time',
+    'toolpath_length',
+    'wall_area',
+]
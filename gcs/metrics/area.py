@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .quadrature import _cross_section_integrals, _height_nodes
+
+if TYPE_CHECKING:
+    from ..batch import GCSBatch
+    from ..shape import GCS
+
+
+def wall_area(shape: GCS | GCSBatch) -> float | np.ndarray:
+    """Computes the wall surface area of a GCS.
+
+    The area element of the parametric wall is integrated with Gauss-Legendre quadrature
+    along the height and the periodic trapezoidal rule around each cross-section. No mesh
+    is generated, and the result does not depend on ``n_height_steps`` or ``theta_step``.
+
+    Parameters
+    ----------
+    shape : {gcs.GCS, gcs.GCSBatch}
+        GCS shape or batch of shapes.
+
+    Returns
+    -------
+    area : {float, (M,) numpy.ndarray}
+        Wall surface area(s) (mm^2), excluding the caps.
+
+    Examples
+    --------
+    >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+    >>> area = gcs.metrics.wall_area(shape=shape)
+
+    """
+    _, weights = _height_nodes()
+
+    _, densities = _cross_section_integrals(shape=shape)
+
+    area = densities @ weights
+
+    return area.reshape(np.shape(shape.height_))[()]
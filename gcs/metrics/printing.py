@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..batch import GCSBatch
+    from ..shape import GCS
+
+
+def material_volume(shape: GCS | GCSBatch) -> float | np.ndarray:
+    """Computes the volume of material used to print a GCS.
+
+    Parameters
+    ----------
+    shape : {gcs.GCS, gcs.GCSBatch}
+        GCS shape or batch of shapes.
+
+    Returns
+    -------
+    volume : {float, (M,) numpy.ndarray}
+        Material volume(s) (mm^3).
+
+    Examples
+    --------
+    >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+    >>> volume = gcs.metrics.material_volume(shape=shape)
+
+    """
+    return shape.mass_ / shape.density_
+
+
+def toolpath_length(shape: GCS | GCSBatch, layer_height: float) -> float | np.ndarray:
+    """Computes the length of the toolpath printing a GCS wall in vase mode.
+
+    The nozzle traces one cross-section per layer, and the perimeter varies linearly
+    along the height, so the length is the mean perimeter times the number of layers.
+
+    Parameters
+    ----------
+    shape : {gcs.GCS, gcs.GCSBatch}
+        GCS shape or batch of shapes.
+    layer_height : float
+        Layer height (mm).
+
+    Returns
+    -------
+    length : {float, (M,) numpy.ndarray}
+        Toolpath length(s) (mm).
+
+    Raises
+    ------
+    ValueError
+        If ``layer_height`` is not positive.
+
+    Examples
+    --------
+    >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+    >>> length = gcs.metrics.toolpath_length(shape=shape, layer_height=0.2)
+
+    """
+    if layer_height <= 0:
+        raise ValueError(f'layer_height ({layer_height}) must be positive.')
+
+    n_layers = shape.height_ / layer_height
+
+    return n_layers * (shape.base_perimeter + shape.top_perimeter) / 2
+
+
+def print_time(shape: GCS | GCSBatch, layer_height: float, print_speed: float) -> float | np.ndarray:
+    """Estimates the time to print a GCS wall in vase mode.
+
+    Parameters
+    ----------
+    shape : {gcs.GCS, gcs.GCSBatch}
+        GCS shape or batch of shapes.
+    layer_height : float
+        Layer height (mm).
+    print_speed : float
+        Nozzle speed (mm/s).
+
+    Returns
+    -------
+    time : {float, (M,) numpy.ndarray}
+        Print time(s) (s).
+
+    Raises
+    ------
+    ValueError
+        If ``layer_height`` or ``print_speed`` is not positive.
+
+    Examples
+    --------
+    >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+    >>> time = gcs.metrics.print_time(shape=shape, layer_height=0.2, print_speed=30)
+
+    """
+    if print_speed <= 0:
+        raise ValueError(f'print_speed ({print_speed}) must be positive.')
+
+    return toolpath_length(shape=shape, layer_height=layer_height) / print_speed
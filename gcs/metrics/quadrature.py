@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..geometry.rings import _ring_parameters
+
+if TYPE_CHECKING:
+    from ..batch import GCSBatch
+    from ..shape import GCS
+
+# Number of Gauss-Legendre nodes along the height
+N_HEIGHT_NODES = 24
+
+# Number of angular nodes (periodic trapezoidal rule)
+N_THETA_NODES = 512
+
+# Number of shapes integrated at once, bounding memory to (CHUNK_SIZE, N_HEIGHT_NODES, N_THETA_NODES) arrays
+CHUNK_SIZE = 64
+
+
+def _height_nodes() -> tuple[np.ndarray, np.ndarray]:
+    """Gauss-Legendre quadrature nodes and weights on the height fractions [0,1].
+
+    Returns
+    -------
+    fractions : (N_HEIGHT_NODES,) numpy.ndarray
+        Height fractions.
+    weights : (N_HEIGHT_NODES,) numpy.ndarray
+        Quadrature weights.
+
+    """
+    nodes, weights = np.polynomial.legendre.leggauss(N_HEIGHT_NODES)
+
+    return (nodes + 1) / 2, weights / 2
+
+
+def _cross_section_integrals(shape: GCS | GCSBatch) -> tuple[np.ndarray, np.ndarray]:
+    """Cross-section areas and wall area densities at the height quadrature nodes.
+
+    The twist only rotates each cross-section, so integrals over the angles are taken
+    on the untwisted curve ``r = r0 S(θ)`` with ``S = 1 + c4 cos(4θ) + c8 cos(8θ)``.
+    Scaling factors are solved from the exact arc length ``L = ∫ sqrt(S^2 + S'^2) dθ``
+    of each cross-section, using the periodic trapezoidal rule, which converges
+    spectrally for these smooth periodic integrands.
+
+    With ``P(f, θ) = (r cosθ, r sinθ, h f)``, the area element of the wall is
+    ``|P_f × P_θ| = sqrt(h^2 (r^2 + r_θ^2) + r^2 r_f^2)``, where ``r_f`` follows from the
+    linear interpolation of c4, c8 and the perimeter and the derivative of the twist.
+
+    Parameters
+    ----------
+    shape : {gcs.GCS, gcs.GCSBatch}
+        GCS shape or batch of M shapes.
+
+    Returns
+    -------
+    areas : (M, N_HEIGHT_NODES) numpy.ndarray
+        Cross-section areas (mm^2). ``M`` is 1 for a single shape.
+    area_densities : (M, N_HEIGHT_NODES) numpy.ndarray
+        Wall area (mm^2) per unit height fraction.
+
+    """
+    fractions, _ = _height_nodes()
+
+    thetas = np.linspace(start=0, stop=2 * np.pi, num=N_THETA_NODES, endpoint=False)
+    cos_4, sin_4, cos_8, sin_8 = np.cos(4 * thetas), np.sin(4 * thetas), np.cos(8 * thetas), np.sin(8 * thetas)
+
+    parameters = {
+        name: np.atleast_1d(getattr(shape, f'{name}_'))
+        for name in ('c4_base', 'c8_base', 'c4_top', 'c8_top', 'twist_linear', 'twist_amplitude', 'twist_cycles',
+                     'height')
+    }
+    parameters['base_perimeter'] = np.atleast_1d(shape.base_perimeter)
+    parameters['top_perimeter'] = np.atleast_1d(shape.top_perimeter)
+
+    n_shapes = parameters['height'].size
+
+    areas = np.empty(shape=(n_shapes, N_HEIGHT_NODES), dtype=float)
+    area_densities = np.empty(shape=(n_shapes, N_HEIGHT_NODES), dtype=float)
+
+    for start in range(0, n_shapes, CHUNK_SIZE):
+        chunk = {name: value[start:start + CHUNK_SIZE, np.newaxis] for name, value in parameters.items()}
+
+        c4s, c8s, perimeters, _, _ = _ring_parameters(**{name: value[:, 0] for name, value in chunk.items()},
+                                                      fractions=fractions)
+
+        # Derivatives along the height fraction
+        d_c4 = chunk['c4_top'] - chunk['c4_base']
+        d_c8 = chunk['c8_top'] - chunk['c8_base']
+        d_perimeter = chunk['top_perimeter'] - chunk['base_perimeter']
+        frequencies = 2 * np.pi * chunk['twist_cycles']
+        d_twist = chunk['twist_linear'] + chunk['twist_amplitude'] * frequencies * np.cos(frequencies * fractions)
+
+        c4s, c8s = c4s[..., np.newaxis], c8s[..., np.newaxis]
+
+        # Unit cross-sections and their derivatives along the angle
+        unit_radii = 1 + c4s * cos_4 + c8s * cos_8
+        d_unit_radii = -4 * c4s * sin_4 - 8 * c8s * sin_8
+        speeds = np.hypot(unit_radii, d_unit_radii)
+
+        # Unit arc lengths and their derivatives with respect to c4 and c8
+        lengths = 2 * np.pi * np.mean(speeds, axis=-1)
+        d_lengths_d_c4 = 2 * np.pi * np.mean((unit_radii * cos_4 - 4 * d_unit_radii * sin_4) / speeds, axis=-1)
+        d_lengths_d_c8 = 2 * np.pi * np.mean((unit_radii * cos_8 - 8 * d_unit_radii * sin_8) / speeds, axis=-1)
+
+        r0s = perimeters / lengths
+        d_r0s = (d_perimeter - r0s * (d_lengths_d_c4 * d_c4 + d_lengths_d_c8 * d_c8)) / lengths
+
+        areas[start:start + CHUNK_SIZE] = np.pi * r0s**2 * (1 + (c4s[..., 0]**2 + c8s[..., 0]**2) / 2)
+
+        r0s, d_r0s, d_twist = r0s[..., np.newaxis], d_r0s[..., np.newaxis], d_twist[..., np.newaxis]
+
+        radii = r0s * unit_radii
+        d_radii_d_theta = r0s * d_unit_radii
+        d_radii_d_fraction = (d_r0s * unit_radii
+                              + r0s * (d_c4[..., np.newaxis] * cos_4 + d_c8[..., np.newaxis] * cos_8)
+                              + d_radii_d_theta * d_twist)
+
+        area_elements = np.sqrt(chunk['height'][..., np.newaxis]**2 * (radii**2 + d_radii_d_theta**2)
+                                + radii**2 * d_radii_d_fraction**2)
+
+        area_densities[start:start + CHUNK_SIZE] = 2 * np.pi * np.mean(area_elements, axis=-1)
+
+    return areas, area_densities
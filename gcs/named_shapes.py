@@ -8,6 +8,8 @@ class Cylinder(GCS):
 
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  height: float,
                  mass: float,
@@ -15,7 +17,11 @@ class Cylinder(GCS):
                  n_height_steps: int = 100,
                  theta_step: float = 0.01,
                  density: float = 0.0012,
-                 triangulate_caps: bool = True) -> None:
+                 triangulate_caps: bool = True,
+                 cap_triangulation: str = 'earcut',
+                 adaptive_tolerance: float = 0.0,
+                 vertex_dtype: str = 'float64',
+                 face_dtype: str = 'int64') -> None:
         """Initialize ``Cylinder``.
 
         Parameters
@@ -34,6 +40,14 @@ class Cylinder(GCS):
             Material density (g/mm^3).
         triangulate_caps : bool (default=`True`)
             Set to `True` to triangulate the top and bottom faces.
+        cap_triangulation : str (default=`'earcut'`)
+            Method used to triangulate the top and bottom faces (``'earcut'`` or ``'fan'``).
+        adaptive_tolerance : float (default=`0.0`)
+            Maximum chord deviation (mm) of curvature-adaptive sampling. Set to `0` to sample uniformly.
+        vertex_dtype : str (default=`'float64'`)
+            Data type of the vertex coordinates (``'float32'`` or ``'float64'``).
+        face_dtype : str (default=`'int64'`)
+            Data type of the face indices (``'int32'``, ``'int64'`` or ``'uint32'``).
 
         Examples
         --------
@@ -54,7 +68,11 @@ class Cylinder(GCS):
                          n_height_steps=n_height_steps,
                          theta_step=theta_step,
                          density=density,
-                         triangulate_caps=triangulate_caps)
+                         triangulate_caps=triangulate_caps,
+                         cap_triangulation=cap_triangulation,
+                         adaptive_tolerance=adaptive_tolerance,
+                         vertex_dtype=vertex_dtype,
+                         face_dtype=face_dtype)
 
 
 class Iroko(GCS):
@@ -64,11 +82,17 @@ class Iroko(GCS):
 
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  n_height_steps: int = 100,
                  theta_step: float = 0.01,
                  density: float = 0.0012,
-                 triangulate_caps: bool = True) -> None:
+                 triangulate_caps: bool = True,
+                 cap_triangulation: str = 'earcut',
+                 adaptive_tolerance: float = 0.0,
+                 vertex_dtype: str = 'float64',
+                 face_dtype: str = 'int64') -> None:
         """Initialize ``Iroko``.
 
         Parameters
@@ -81,6 +105,14 @@ class Iroko(GCS):
             Material density (g/mm^3).
         triangulate_caps : bool (default=`True`)
             Set to `True` to triangulate the top and bottom faces.
+        cap_triangulation : str (default=`'earcut'`)
+            Method used to triangulate the top and bottom faces (``'earcut'`` or ``'fan'``).
+        adaptive_tolerance : float (default=`0.0`)
+            Maximum chord deviation (mm) of curvature-adaptive sampling. Set to `0` to sample uniformly.
+        vertex_dtype : str (default=`'float64'`)
+            Data type of the vertex coordinates (``'float32'`` or ``'float64'``).
+        face_dtype : str (default=`'int64'`)
+            Data type of the face indices (``'int32'``, ``'int64'`` or ``'uint32'``).
 
         Examples
         --------
@@ -101,7 +133,11 @@ class Iroko(GCS):
                          n_height_steps=n_height_steps,
                          theta_step=theta_step,
                          density=density,
-                         triangulate_caps=triangulate_caps)
+                         triangulate_caps=triangulate_caps,
+                         cap_triangulation=cap_triangulation,
+                         adaptive_tolerance=adaptive_tolerance,
+                         vertex_dtype=vertex_dtype,
+                         face_dtype=face_dtype)
 
 
 class Willow(GCS):
@@ -111,11 +147,17 @@ class Willow(GCS):
 
     """
 
+    __slots__ = ()
+
     def __init__(self,
                  n_height_steps: int = 100,
                  theta_step: float = 0.01,
                  density: float = 0.0012,
-                 triangulate_caps: bool = True) -> None:
+                 triangulate_caps: bool = True,
+                 cap_triangulation: str = 'earcut',
+                 adaptive_tolerance: float = 0.0,
+                 vertex_dtype: str = 'float64',
+                 face_dtype: str = 'int64') -> None:
         """Initialize ``Willow``.
 
         Parameters
@@ -128,6 +170,14 @@ class Willow(GCS):
             Material density (g/mm^3).
         triangulate_caps : bool (default=`True`)
             Set to `True` to triangulate the top and bottom faces.
+        cap_triangulation : str (default=`'earcut'`)
+            Method used to triangulate the top and bottom faces (``'earcut'`` or ``'fan'``).
+        adaptive_tolerance : float (default=`0.0`)
+            Maximum chord deviation (mm) of curvature-adaptive sampling. Set to `0` to sample uniformly.
+        vertex_dtype : str (default=`'float64'`)
+            Data type of the vertex coordinates (``'float32'`` or ``'float64'``).
+        face_dtype : str (default=`'int64'`)
+            Data type of the face indices (``'int32'``, ``'int64'`` or ``'uint32'``).
 
         Examples
         --------
@@ -148,4 +198,8 @@ class Willow(GCS):
                          n_height_steps=n_height_steps,
                          theta_step=theta_step,
                          density=density,
-                         triangulate_caps=triangulate_caps)
+                         triangulate_caps=triangulate_caps,
+                         cap_triangulation=cap_triangulation,
+                         adaptive_tolerance=adaptive_tolerance,
+                         vertex_dtype=vertex_dtype,
+                         face_dtype=face_dtype)
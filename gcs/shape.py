@@ -1,21 +1,88 @@
 from __future__ import annotations
 
-from functools import cached_property
+from functools import wraps
 import json
+from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
 
-from .geometry.meshing import generate_vertices, generate_faces
+from .geometry.meshing import (CAP_TRIANGULATIONS,
+                               FACE_DTYPES,
+                               VERTEX_DTYPES,
+                               generate_vertices,
+                               generate_faces,
+                               iter_rings)
+from .geometry.regions import generate_band, generate_cross_section, generate_sector
+from .geometry.rings import Rings
+from .geometry.sampling import _adaptive_rings, uniform_resolution
 from .verify.verify import verify
 from .verify.verify_base_perimeter import verify_base_perimeter
 from .verify.verify_radius import verify_radius
 
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator
+
+# Parameter names, in ``GCS`` argument order
+PARAMETER_NAMES = (
+    'c4_base',
+    'c8_base',
+    'c4_top',
+    'c8_top',
+    'twist_linear',
+    'twist_amplitude',
+    'twist_cycles',
+    'perimeter_ratio',
+    'height',
+    'mass',
+    'thickness',
+    'n_height_steps',
+    'theta_step',
+    'density',
+    'triangulate_caps',
+    'cap_triangulation',
+    'adaptive_tolerance',
+)
+
+
+def _cached(method: Callable[[GCS], Any]) -> property:
+    """Turns a method into a read-only property whose value is cached in the shape's ``_cache``.
+
+    Parameters
+    ----------
+    method : Callable[[gcs.GCS], Any]
+        Method computing the value.
+
+    Returns
+    -------
+    cached : property
+        Cached property.
+
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def getter(self: GCS) -> Any:
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = self._cache[name] = method(self)
+
+            return value
+
+    return property(getter)
+
 
 class GCS:
     """Generalized cylindrical shell (GCS) class.
 
+    ``GCS`` objects are immutable and hashable. Use ``replace`` to create a shape
+    with modified parameters. Derived results (e.g., ``vertices``) are computed
+    once per shape and cached.
+
     """
 
+    __slots__ = tuple(f'{name}_' for name in PARAMETER_NAMES) + ('vertex_dtype_', 'face_dtype_', '_key', '_hash', '_cache')
+
     def __init__(self,
                  c4_base: float,
                  c8_base: float,
@@ -31,7 +98,11 @@ class GCS:
                  n_height_steps: int = 100,
                  theta_step: float = 0.01,
                  density: float = 0.0012,
-                 triangulate_caps: bool = True) -> None:
+                 triangulate_caps: bool = True,
+                 cap_triangulation: str = 'earcut',
+                 adaptive_tolerance: float = 0.0,
+                 vertex_dtype: str = 'float64',
+                 face_dtype: str = 'int64') -> None:
         """Initialize ``GCS``.
 
         Parameters
@@ -66,6 +137,21 @@ class GCS:
             Material density (g/mm^3).
         triangulate_caps : bool (default=`True`)
             Set to `True` to triangulate the top and bottom faces.
+        cap_triangulation : str (default=`'earcut'`)
+            Method used to triangulate the top and bottom faces. Supported methods:
+
+            - ``'earcut'``: Triangulate each cap outline with earcut.
+            - ``'fan'``: Connect each cap outline to a vertex at its centre.
+        adaptive_tolerance : float (default=`0.0`)
+            Maximum chord deviation (mm) used to select a curvature-adaptive subset of the
+            sampled cross-sections and angles (see ``gcs.geometry.adaptive_sampling``).
+            Set to `0` to sample uniformly.
+        vertex_dtype : str (default=`'float64'`)
+            Data type of the vertex coordinates (``'float32'`` or ``'float64'``).
+            Output option, not a shape parameter: it does not affect equality or hashing.
+        face_dtype : str (default=`'int64'`)
+            Data type of the face indices (``'int32'``, ``'int64'`` or ``'uint32'``).
+            Output option, not a shape parameter: it does not affect equality or hashing.
 
         Raises
         ------
@@ -73,6 +159,9 @@ class GCS:
             If ``n_height_steps`` is less than 2.
             If ``theta_step`` is not in the range (0,2π/3].
             If ``density`` is not positive.
+            If ``cap_triangulation`` is not a supported method.
+            If ``adaptive_tolerance`` is negative.
+            If ``vertex_dtype`` or ``face_dtype`` is not a supported data type.
 
         Examples
         --------
@@ -85,47 +174,195 @@ class GCS:
             raise ValueError(f'theta_step ({theta_step}) must be in range (0, 2π/3].')
         if density <= 0:
             raise ValueError(f'density ({density}) must be positive.')
+        if cap_triangulation not in CAP_TRIANGULATIONS:
+            raise ValueError(f'cap_triangulation ({cap_triangulation}) must be one of {CAP_TRIANGULATIONS}.')
+        if adaptive_tolerance < 0:
+            raise ValueError(f'adaptive_tolerance ({adaptive_tolerance}) must be non-negative.')
+        if vertex_dtype not in VERTEX_DTYPES:
+            raise ValueError(f'vertex_dtype ({vertex_dtype}) must be one of {VERTEX_DTYPES}.')
+        if face_dtype not in FACE_DTYPES:
+            raise ValueError(f'face_dtype ({face_dtype}) must be one of {FACE_DTYPES}.')
+
+        values = (c4_base, c8_base, c4_top, c8_top, twist_linear, twist_amplitude, twist_cycles,
+                  perimeter_ratio, height, mass, thickness, n_height_steps, theta_step, density,
+                  triangulate_caps, cap_triangulation, adaptive_tolerance)
+
+        for name, value in zip(PARAMETER_NAMES, values):
+            object.__setattr__(self, f'{name}_', value)
 
-        self.c4_base_ = c4_base
-        self.c8_base_ = c8_base
-        self.c4_top_ = c4_top
-        self.c8_top_ = c8_top
-        self.twist_linear_ = twist_linear
-        self.twist_amplitude_ = twist_amplitude
-        self.twist_cycles_ = twist_cycles
-        self.perimeter_ratio_ = perimeter_ratio
-        self.height_ = height
-        self.mass_ = mass
-        self.thickness_ = thickness
-        self.n_height_steps_ = n_height_steps
-        self.theta_step_ = theta_step
-        self.density_ = density
-        self.triangulate_caps_ = triangulate_caps
+        object.__setattr__(self, 'vertex_dtype_', vertex_dtype)
+        object.__setattr__(self, 'face_dtype_', face_dtype)
+
+        object.__setattr__(self, '_key', values)
+        object.__setattr__(self, '_hash', hash(values))
+        object.__setattr__(self, '_cache', {})
 
     @property
     def parameters(self) -> dict:
         """GCS parameters.
 
         """
-        return {
-            'c4_base': self.c4_base_,
-            'c8_base': self.c8_base_,
-            'c4_top': self.c4_top_,
-            'c8_top': self.c8_top_,
-            'twist_linear': self.twist_linear_,
-            'twist_amplitude': self.twist_amplitude_,
-            'twist_cycles': self.twist_cycles_,
-            'perimeter_ratio': self.perimeter_ratio_,
-            'height': self.height_,
-            'mass': self.mass_,
-            'thickness': self.thickness_,
-            'n_height_steps': self.n_height_steps_,
-            'theta_step': self.theta_step_,
-            'density': self.density_,
-            'triangulate_caps': self.triangulate_caps_,
-        }
+        return dict(zip(PARAMETER_NAMES, self._key))
 
-    @property
+    def replace(self, **changes: Any) -> GCS:
+        """Creates a new GCS with some parameters replaced.
+
+        Parameters
+        ----------
+        **changes : Any
+            Parameter values to replace, keyed by parameter name.
+
+        Returns
+        -------
+        shape : gcs.GCS
+            New GCS of the same class (e.g., ``gcs.Willow``) with the parameters (and
+            ``vertex_dtype`` and ``face_dtype``) of this shape updated by ``changes``.
+
+        Raises
+        ------
+        TypeError
+            If ``changes`` contains an unknown parameter name.
+
+        Examples
+        --------
+        >>> shape = gcs.Cylinder(height=25, mass=2, thickness=0.5)
+        >>> taller_shape = shape.replace(height=30)
+
+        """
+        # Named shapes take fewer arguments than ``GCS``, so the shape is initialized directly
+        shape = object.__new__(type(self))
+        GCS.__init__(shape, **(self.parameters | self._dtypes | changes))
+
+        return shape
+
+    def with_tolerance(self, tolerance: float) -> GCS:
+        """Creates a new GCS with the coarsest uniform resolution within a chord deviation tolerance.
+
+        Refer to ``gcs.geometry.uniform_resolution`` for full documentation.
+
+        Parameters
+        ----------
+        tolerance : float
+            Maximum chord deviation (mm).
+
+        Returns
+        -------
+        shape : gcs.GCS
+            New GCS with ``n_height_steps`` and ``theta_step`` replaced.
+
+        Examples
+        --------
+        >>> shape = gcs.Willow().with_tolerance(0.05)
+
+        """
+        n_height_steps, theta_step = uniform_resolution(shape=self, tolerance=tolerance)
+
+        return self.replace(n_height_steps=n_height_steps, theta_step=theta_step)
+
+    def iter_rings(self,
+                   chunk: int = 1,
+                   faces: bool = False) -> Iterator[np.ndarray] | Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Lazily generates the wall rings, ``chunk`` rings at a time.
+
+        Refer to ``gcs.geometry.iter_rings`` for full documentation.
+
+        Parameters
+        ----------
+        chunk : int (default=`1`)
+            Number of rings generated at a time.
+        faces : bool (default=`False`)
+            Set to `True` to also yield the side faces connecting each chunk to the previous rings.
+
+        Yields
+        ------
+        vertices : (chunk * T, 3) numpy.ndarray
+            Vertices of the chunk's rings.
+        faces : (M, 3) numpy.ndarray
+            If ``faces`` is `True`, side faces indexing the concatenated vertices of all chunks.
+
+        Examples
+        --------
+        >>> for vertices in gcs.Willow().iter_rings(chunk=10):
+        ...     pass
+
+        """
+        return iter_rings(shape=self, chunk=chunk, faces=faces)
+
+    def cross_section(self, z: float) -> np.ndarray:
+        """Cross-section at a height, evaluated without building the full mesh.
+
+        Refer to ``gcs.geometry.generate_cross_section`` for full documentation.
+
+        Parameters
+        ----------
+        z : float
+            Height (mm).
+
+        Returns
+        -------
+        vertices : (T, 3) numpy.ndarray
+            Vertices of the cross-section.
+
+        Examples
+        --------
+        >>> contour = gcs.Willow().cross_section(z=10)
+
+        """
+        return generate_cross_section(shape=self, z=z)
+
+    def band(self, z0: float, z1: float) -> tuple[np.ndarray, np.ndarray]:
+        """Wall mesh between two heights, evaluated without building the full mesh.
+
+        Refer to ``gcs.geometry.generate_band`` for full documentation.
+
+        Parameters
+        ----------
+        z0 : float
+            Bottom height (mm).
+        z1 : float
+            Top height (mm).
+
+        Returns
+        -------
+        vertices : (N, 3) numpy.ndarray
+            Vertices.
+        faces : (M, 3) numpy.ndarray
+            Faces.
+
+        Examples
+        --------
+        >>> vertices, faces = gcs.Willow().band(z0=5, z1=10)
+
+        """
+        return generate_band(shape=self, z0=z0, z1=z1)
+
+    def sector(self, theta0: float, theta1: float) -> tuple[np.ndarray, np.ndarray]:
+        """Wall mesh between two angles, evaluated without building the full mesh.
+
+        Refer to ``gcs.geometry.generate_sector`` for full documentation.
+
+        Parameters
+        ----------
+        theta0 : float
+            Start angle (rad).
+        theta1 : float
+            End angle (rad).
+
+        Returns
+        -------
+        vertices : (N, 3) numpy.ndarray
+            Vertices.
+        faces : (M, 3) numpy.ndarray
+            Faces.
+
+        Examples
+        --------
+        >>> vertices, faces = gcs.Willow().sector(theta0=0, theta1=np.pi / 2)
+
+        """
+        return generate_sector(shape=self, theta0=theta0, theta1=theta1)
+
+    @_cached
     def valid_base_perimeter(self) -> bool:
         """Checks whether the GCS has a sufficiently large base perimeter.
 
@@ -134,7 +371,7 @@ class GCS:
         """
         return verify_base_perimeter(shape=self)
 
-    @property
+    @_cached
     def valid_radius(self) -> bool:
         """Checks whether the minimum radius stays above a printable threshold.
 
@@ -143,7 +380,7 @@ class GCS:
         """
         return verify_radius(shape=self)
 
-    @property
+    @_cached
     def valid(self) -> bool:
         """Runs all verification checks for the GCS.
 
@@ -172,20 +409,72 @@ class GCS:
 
         return numerator / denominator
 
-    @cached_property
+    @_cached
+    def rings(self) -> Rings:
+        """Cross-sections sampled along the height.
+
+        Caches the intermediate results (scaling factors) shared by verification
+        and meshing. Refer to ``gcs.geometry.Rings`` for full documentation.
+
+        """
+        if self.adaptive_tolerance_ > 0:
+            return _adaptive_rings(shape=self, tolerance=self.adaptive_tolerance_)
+
+        return Rings(shape=self)
+
+    @_cached
     def vertices(self) -> np.ndarray:
         """Vertices.
 
         """
         return generate_vertices(shape=self)
 
-    @cached_property
+    @_cached
     def faces(self) -> np.ndarray:
         """Faces.
 
         """
         return generate_faces(shape=self)
 
+    @property
+    def _dtypes(self) -> dict[str, str]:
+        """Vertex and face data types, keyed by argument name.
+
+        """
+        return {'vertex_dtype': self.vertex_dtype_, 'face_dtype': self.face_dtype_}
+
+    def attach_mesh(self, vertices: np.ndarray, faces: np.ndarray) -> None:
+        """Attaches a precomputed mesh, returned by later ``vertices`` and ``faces`` lookups.
+
+        The mesh is assumed to be the mesh of this shape (e.g., loaded from
+        ``gcs.io.MeshCache``), and is converted to the shape's ``vertex_dtype`` and
+        ``face_dtype`` if needed. Vertices or faces that were already generated are kept.
+
+        Parameters
+        ----------
+        vertices : (N, 3) numpy.ndarray
+            Vertices.
+        faces : (M, 3) numpy.ndarray
+            Faces.
+
+        Raises
+        ------
+        ValueError
+            If ``vertices`` or ``faces`` does not have shape (N, 3).
+
+        Examples
+        --------
+        >>> shape = gcs.Iroko()
+        >>> shape.attach_mesh(vertices=np.load('vertices.npy'), faces=np.load('faces.npy'))
+
+        """
+        for name, array in (('vertices', vertices), ('faces', faces)):
+            if array.ndim != 2 or array.shape[1] != 3:
+                raise ValueError(f'{name} must have shape (N, 3), got {array.shape}.')
+
+        self._cache.setdefault('vertices', vertices.astype(self.vertex_dtype_, copy=False))
+        self._cache.setdefault('faces', faces.astype(self.face_dtype_, copy=False))
+
     def __str__(self):
         """Returns a string representation of the GCS parameters.
 
@@ -203,6 +492,8 @@ class GCS:
     def __eq__(self, other: object) -> bool:
         """Checks whether two GCS objects have the same parameters.
 
+        The vertex and face data types are output options and are not compared.
+
         Parameters
         ----------
         other : object
@@ -217,4 +508,65 @@ class GCS:
         if not isinstance(other, GCS):
             return False
 
-        return self.parameters == other.parameters
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        """Returns the precomputed hash of the GCS parameters.
+
+        """
+        return self._hash
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevents modification of GCS attributes.
+
+        Raises
+        ------
+        AttributeError
+            Always, since ``GCS`` objects are immutable.
+
+        """
+        raise AttributeError(f'{type(self).__name__} is immutable; use replace() to create a modified copy.')
+
+    def __delattr__(self, name: str) -> None:
+        """Prevents deletion of GCS attributes.
+
+        Raises
+        ------
+        AttributeError
+            Always, since ``GCS`` objects are immutable.
+
+        """
+        raise AttributeError(f'{type(self).__name__} is immutable; use replace() to create a modified copy.')
+
+    def __reduce__(self) -> tuple[Callable[..., GCS], tuple[type[GCS], tuple[Hashable, ...], dict[str, str]]]:
+        """Pickles the GCS by its class and parameters only, without cached results.
+
+        """
+        return _unpickle, (type(self), self._key, self._dtypes)
+
+
+def _unpickle(cls: type[GCS], key: tuple[Hashable, ...], dtypes: dict[str, str]) -> GCS:
+    """Rebuilds a pickled GCS, preserving named shape subclasses.
+
+    Named shapes take fewer arguments than ``GCS``, so the shape is initialized
+    directly from the full parameters.
+
+    Parameters
+    ----------
+    cls : type[gcs.GCS]
+        Class of the pickled shape.
+    key : tuple
+        GCS parameters, in ``PARAMETER_NAMES`` order.
+    dtypes : dict[str, str]
+        Vertex and face data types, keyed by argument name.
+
+    Returns
+    -------
+    shape : gcs.GCS
+        Unpickled shape.
+
+    """
+    shape = object.__new__(cls)
+    GCS.__init__(shape, *key, **dtypes)
+
+    return shape
@@ -0,0 +1,24 @@
+"""
+``gcs.sweep``
+=============
+
+Functions present in ``gcs.sweep`` are listed below.
+
+Sampling
+--------
+
+   sample_parameters
+
+Running sweeps
+--------------
+
+   run_sweep
+
+"""
+from .runner import run_sweep
+from .sampling import sample_parameters
+
+__all__ = [
+    'run_sweep',
+    'sample_parameters',
+]
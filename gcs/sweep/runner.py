@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+import os
+from pathlib import Path
+import shutil
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..batch import GCSBatch
+from ..io.columnar import _stored_parameters, save_columns
+from ..io.save import MESH_FORMATS, _save_mesh_job
+from ..verify.verify_radius import MIN_RADIUS
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from ..shape import GCS
+
+# Directory of the meshes saved by a sweep, inside the results store
+MESH_DIRECTORY = 'meshes'
+
+# Width of the mesh error messages stored in the results (longer messages are truncated)
+MESH_ERROR_WIDTH = 128
+
+# Maximum number of chunks submitted to the process pool per worker and not yet stored
+PENDING_CHUNKS_PER_WORKER = 2
+
+
+def run_sweep(directory: str | PathLike[str],
+              shapes: list[GCS] | GCSBatch,
+              chunk_size: int = 1000,
+              workers: int | None = None,
+              mesh_format: str | None = None) -> None:
+    """Evaluates GCS shapes across a process pool and streams the results to a columnar store.
+
+    Shapes are split into chunks of ``chunk_size`` shapes, and only the parameter
+    columns of each chunk are sent to the worker processes, which evaluate the whole
+    chunk with vectorized ``gcs.GCSBatch`` operations. Each chunk is appended to the
+    store (see ``gcs.io.save_columns``) as soon as it completes, so chunks are stored
+    in completion order. Chunks are submitted as earlier ones are stored, with at most
+    ``PENDING_CHUNKS_PER_WORKER`` chunks per worker pending, so memory does not grow
+    with the number of shapes. The store contains the parameter columns (see
+    ``gcs.io.load_parameters_columnar``) and the following columns:
+
+    - ``index``: Index of the shape in ``shapes``.
+    - ``valid``, ``valid_base_perimeter``, ``valid_radius``: Verification results.
+    - ``base_perimeter``, ``top_perimeter``: Perimeters (mm).
+    - ``min_radius``: Minimum radius (mm) of the base and top cross-sections.
+    - ``meshed``: Whether the mesh was saved, if ``mesh_format`` is given.
+    - ``mesh_error``: Error raised while saving the mesh (empty if none), truncated
+      to ``MESH_ERROR_WIDTH`` characters, if ``mesh_format`` is given.
+
+    Parameters
+    ----------
+    directory : {str, PathLike[str]}
+        Store directory. Created if it does not exist, and replaced if it does,
+        including the meshes saved by an earlier sweep.
+    shapes : {list[gcs.GCS], gcs.GCSBatch}
+        GCS shapes to evaluate.
+    chunk_size : int (default=`1000`)
+        Number of shapes evaluated per task.
+    workers : int (default=`None`)
+        Number of worker processes. If `None`, the number of processors is used.
+        If 1, shapes are evaluated in the current process.
+    mesh_format : {str, None} (default=`None`)
+        Mesh file format (see ``gcs.io.save_meshes``). If given, the meshes of valid
+        shapes are saved to ``<directory>/meshes/shape_<index>.<mesh_format>``, with
+        the index zero-padded to 6 digits.
+
+    Raises
+    ------
+    ValueError
+        If ``chunk_size`` is less than 1.
+        If ``mesh_format`` is not supported.
+
+    Examples
+    --------
+    >>> shapes = gcs.sweep.sample_parameters(ranges={'c4_base': (-0.5, 0.5)}, n_samples=1024, seed=0, c8_base=0, c4_top=0, c8_top=0, twist_linear=0, twist_amplitude=0, twist_cycles=0, perimeter_ratio=1, height=25, mass=2, thickness=0.5)
+    >>> gcs.sweep.run_sweep(directory='sweep', shapes=shapes, workers=4)
+    >>> results = gcs.io.load_columns(directory='sweep', names=['index', 'valid'])
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size ({chunk_size}) must be at least 1.')
+    if mesh_format is not None and mesh_format not in MESH_FORMATS:
+        raise ValueError(f'mesh_format ({mesh_format}) must be one of {MESH_FORMATS}.')
+
+    if not isinstance(shapes, GCSBatch):
+        shapes = GCSBatch.from_shapes(shapes)
+
+    directory = Path(directory)
+
+    # Meshes of an earlier sweep would be mistaken for meshes of the replaced results
+    shutil.rmtree(directory / MESH_DIRECTORY, ignore_errors=True)
+
+    mesh_directory = None
+    if mesh_format is not None:
+        mesh_directory = directory / MESH_DIRECTORY
+        mesh_directory.mkdir(parents=True, exist_ok=True)
+
+    jobs = (
+        (shapes[start:start + chunk_size].parameters, start, mesh_directory, mesh_format)
+        for start in range(0, len(shapes), chunk_size)
+    )
+
+    # An empty store is written first, so that every chunk is appended
+    save_columns(directory=directory, columns=_evaluate_chunk(shapes[:0].parameters, 0, mesh_directory, mesh_format))
+
+    if workers == 1:
+        for job in jobs:
+            save_columns(directory=directory, columns=_evaluate_chunk(*job), append=True)
+
+        return
+
+    max_pending = PENDING_CHUNKS_PER_WORKER * (workers or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+
+        for job in jobs:
+            # Completed chunks are stored and released before more chunks are submitted
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    save_columns(directory=directory, columns=future.result(), append=True)
+
+            pending.add(executor.submit(_evaluate_chunk, *job))
+
+        for future in as_completed(pending):
+            save_columns(directory=directory, columns=future.result(), append=True)
+
+
+def _evaluate_chunk(parameters: dict[str, np.ndarray],
+                    start: int,
+                    mesh_directory: Path | None,
+                    mesh_format: str | None) -> dict[str, np.ndarray]:
+    """Evaluates a chunk of GCS shapes (worker process entry point).
+
+    Parameters
+    ----------
+    parameters : dict[str, numpy.ndarray]
+        GCS parameter columns.
+    start : int
+        Index of the first shape of the chunk.
+    mesh_directory : {pathlib.Path, None}
+        Output directory of the meshes, if ``mesh_format`` is given.
+    mesh_format : {str, None}
+        Mesh file format. Meshes are not saved and the ``meshed`` and ``mesh_error``
+        columns are omitted if `None`.
+
+    Returns
+    -------
+    columns : dict[str, numpy.ndarray]
+        Result columns.
+
+    """
+    batch = GCSBatch(**parameters)
+
+    min_radius = batch.min_radius
+    valid_base_perimeter = batch.valid_base_perimeter
+    valid_radius = min_radius >= MIN_RADIUS
+
+    columns = {
+        'index': np.arange(start=start, stop=start + len(batch), dtype=np.int64),
+        **_stored_parameters(shapes=batch),
+        'valid': valid_base_perimeter & valid_radius,
+        'valid_base_perimeter': valid_base_perimeter,
+        'valid_radius': valid_radius,
+        'base_perimeter': batch.base_perimeter,
+        'top_perimeter': batch.top_perimeter,
+        'min_radius': min_radius,
+    }
+
+    if mesh_format is not None:
+        meshed = np.zeros(shape=len(batch), dtype=bool)
+        mesh_error = np.zeros(shape=len(batch), dtype=f'U{MESH_ERROR_WIDTH}')
+
+        # Failures are recorded in the results instead of stopping the sweep
+        for offset in np.flatnonzero(columns['valid']):
+            file = mesh_directory / f'shape_{start + offset:06d}.{mesh_format}'
+            try:
+                _save_mesh_job(batch[offset], file, mesh_format)
+                meshed[offset] = True
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                mesh_error[offset] = f'{type(error).__name__}: {error}'[:MESH_ERROR_WIDTH]
+
+        columns['meshed'] = meshed
+        columns['mesh_error'] = mesh_error
+
+    return columns
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from scipy.stats import qmc
+
+from ..batch import PARAMETER_DTYPES, GCSBatch
+
+if TYPE_CHECKING:
+    from numpy.random import Generator
+
+# Supported sampling methods
+SAMPLING_METHODS = ('grid', 'lhs', 'sobol')
+
+
+def sample_parameters(ranges: dict[str, tuple[float, float]],
+                      n_samples: int,
+                      method: str = 'sobol',
+                      seed: int | Generator | None = None,
+                      **fixed: Any) -> GCSBatch:
+    """Samples GCS parameters over ranges.
+
+    Parameters
+    ----------
+    ranges : dict[str, tuple[float, float]]
+        Lower and upper bounds of the sampled parameters, keyed by parameter name.
+        Only numeric parameters can be sampled. Integer parameters are rounded.
+    n_samples : int
+        Number of samples. For ``'grid'``, the number of evenly spaced values of
+        each parameter, so that ``n_samples ** len(ranges)`` shapes are sampled.
+    method : str (default=`'sobol'`)
+        Sampling method. Supported methods:
+
+        - ``'grid'``: Full factorial grid.
+        - ``'lhs'``: Latin hypercube sampling.
+        - ``'sobol'``: Scrambled Sobol sequence. Balance properties require
+          ``n_samples`` to be a power of 2.
+    seed : {int, numpy.random.Generator, None} (default=`None`)
+        Seed of the ``'lhs'`` and ``'sobol'`` samplers.
+    **fixed : Any
+        Values of the parameters that are not sampled, keyed by parameter name.
+
+    Returns
+    -------
+    shapes : gcs.GCSBatch
+        Sampled GCS shapes.
+
+    Raises
+    ------
+    ValueError
+        If ``method`` is not a supported method.
+        If ``n_samples`` is less than 1.
+        If ``ranges`` is empty.
+        If a range is not a numeric GCS parameter, is also fixed, or has a lower
+        bound greater than its upper bound.
+
+    Examples
+    --------
+    >>> ranges = {'c4_base': (-0.5, 0.5), 'c4_top': (-0.5, 0.5), 'twist_linear': (0, np.pi)}
+    >>> shapes = gcs.sweep.sample_parameters(ranges=ranges, n_samples=1024, method='sobol', seed=0, c8_base=0, c8_top=0, twist_amplitude=0, twist_cycles=0, perimeter_ratio=1, height=25, mass=2, thickness=0.5)
+
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f'method ({method}) must be one of {SAMPLING_METHODS}.')
+    if n_samples < 1:
+        raise ValueError(f'n_samples ({n_samples}) must be at least 1.')
+    if not ranges:
+        raise ValueError('ranges must contain at least one parameter.')
+
+    for name, (low, high) in ranges.items():
+        if PARAMETER_DTYPES.get(name) not in (int, float):
+            raise ValueError(f'{name} is not a numeric GCS parameter.')
+        if name in fixed:
+            raise ValueError(f'{name} cannot be both sampled and fixed.')
+        if low > high:
+            raise ValueError(f'{name} lower bound ({low}) must not be greater than its upper bound ({high}).')
+
+    lows, highs = np.array(list(ranges.values()), dtype=float).reshape(-1, 2).T
+
+    if method == 'grid':
+        axes = np.linspace(start=lows, stop=highs, num=n_samples, axis=-1)
+        samples = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, len(ranges))
+    else:
+        if method == 'lhs':
+            sampler = qmc.LatinHypercube(d=len(ranges), seed=seed)
+        else:
+            sampler = qmc.Sobol(d=len(ranges), scramble=True, seed=seed)
+
+        # Unit samples are scaled to the ranges (zero-width ranges stay fixed)
+        samples = lows + sampler.random(n=n_samples) * (highs - lows)
+
+    columns = {
+        name: np.round(column) if PARAMETER_DTYPES[name] is int else column
+        for name, column in zip(ranges, samples.T)
+    }
+
+    return GCSBatch(**(fixed | columns))
@@ -4,8 +4,8 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from ..geometry.polar_curves import optimal_scaling_factor
-from ..geometry.summed_cosine import summed_cosine
+from ..geometry.polar_curves import optimal_scaling_factors
+from ..geometry.summed_cosine import min_summed_cosine
 
 if TYPE_CHECKING:
     from ..shape import GCS
@@ -14,31 +14,40 @@ if TYPE_CHECKING:
 MIN_RADIUS = 0.01
 
 
-def min_radius(thetas: np.ndarray, perimeter: float, c4: float, c8: float) -> float:
-    """Computes the minimum radius of a summed cosine polar equation.
+def min_radius(thetas: np.ndarray,
+               perimeter: float | np.ndarray,
+               c4: float | np.ndarray,
+               c8: float | np.ndarray) -> float | np.ndarray:
+    """Computes the exact minimum radius of a summed cosine polar equation.
+
+    The scaling factor is solved in closed form from the target perimeter and the
+    minimum is found analytically (see ``gcs.geometry.min_summed_cosine``), so the
+    radius is not evaluated at ``thetas``, which only set the perimeter discretization.
 
     Parameters
     ----------
     thetas : (N,) numpy.ndarray
-        Angles.
-    perimeter : float
-        Target perimeter.
-    c4 : float
-        4-lobe parameter.
-    c8 : float
-        8-lobe parameter.
-        
+        Angles used to compute the perimeter.
+    perimeter : {float, (M,) numpy.ndarray}
+        Target perimeter(s).
+    c4 : {float, (M,) numpy.ndarray}
+        4-lobe parameter(s).
+    c8 : {float, (M,) numpy.ndarray}
+        8-lobe parameter(s).
+
     Returns
     -------
-    r : float
-        Minimum radius.
+    r : {float, (M,) numpy.ndarray}
+        Minimum radius (radii).
 
     """
-    r0 = optimal_scaling_factor(length=perimeter, c4=c4, c8=c8, n_steps=thetas.size)
+    shape = np.broadcast(perimeter, c4, c8).shape
+
+    perimeter, c4, c8 = (np.broadcast_to(value, shape).reshape(-1) for value in (perimeter, c4, c8))
 
-    rs = summed_cosine(theta=thetas, r0=r0, c4=c4, c8=c8)
+    r0 = optimal_scaling_factors(lengths=perimeter, c4s=c4, c8s=c8, n_steps=thetas.size)
 
-    return np.min(rs)
+    return min_summed_cosine(r0=r0, c4=c4, c8=c8).reshape(shape)[()]
 
 
 def verify_radius(shape: GCS) -> bool:
@@ -64,20 +73,13 @@ def verify_radius(shape: GCS) -> bool:
     True
 
     """
-    parameters = shape.parameters
-
-    thetas = np.arange(start=0, stop=2 * np.pi, step=parameters['theta_step'])
-
-    min_base_r = min_radius(thetas=thetas,
-                            perimeter=shape.base_perimeter,
-                            c4=parameters['c4_base'],
-                            c8=parameters['c8_base'])
+    rings = shape.rings
 
-    min_top_r = min_radius(thetas=thetas,
-                           perimeter=shape.top_perimeter,
-                           c4=parameters['c4_top'],
-                           c8=parameters['c8_top'])
+    # Base and top rings
+    ends = np.array([0, -1])
 
-    min_r = np.min([min_base_r, min_top_r])
+    min_r = np.min(min_summed_cosine(r0=rings.scaling_factors(rings=ends),
+                                     c4=rings.c4s_[ends],
+                                     c8=rings.c8s_[ends]))
 
     return min_r >= MIN_RADIUS
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import raises
+
+from gcs import GCS, GCSBatch, Cylinder, Iroko, Willow
+from gcs.batch import PARAMETER_DTYPES
+from gcs.shape import PARAMETER_NAMES
+from gcs.verify.verify_radius import MIN_RADIUS
+from tests.constants import ATOL
+
+
+def test_gcs_batch() -> None:
+    """Tests for ``gcs.GCSBatch``.
+
+    """
+    shapes = [
+        Iroko(n_height_steps=5, theta_step=0.1),
+        Willow(n_height_steps=5, theta_step=0.1),
+        Cylinder(height=25, mass=2, thickness=0.5, n_height_steps=5, theta_step=0.1),
+        Cylinder(height=25, mass=0.1, thickness=0.5, n_height_steps=5, theta_step=0.1),
+        Cylinder(height=250, mass=0.001, thickness=0.5, n_height_steps=5, theta_step=0.1),
+    ]
+    batch = GCSBatch.from_shapes(shapes)
+
+    # Container
+    assert len(batch) == len(shapes)
+    assert list(batch) == shapes
+    assert batch[1] == shapes[1]
+    assert isinstance(batch[np.int64(1)], GCS)
+    assert list(batch[1:3]) == shapes[1:3]
+    assert list(batch[np.array([True, False, True, False, False])]) == [shapes[0], shapes[2]]
+
+    assert list(batch.parameters) == list(PARAMETER_NAMES)
+
+    for name, column in batch.parameters.items():
+        assert column.shape == (len(shapes),)
+        assert column.dtype.kind == np.dtype(PARAMETER_DTYPES[name]).kind
+        assert list(column) == [shape.parameters[name] for shape in shapes]
+
+    # Properties
+    np.testing.assert_allclose(actual=batch.base_perimeter,
+                               desired=[shape.base_perimeter for shape in shapes],
+                               atol=ATOL)
+    np.testing.assert_allclose(actual=batch.top_perimeter,
+                               desired=[shape.top_perimeter for shape in shapes],
+                               atol=ATOL)
+    np.testing.assert_array_equal(batch.valid_base_perimeter,
+                                  [shape.valid_base_perimeter for shape in shapes])
+    np.testing.assert_array_equal(batch.valid_radius, [shape.valid_radius for shape in shapes])
+    np.testing.assert_array_equal(batch.valid_radius, batch.min_radius >= MIN_RADIUS)
+    np.testing.assert_array_equal(batch.valid, [shape.valid for shape in shapes])
+    np.testing.assert_array_equal(batch.valid, [True, True, True, False, False])
+
+    vertices = batch.vertices
+
+    assert vertices.shape == (len(shapes),) + shapes[0].vertices.shape
+    for shape_vertices, shape in zip(vertices, shapes):
+        np.testing.assert_allclose(actual=shape_vertices, desired=shape.vertices, atol=1e-9)
+
+    # Broadcast scalar parameters
+    batch = GCSBatch(c4_base=[0.3, 0.1, 0.0],
+                     c8_base=-0.2,
+                     c4_top=0.4,
+                     c8_top=-0.1,
+                     twist_linear=1.2,
+                     twist_amplitude=0.1,
+                     twist_cycles=2.0,
+                     perimeter_ratio=1.3,
+                     height=25,
+                     mass=2,
+                     thickness=0.5,
+                     theta_step=[0.1, 0.2, 0.1])
+
+    assert len(batch) == 3
+    assert batch[2] == GCS(c4_base=0.0,
+                           c8_base=-0.2,
+                           c4_top=0.4,
+                           c8_top=-0.1,
+                           twist_linear=1.2,
+                           twist_amplitude=0.1,
+                           twist_cycles=2.0,
+                           perimeter_ratio=1.3,
+                           height=25,
+                           mass=2,
+                           thickness=0.5,
+                           theta_step=0.1)
+    np.testing.assert_array_equal(batch.valid, [shape.valid for shape in batch])
+
+    # Mixed resolutions
+    with raises(expected_exception=ValueError):
+        _ = batch.vertices
+
+    # Fan-triangulated caps add the cap centres
+    shapes = [shape.replace(cap_triangulation='fan') for shape in shapes]
+    batch = GCSBatch.from_shapes(shapes)
+
+    for shape_vertices, shape in zip(batch.vertices, shapes):
+        np.testing.assert_allclose(actual=shape_vertices, desired=shape.vertices, atol=1e-9)
+
+    with raises(expected_exception=ValueError):
+        _ = GCSBatch.from_shapes([shapes[0], shapes[1].replace(cap_triangulation='earcut')]).vertices
+
+    # Vertex and face data types are shared by the batch
+    batch = GCSBatch.from_shapes(shapes, vertex_dtype='float32', face_dtype='uint32')
+
+    assert batch.vertices.dtype == np.float32
+    np.testing.assert_allclose(actual=batch.vertices[0], desired=shapes[0].vertices, rtol=1e-6)
+    assert batch[0].vertex_dtype_ == 'float32'
+    assert batch[:2][0].face_dtype_ == 'uint32'
+
+    # Adaptively sampled shapes have different numbers of vertices
+    with raises(expected_exception=ValueError):
+        _ = GCSBatch.from_shapes([shapes[0].replace(adaptive_tolerance=0.1)]).vertices
+
+    # Empty batch
+    batch = GCSBatch.from_shapes([])
+
+    assert len(batch) == 0
+    assert batch.valid.shape == (0,)
+
+    # Invalid parameter shape
+    parameters = shapes[0].parameters
+
+    with raises(expected_exception=ValueError):
+        GCSBatch(**parameters)
+
+    # Invalid number of height steps
+    with raises(expected_exception=ValueError):
+        GCSBatch(**(parameters | {'c4_base': [0.1, 0.2], 'n_height_steps': [2, 1]}))
+
+    # Invalid theta step
+    with raises(expected_exception=ValueError):
+        GCSBatch(**(parameters | {'c4_base': [0.1, 0.2], 'theta_step': [0.1, 0.0]}))
+
+    # Invalid density
+    with raises(expected_exception=ValueError):
+        GCSBatch(**(parameters | {'c4_base': [0.1, 0.2], 'density': [0.0, 0.1]}))
+
+    # Invalid cap triangulation
+    with raises(expected_exception=ValueError):
+        GCSBatch(**(parameters | {'c4_base': [0.1, 0.2], 'cap_triangulation': ['fan', 'strip']}))
+
+    # Invalid adaptive tolerance
+    with raises(expected_exception=ValueError):
+        GCSBatch(**(parameters | {'c4_base': [0.1, 0.2], 'adaptive_tolerance': [0.1, -0.1]}))
+
+    # Invalid data types
+    with raises(expected_exception=ValueError):
+        GCSBatch(**(parameters | {'c4_base': [0.1, 0.2], 'vertex_dtype': 'float16'}))
+
+    with raises(expected_exception=ValueError):
+        GCSBatch(**(parameters | {'c4_base': [0.1, 0.2], 'face_dtype': 'uint8'}))
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
+from pytest import approx, raises
 
-from gcs import Cylinder
-from gcs.geometry.meshing import generate_faces, generate_vertices
+from gcs import Cylinder, Willow
+from gcs.geometry.meshing import (_side_faces,
+                                  generate_faces,
+                                  generate_lod,
+                                  generate_lods,
+                                  generate_vertices,
+                                  iter_rings,
+                                  mesh_size)
+from gcs.geometry.polar_curves import optimal_scaling_factor
+from gcs.geometry.summed_cosine import summed_cosine
 from ..constants import ATOL
 
 
@@ -41,8 +52,33 @@ def test_generate_vertices() -> None:
                                desired=np.hypot(upper[0], upper[1]),
                                atol=ATOL)
 
+    # Lobed and twisted cross-sections
+    shape = Willow(n_height_steps=4, theta_step=0.1)
+    parameters = shape.parameters
+
+    vertices = generate_vertices(shape=shape).reshape((parameters['n_height_steps'], -1, 3))
+
+    thetas = np.arange(start=0, stop=2 * np.pi, step=parameters['theta_step'])
+    fractions = np.linspace(start=0, stop=1, num=parameters['n_height_steps'])
+
+    for step, fraction in enumerate(fractions):
+        c4 = parameters['c4_base'] + fraction * (parameters['c4_top'] - parameters['c4_base'])
+        c8 = parameters['c8_base'] + fraction * (parameters['c8_top'] - parameters['c8_base'])
+        perimeter = shape.base_perimeter + fraction * (shape.top_perimeter - shape.base_perimeter)
+        twist = (parameters['twist_linear'] * fraction
+                 + parameters['twist_amplitude'] * np.sin(2 * np.pi * parameters['twist_cycles'] * fraction))
 
-def test_generate_faces() -> None:
+        r0 = optimal_scaling_factor(length=perimeter, c4=c4, c8=c8, n_steps=thetas.size)
+        r = summed_cosine(theta=thetas + twist, r0=r0, c4=c4, c8=c8)
+
+        np.testing.assert_allclose(actual=vertices[step, :, 0], desired=r * np.cos(thetas), atol=1e-9)
+        np.testing.assert_allclose(actual=vertices[step, :, 1], desired=r * np.sin(thetas), atol=1e-9)
+        np.testing.assert_allclose(actual=vertices[step, :, 2],
+                                   desired=fraction * parameters['height'],
+                                   atol=1e-9)
+
+
+def test_generate_faces(monkeypatch) -> None:
     """Tests for ``gcs.geometry.generate_faces``.
 
     """
@@ -71,3 +107,249 @@ def test_generate_faces() -> None:
     lower = faces[1]
 
     np.testing.assert_array_equal(lower, np.array([1, n_vertices_per_step, 0]))
+
+    # Side faces are shared between shapes of the same resolution
+    other_shape = shape.replace(height=30, c4_base=0.2)
+
+    assert generate_faces(shape=other_shape) is faces
+    assert not faces.flags.writeable
+
+    # Caps are triangulated for each shape
+    capped_faces = generate_faces(shape=shape.replace(triangulate_caps=True))
+
+    np.testing.assert_array_equal(capped_faces[:faces.shape[0]], faces)
+    assert capped_faces.flags.writeable
+    assert np.max(capped_faces) == vertices.size // 3 - 1
+
+    # Fan-triangulated caps share the whole topology
+    fan_shape = shape.replace(triangulate_caps=True, cap_triangulation='fan')
+    fan_faces = generate_faces(shape=fan_shape)
+    fan_vertices = generate_vertices(shape=fan_shape)
+
+    assert generate_faces(shape=fan_shape.replace(c4_base=0.2)) is fan_faces
+    assert not fan_faces.flags.writeable
+    assert fan_vertices.shape[0] == vertices.size // 3 + 2
+    assert np.max(fan_faces) == fan_vertices.shape[0] - 1
+    np.testing.assert_array_equal(fan_faces[:faces.shape[0]], faces)
+    np.testing.assert_allclose(actual=fan_vertices[-2:],
+                               desired=[[0, 0, 0], [0, 0, parameters['height']]],
+                               atol=ATOL)
+
+    # Shared face templates are bounded by their total size
+    _side_faces.cache_clear()
+
+    template = _side_faces(n_height_steps=5, n_vertices_per_step=10)
+    monkeypatch.setattr('gcs.geometry.meshing.FACE_CACHE_MAX_BYTES', template.nbytes)
+
+    assert _side_faces(n_height_steps=5, n_vertices_per_step=10) is template
+
+    # Templates larger than the limit are not cached
+    large_template = _side_faces(n_height_steps=6, n_vertices_per_step=10)
+
+    assert _side_faces(n_height_steps=6, n_vertices_per_step=10) is not large_template
+    assert _side_faces(n_height_steps=5, n_vertices_per_step=10) is template
+
+    # Least recently used templates are evicted
+    _side_faces(n_height_steps=3, n_vertices_per_step=10)
+
+    assert _side_faces(n_height_steps=5, n_vertices_per_step=10) is not template
+
+    _side_faces.cache_clear()
+
+    # Fan caps face outwards and cover the same area as earcut caps
+    n_side_faces = faces.shape[0]
+
+    def cap_normals(faces: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+        triangles = vertices[faces[n_side_faces:]]
+
+        return np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+
+    fan_normals = cap_normals(faces=fan_faces, vertices=fan_vertices)
+    earcut_normals = cap_normals(faces=capped_faces, vertices=vertices.reshape(-1, 3))
+
+    assert np.all(fan_normals[:n_vertices_per_step, 2] < 0)
+    assert np.all(fan_normals[n_vertices_per_step:, 2] > 0)
+    assert np.sum(fan_normals[:, 2]) == approx(expected=np.sum(earcut_normals[:, 2]), abs=ATOL)
+    assert np.sum(np.abs(fan_normals[:, 2])) == approx(expected=np.sum(np.abs(earcut_normals[:, 2])), abs=1e-6)
+
+
+def test_generate_lods() -> None:
+    """Tests for ``gcs.geometry.generate_lod`` and ``gcs.geometry.generate_lods``.
+
+    """
+    shape = Willow(n_height_steps=10, theta_step=0.1)
+
+    # Coarse levels only solve their own rings
+    coarse_vertices, coarse_faces = generate_lod(shape=shape, level=2)
+
+    np.testing.assert_array_equal(np.isnan(shape.rings._scaling_factors), ~np.isin(np.arange(10), [0, 4, 8, 9]))
+
+    # Levels from the coarsest to the finest
+    meshes = generate_lods(shape=shape, n_levels=3, factor=2)
+
+    assert meshes[-1][0] is shape.vertices
+    assert meshes[-1][1] is shape.faces
+    np.testing.assert_array_equal(meshes[0][0], coarse_vertices)
+    np.testing.assert_array_equal(meshes[0][1], coarse_faces)
+
+    vertices = shape.vertices.reshape(10, -1, 3)
+    n_thetas = vertices.shape[1]
+
+    for level, (level_vertices, level_faces) in zip((2, 1), meshes[:-1]):
+        step = 2**level
+        rings = np.unique(np.append(np.arange(0, 10, step), 9))
+        thetas = np.arange(0, n_thetas, step)
+
+        # Exact subsamples of the finest level
+        np.testing.assert_array_equal(level_vertices, vertices[rings][:, thetas].reshape(-1, 3))
+
+        assert np.max(level_faces) == level_vertices.shape[0] - 1
+        assert level_faces.shape[0] == 2 * (rings.size - 1) * thetas.size + 2 * (thetas.size - 2)
+
+    # Coarse levels keep at least 3 angles and fan caps
+    shape = Willow(n_height_steps=10, theta_step=1.0, cap_triangulation='fan')
+
+    vertices, faces = generate_lod(shape=shape, level=3, factor=2)
+
+    assert vertices.shape == (3 * 4 + 2, 3)
+    assert np.max(faces) == vertices.shape[0] - 1
+
+    # Invalid levels
+    with raises(expected_exception=ValueError):
+        generate_lods(shape=shape, n_levels=0)
+    with raises(expected_exception=ValueError):
+        generate_lod(shape=shape, level=-1)
+    with raises(expected_exception=ValueError):
+        generate_lod(shape=shape, level=1, factor=1)
+
+
+def test_iter_rings() -> None:
+    """Tests for ``gcs.geometry.iter_rings``.
+
+    """
+    shape = Willow(n_height_steps=11, theta_step=0.1, triangulate_caps=False)
+    n_thetas = shape.rings.thetas_.size
+
+    # Vertices only
+    chunks = list(iter_rings(shape=Willow(n_height_steps=11, theta_step=0.1), chunk=1))
+    assert len(chunks) == 11
+    assert all(chunk.shape == (n_thetas, 3) for chunk in chunks)
+    assert np.allclose(np.vstack(chunks), shape.vertices, rtol=0, atol=ATOL)
+
+    # Vertices and face strips
+    for chunk in (1, 3, 11, 20):
+        chunks = list(shape.iter_rings(chunk=chunk, faces=True))
+        assert len(chunks) == -(-11 // chunk)
+        assert all(vertices.shape[0] <= chunk * n_thetas for vertices, _ in chunks)
+
+        vertices = np.vstack([vertices for vertices, _ in chunks])
+        faces = np.vstack([faces for _, faces in chunks])
+        assert np.allclose(vertices, shape.vertices, rtol=0, atol=ATOL)
+        assert faces.shape == shape.faces.shape
+        assert {tuple(face) for face in faces.tolist()} == {tuple(face) for face in shape.faces.tolist()}
+
+    # Invalid chunks are rejected on call
+    with raises(ValueError):
+        iter_rings(shape=shape, chunk=0)
+    with raises(ValueError):
+        shape.iter_rings(chunk=0)
+
+
+def test_mesh_dtypes() -> None:
+    """Tests for the vertex and face data types of ``gcs.geometry`` meshes.
+
+    """
+    for cap_triangulation in ('earcut', 'fan'):
+        shape = Willow(n_height_steps=11, theta_step=0.1, cap_triangulation=cap_triangulation)
+
+        for vertex_dtype in ('float32', 'float64'):
+            for face_dtype in ('int32', 'int64', 'uint32'):
+                typed_shape = shape.replace(vertex_dtype=vertex_dtype, face_dtype=face_dtype)
+
+                vertices = generate_vertices(shape=typed_shape)
+                faces = generate_faces(shape=typed_shape)
+
+                assert vertices.dtype == vertex_dtype
+                assert faces.dtype == face_dtype
+                assert np.allclose(vertices, shape.vertices, rtol=1e-6, atol=1e-5)
+                assert np.array_equal(faces, shape.faces)
+
+                # Meshing functions override the shape's data types
+                assert generate_vertices(shape=shape, dtype=vertex_dtype).dtype == vertex_dtype
+                assert generate_faces(shape=shape, dtype=face_dtype).dtype == face_dtype
+
+        # Levels of detail and ring chunks keep the data types
+        typed_shape = shape.replace(vertex_dtype='float32', face_dtype='uint32')
+        vertices, faces = generate_lod(shape=typed_shape, level=1)
+        assert vertices.dtype == np.float32
+        assert faces.dtype == np.uint32
+
+        for vertices, faces in iter_rings(shape=typed_shape, chunk=4, faces=True):
+            assert vertices.dtype == np.float32
+            assert faces.dtype == np.uint32
+
+    # Unsupported data types
+    with raises(ValueError):
+        generate_vertices(shape=shape, dtype=np.float16)
+    with raises(ValueError):
+        generate_faces(shape=shape, dtype=np.int16)
+
+    # Too many vertices for the face data type
+    shape = Cylinder(height=25, mass=2, thickness=0.5, n_height_steps=50000, theta_step=0.0001, face_dtype='int32')
+    with raises(ValueError):
+        generate_faces(shape=shape)
+
+
+def test_mesh_out() -> None:
+    """Tests for the ``out`` arrays of ``gcs.geometry.generate_vertices`` and ``gcs.geometry.generate_faces``.
+
+    """
+    file = Path(__file__).resolve().parent / 'arena.npy'
+
+    shapes = [
+        Willow(n_height_steps=11, theta_step=0.1),
+        Willow(n_height_steps=11, theta_step=0.1, cap_triangulation='fan'),
+        Willow(n_height_steps=11, theta_step=0.1, triangulate_caps=False),
+    ]
+
+    try:
+        for shape in shapes:
+            n_vertices, n_faces = mesh_size(shape=shape)
+            assert shape.vertices.shape == (n_vertices, 3)
+            assert shape.faces.shape == (n_faces, 3)
+
+            # Slices of a shared file-backed arena
+            arena = np.lib.format.open_memmap(file, mode='w+', dtype=np.float32, shape=(2, n_vertices, 3))
+            faces_arena = np.zeros(shape=(2 * n_faces + 1, 3), dtype=np.uint32)
+
+            for index in range(2):
+                vertices = generate_vertices(shape=shape, out=arena[index])
+                faces = generate_faces(shape=shape, out=faces_arena[index * n_faces:(index + 1) * n_faces])
+
+                assert np.shares_memory(vertices, arena)
+                assert np.shares_memory(faces, faces_arena)
+
+            arena.flush()
+            del arena, vertices
+
+            arena = np.load(file)
+            assert np.allclose(arena, shape.vertices, rtol=1e-6, atol=1e-5)
+            assert np.array_equal(faces_arena[:n_faces], shape.faces)
+            assert np.array_equal(faces_arena[n_faces:-1], shape.faces)
+            assert not faces_arena[-1].any()
+
+            # Invalid arrays
+            with raises(ValueError):
+                generate_vertices(shape=shape, out=np.empty(shape=(n_vertices + 1, 3)))
+            with raises(ValueError):
+                generate_vertices(shape=shape, out=np.empty(shape=(n_vertices, 3), dtype=int))
+            with raises(ValueError):
+                generate_vertices(shape=shape, out=np.empty(shape=(n_vertices, 6))[:, ::2])
+            with raises(ValueError):
+                generate_faces(shape=shape, out=np.empty(shape=(n_faces + 1, 3), dtype=int))
+            with raises(ValueError):
+                generate_faces(shape=shape, out=np.empty(shape=(n_faces, 3)))
+            with raises(ValueError):
+                generate_faces(shape=shape, out=np.empty(shape=(n_faces, 3), dtype=np.int8))
+    finally:
+        file.unlink(missing_ok=True)
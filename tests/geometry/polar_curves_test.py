@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import numpy as np
-from pytest import approx
+from pytest import approx, raises
 
-from gcs.geometry.polar_curves import arc_length, optimal_scaling_factor
+from gcs.geometry.polar_curves import (arc_length,
+                                      optimal_scaling_factor,
+                                      optimal_scaling_factors,
+                                      unit_arc_length)
 from ..constants import ATOL
 
 
@@ -19,8 +22,39 @@ def test_arc_length() -> None:
 
     assert length == approx(expected=expected_perimeter, abs=ATOL)
 
+    # Batch of curves
+    r0s = np.array([1.0, 1.5, 2.0])
+    c4s = np.array([0.0, 0.2, 0.4])
+    c8s = np.array([0.0, -0.05, 0.1])
 
-def test_optimal_scaling_factor() -> None:
+    lengths = arc_length(r0=r0s, c4=c4s, c8=c8s, n_steps=100)
+
+    assert lengths.shape == (3,)
+    for r0, c4, c8, length in zip(r0s, c4s, c8s, lengths):
+        assert length == approx(expected=arc_length(r0=r0, c4=c4, c8=c8, n_steps=100), abs=ATOL)
+
+
+def test_unit_arc_length() -> None:
+    """Tests for ``gcs.geometry.unit_arc_length``.
+
+    """
+    # Unit circle perimeter
+    length = unit_arc_length(c4=0.0, c8=0.0, n_steps=100)
+
+    assert length == approx(expected=2 * np.pi, abs=ATOL)
+
+    # Linear in the scaling factor
+    r0 = 1.75
+    c4 = 0.2
+    c8 = -0.05
+    n_steps = 100
+
+    length = unit_arc_length(c4=c4, c8=c8, n_steps=n_steps)
+
+    assert r0 * length == approx(expected=arc_length(r0=r0, c4=c4, c8=c8, n_steps=n_steps), abs=ATOL)
+
+
+def test_optimal_scaling_factor(monkeypatch) -> None:
     """Tests for ``gcs.geometry.optimal_scaling_factor``.
 
     """
@@ -42,3 +76,53 @@ def test_optimal_scaling_factor() -> None:
     r0 = optimal_scaling_factor(length=target_length, c4=c4, c8=c8, n_steps=n_steps)
 
     assert r0 == approx(expected=expected_r0, abs=ATOL)
+
+    # Nelder-Mead solver
+    r0 = optimal_scaling_factor(length=target_length,
+                                c4=c4,
+                                c8=c8,
+                                n_steps=n_steps,
+                                method='nelder-mead')
+
+    assert r0 == approx(expected=expected_r0, abs=1e-6)
+
+    # Negative target length, matched by a zero scaling factor with either solver
+    r0 = optimal_scaling_factor(length=-1.0, c4=c4, c8=c8, n_steps=n_steps)
+
+    assert r0 == 0.0
+    assert optimal_scaling_factor(length=-1.0, c4=c4, c8=c8, n_steps=n_steps, method='nelder-mead') == 0.0
+
+    # Fallback to Nelder-Mead for non-finite unit-scale arc length
+    monkeypatch.setattr('gcs.geometry.polar_curves.unit_arc_length', lambda c4, c8, n_steps: np.nan)
+
+    r0 = optimal_scaling_factor(length=target_length, c4=c4, c8=c8, n_steps=n_steps)
+
+    assert r0 == approx(expected=expected_r0, abs=1e-6)
+
+    # Invalid method
+    with raises(expected_exception=ValueError):
+        optimal_scaling_factor(length=target_length, c4=c4, c8=c8, n_steps=n_steps, method='newton')
+
+
+def test_optimal_scaling_factors() -> None:
+    """Tests for ``gcs.geometry.optimal_scaling_factors``.
+
+    """
+    # Batch radius recovery
+    expected_r0s = np.array([3.0, 1.75, 0.5])
+    c4s = np.array([0.0, 0.2, 0.6])
+    c8s = np.array([0.0, -0.05, 0.2])
+    n_steps = 100
+    target_lengths = arc_length(r0=expected_r0s, c4=c4s, c8=c8s, n_steps=n_steps)
+
+    r0s = optimal_scaling_factors(lengths=target_lengths, c4s=c4s, c8s=c8s, n_steps=n_steps)
+
+    np.testing.assert_allclose(actual=r0s, desired=expected_r0s, atol=ATOL)
+
+    # Negative target length and non-finite unit-scale arc length
+    r0s = optimal_scaling_factors(lengths=np.array([-1.0, 10.0]),
+                                  c4s=np.array([0.2, np.nan]),
+                                  c8s=np.array([0.0, 0.0]),
+                                  n_steps=n_steps)
+
+    np.testing.assert_array_equal(r0s, np.array([0.0, 0.0]))
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import raises
+
+from gcs import Iroko, Willow
+from gcs.geometry.meshing import _side_faces
+from gcs.geometry.regions import generate_band, generate_cross_section, generate_sector
+from tests.constants import ATOL
+
+
+def test_generate_cross_section() -> None:
+    """Tests for ``gcs.geometry.generate_cross_section``.
+
+    """
+    shape = Willow(n_height_steps=11, theta_step=0.1)
+    n_thetas = shape.rings.thetas_.size
+    rings = shape.vertices.reshape(11, n_thetas, 3)
+
+    # Cross-sections on the sampling grid match the mesh rings
+    for index in (0, 4, 10):
+        z = shape.height_ * index / 10
+        assert np.allclose(generate_cross_section(shape=shape, z=z), rings[index], rtol=0, atol=ATOL)
+
+    # Cross-sections between rings
+    cross_section = generate_cross_section(shape=shape, z=3.3)
+    assert cross_section.shape == (n_thetas, 3)
+    assert np.allclose(cross_section[:, 2], 3.3, rtol=0, atol=ATOL)
+    assert np.array_equal(shape.cross_section(z=3.3), cross_section)
+
+    with raises(ValueError):
+        generate_cross_section(shape=shape, z=-1)
+    with raises(ValueError):
+        generate_cross_section(shape=shape, z=shape.height_ + 1)
+
+
+def test_generate_band() -> None:
+    """Tests for ``gcs.geometry.generate_band``.
+
+    """
+    shape = Iroko(n_height_steps=11, theta_step=0.1, triangulate_caps=False)
+    n_thetas = shape.rings.thetas_.size
+    rings = shape.vertices.reshape(11, n_thetas, 3)
+
+    # Bands on the sampling grid match the mesh
+    vertices, faces = generate_band(shape=shape, z0=shape.height_ * 0.2, z1=shape.height_ * 0.5)
+    assert np.allclose(vertices, rings[2:6].reshape(-1, 3), rtol=0, atol=ATOL)
+    assert np.array_equal(faces, _side_faces(n_height_steps=4, n_vertices_per_step=n_thetas))
+
+    # Bands between rings
+    vertices, faces = generate_band(shape=shape, z0=1, z1=shape.height_ * 0.25)
+    assert vertices.shape == (4 * n_thetas, 3)
+    assert np.allclose(vertices[n_thetas:2 * n_thetas], rings[1], rtol=0, atol=ATOL)
+    assert np.allclose(vertices[:n_thetas, 2], 1, rtol=0, atol=ATOL)
+    assert np.all(faces < vertices.shape[0])
+
+    # Full band
+    vertices, faces = shape.band(z0=0, z1=shape.height_)
+    assert np.allclose(vertices, shape.vertices, rtol=0, atol=ATOL)
+    assert np.array_equal(faces, shape.faces)
+
+    # Data types
+    typed_shape = shape.replace(vertex_dtype='float32', face_dtype='uint32')
+    vertices, faces = typed_shape.band(z0=1, z1=2)
+    assert vertices.dtype == np.float32
+    assert faces.dtype == np.uint32
+    assert typed_shape.cross_section(z=1).dtype == np.float32
+    assert typed_shape.sector(theta0=0, theta1=1)[1].dtype == np.uint32
+
+    with raises(ValueError):
+        generate_band(shape=shape, z0=-1, z1=1)
+    with raises(ValueError):
+        generate_band(shape=shape, z0=2, z1=1)
+
+
+def test_generate_sector() -> None:
+    """Tests for ``gcs.geometry.generate_sector``.
+
+    """
+    shape = Willow(n_height_steps=11, theta_step=0.1)
+    thetas = shape.rings.thetas_
+    rings = shape.vertices.reshape(11, thetas.size, 3)
+
+    # Sectors on the sampling grid match the mesh
+    vertices, faces = generate_sector(shape=shape, theta0=thetas[3], theta1=thetas[10])
+    assert np.allclose(vertices, rings[:, 3:11].reshape(-1, 3), rtol=0, atol=ATOL)
+    assert faces.shape == (2 * 10 * 7, 3)
+
+    # Open faces only connect consecutive angles
+    columns = faces % 8
+    assert np.all(np.ptp(columns, axis=1) == 1)
+
+    # Sectors wrapping around 0
+    vertices, faces = shape.sector(theta0=-0.25, theta1=0.25)
+    assert vertices.shape == (11 * 7, 3)
+    angles = np.arctan2(vertices[:, 1], vertices[:, 0]).reshape(11, 7)
+    assert np.allclose(angles[:, [0, -1]], [-0.25, 0.25], rtol=0, atol=ATOL)
+    assert np.allclose(vertices.reshape(11, 7, 3)[:, 3], rings[:, 0], rtol=0, atol=ATOL)
+    assert np.all(np.diff(angles, axis=1) > 0)
+
+    # Full sector
+    vertices, faces = generate_sector(shape=shape, theta0=0, theta1=2 * np.pi)
+    assert vertices.shape == (11 * (thetas.size + 1), 3)
+    assert np.allclose(vertices.reshape(11, -1, 3)[:, -1], rings[:, 0], rtol=0, atol=1e-9)
+    assert faces.shape == (2 * 10 * thetas.size, 3)
+
+    with raises(ValueError):
+        generate_sector(shape=shape, theta0=1, theta1=1)
+    with raises(ValueError):
+        generate_sector(shape=shape, theta0=0, theta1=7)
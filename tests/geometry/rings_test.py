@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import raises
+
+from gcs import Willow
+from gcs.geometry.polar_curves import optimal_scaling_factors
+from gcs.geometry.rings import Rings
+from ..constants import ATOL
+
+
+def test_rings(monkeypatch) -> None:
+    """Tests for ``gcs.geometry.Rings``.
+
+    """
+    shape = Willow(n_height_steps=6, theta_step=0.1)
+    parameters = shape.parameters
+
+    rings = Rings(shape=shape)
+
+    thetas = np.arange(start=0, stop=2 * np.pi, step=parameters['theta_step'])
+
+    np.testing.assert_allclose(actual=rings.thetas_, desired=thetas, atol=ATOL)
+    np.testing.assert_allclose(actual=rings.fractions_, desired=np.linspace(0, 1, 6), atol=ATOL)
+    np.testing.assert_allclose(actual=rings.heights_,
+                               desired=np.linspace(0, parameters['height'], 6),
+                               atol=ATOL)
+    np.testing.assert_allclose(actual=rings.perimeters_[[0, -1]],
+                               desired=[shape.base_perimeter, shape.top_perimeter],
+                               atol=ATOL)
+
+    # Scaling factors are solved lazily
+    assert np.all(np.isnan(rings._scaling_factors))
+
+    ends = rings.scaling_factors(rings=np.array([0, -1]))
+
+    assert np.count_nonzero(~np.isnan(rings._scaling_factors)) == 2
+
+    r0s = rings.scaling_factors()
+
+    np.testing.assert_array_equal(ends, r0s[[0, -1]])
+    np.testing.assert_allclose(actual=r0s,
+                               desired=optimal_scaling_factors(lengths=rings.perimeters_,
+                                                               c4s=rings.c4s_,
+                                                               c8s=rings.c8s_,
+                                                               n_steps=thetas.size),
+                               atol=ATOL)
+
+    # Vertices do not cache the radius grid
+    vertices = rings.vertices().reshape(6, -1, 3)
+
+    assert '_radii' not in rings.__dict__
+    np.testing.assert_allclose(actual=Rings(shape=shape).radii(rings=slice(2, 4)),
+                               desired=np.hypot(vertices[2:4, :, 0], vertices[2:4, :, 1]),
+                               atol=ATOL)
+
+    # Radius grid is cached
+    radii = rings.radii()
+
+    assert radii.shape == (6, thetas.size)
+    assert rings.radii() is radii
+    np.testing.assert_allclose(actual=rings.radii(rings=slice(2, 4)), desired=radii[2:4], atol=ATOL)
+
+    # Vertices of selected rings, from the cached radius grid
+    np.testing.assert_array_equal(rings.vertices().reshape(6, -1, 3), vertices)
+    np.testing.assert_allclose(actual=rings.vertices(rings=np.array([1, 3])),
+                               desired=vertices[[1, 3]].reshape(-1, 3),
+                               atol=ATOL)
+
+    # Subsets carry over solved scaling factors and the cached radius grid
+    subset = rings.subset(rings=np.array([1, 3]), angles=slice(0, 5))
+
+    np.testing.assert_array_equal(subset.fractions_, rings.fractions_[[1, 3]])
+    np.testing.assert_array_equal(subset.scaling_factors(), r0s[[1, 3]])
+    assert not subset.radii().flags.writeable
+    np.testing.assert_array_equal(subset.radii(), radii[[1, 3], :5])
+    np.testing.assert_allclose(actual=subset.vertices(),
+                               desired=vertices[[1, 3], :5].reshape(-1, 3),
+                               atol=ATOL)
+
+    subset = Rings(shape=shape).subset(rings=slice(0, 2))
+
+    assert '_radii' not in subset.__dict__
+    np.testing.assert_allclose(actual=subset.radii(), desired=radii[:2], atol=ATOL)
+
+    # Vertices written to an output array
+    out = np.empty(shape=(2 * thetas.size, 3), dtype=np.float32)
+
+    assert np.shares_memory(rings.vertices(rings=np.array([1, 3]), out=out), out)
+    np.testing.assert_allclose(actual=out, desired=vertices[[1, 3]].reshape(-1, 3), rtol=1e-6)
+
+    with raises(expected_exception=ValueError):
+        rings.vertices(rings=np.array([1, 3]), out=np.empty(shape=(3, 2 * thetas.size))[:, :].T)
+
+    # Vertices computed in chunks of rings, written directly in the output data type
+    monkeypatch.setattr('gcs.geometry.rings.RADII_CHUNK_SIZE', 2 * thetas.size)
+
+    np.testing.assert_array_equal(Rings(shape=shape).vertices(), vertices.reshape(-1, 3))
+    np.testing.assert_array_equal(Rings(shape=shape).vertices(dtype=np.float32),
+                                  vertices.reshape(-1, 3).astype(np.float32))
+
+    monkeypatch.undo()
+
+    # Custom fractions and angles
+    rings = Rings(shape=shape, fractions=np.array([0.0, 1.0]), thetas=thetas[:5])
+
+    assert rings.n_steps_ == thetas.size
+    np.testing.assert_allclose(actual=rings.vertices(),
+                               desired=vertices[[0, -1], :5].reshape(-1, 3),
+                               atol=ATOL)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import raises
+
+from gcs import Cylinder, Iroko, Willow
+from gcs.geometry.polar_curves import optimal_scaling_factors
+from gcs.geometry.rings import Rings
+from gcs.geometry.sampling import adaptive_sampling, uniform_resolution
+
+
+def max_chord_deviation(shape, fractions: np.ndarray, thetas: np.ndarray) -> float:
+    """Maximum deviation of sampled cross-sections from a dense evaluation between each pair of samples.
+
+    """
+    ends = np.append(thetas, 2 * np.pi)
+    dense_thetas = ends[:-1, np.newaxis] + np.diff(ends)[:, np.newaxis] * np.linspace(start=0, stop=1, num=65)
+
+    dense_radii = Rings(shape=shape, fractions=fractions, thetas=dense_thetas.ravel()).radii()
+    dense_radii = dense_radii.reshape(fractions.size, *dense_thetas.shape)
+
+    points = np.stack((dense_radii * np.cos(dense_thetas), dense_radii * np.sin(dense_thetas)), axis=-1)
+    chords = points[..., -1:, :] - points[..., :1, :]
+    offsets = points - points[..., :1, :]
+    areas = chords[..., 0] * offsets[..., 1] - chords[..., 1] * offsets[..., 0]
+
+    return np.max(np.abs(areas) / np.linalg.norm(chords, axis=-1))
+
+
+def max_height_deviation(shape, fractions: np.ndarray, dense_fractions: np.ndarray) -> float:
+    """Maximum radial deviation of linearly interpolated rings from densely sampled rings.
+
+    """
+    radii = Rings(shape=shape, fractions=fractions).radii()
+    dense_radii = Rings(shape=shape, fractions=dense_fractions).radii()
+
+    interpolated = np.stack([np.interp(dense_fractions, fractions, column) for column in radii.T], axis=-1)
+
+    return np.max(np.abs(interpolated - dense_radii))
+
+
+def test_adaptive_sampling(monkeypatch) -> None:
+    """Tests for ``gcs.geometry.adaptive_sampling``.
+
+    """
+    # Cylinders need two rings and angles set by the radius
+    shape = Cylinder(height=25, mass=2, thickness=0.5)
+    tolerance = 0.01
+
+    fractions, thetas = adaptive_sampling(shape=shape, tolerance=tolerance)
+    radius = shape.rings.radii()[0, 0]
+    n_thetas = 2 * np.pi * np.sqrt(radius / (8 * tolerance))
+
+    np.testing.assert_array_equal(fractions, [0.0, 1.0])
+    assert thetas[0] == 0.0
+    assert n_thetas <= thetas.size <= 1.05 * n_thetas
+
+    # Samples are a subset of the uniform grid within the tolerance
+    for shape in [Iroko(), Willow()]:
+        for tolerance in [0.01, 0.05, 0.2, 1.0]:
+            fractions, thetas = adaptive_sampling(shape=shape, tolerance=tolerance)
+            rings = shape.rings
+
+            assert fractions.size < rings.fractions_.size
+            assert thetas.size < rings.thetas_.size
+            assert fractions[0] == 0.0 and fractions[-1] == 1.0
+            assert np.all(np.isin(fractions, rings.fractions_))
+            assert np.all(np.isin(thetas, rings.thetas_))
+
+            assert max_chord_deviation(shape=shape, fractions=fractions, thetas=thetas) <= tolerance
+            assert max_height_deviation(shape=shape, fractions=fractions, dense_fractions=rings.fractions_) <= tolerance
+
+    shape = Willow()
+    tolerance = 0.05
+
+    fractions, thetas = adaptive_sampling(shape=shape, tolerance=tolerance)
+    rings = shape.rings
+
+    # Adaptive shapes reuse the scaling factors solved for the sample densities
+    n_solved = []
+
+    def counted_optimal_scaling_factors(lengths: np.ndarray, **kwargs) -> np.ndarray:
+        n_solved.append(lengths.size)
+
+        return optimal_scaling_factors(lengths=lengths, **kwargs)
+
+    monkeypatch.setattr('gcs.geometry.rings.optimal_scaling_factors', counted_optimal_scaling_factors)
+
+    adaptive_shape = shape.replace(adaptive_tolerance=tolerance)
+    vertices = adaptive_shape.vertices
+
+    assert sum(n_solved) == rings.fractions_.size
+    assert vertices.shape[0] == fractions.size * thetas.size
+    np.testing.assert_array_equal(adaptive_shape.rings.fractions_, fractions)
+    np.testing.assert_array_equal(adaptive_shape.rings.thetas_, thetas)
+
+    monkeypatch.undo()
+
+    # Coarse tolerances keep valid cross-sections
+    fractions, thetas = adaptive_sampling(shape=Willow(n_height_steps=2), tolerance=1e3)
+
+    assert fractions.size == 2
+    assert thetas.size == 3
+
+    # Fine tolerances keep the uniform grid
+    fractions, thetas = adaptive_sampling(shape=shape, tolerance=1e-6)
+
+    np.testing.assert_array_equal(fractions, rings.fractions_)
+    np.testing.assert_array_equal(thetas, rings.thetas_)
+
+    # Invalid tolerance
+    with raises(expected_exception=ValueError):
+        adaptive_sampling(shape=shape, tolerance=0.0)
+
+
+def test_uniform_resolution() -> None:
+    """Tests for ``gcs.geometry.uniform_resolution``.
+
+    """
+    # Cylinders need two rings
+    n_height_steps, theta_step = uniform_resolution(shape=Cylinder(height=25, mass=2, thickness=0.5), tolerance=0.1)
+
+    assert n_height_steps == 2
+
+    # Coarsest resolution within the tolerance
+    shape = Willow()
+    tolerance = 0.05
+
+    n_height_steps, theta_step = uniform_resolution(shape=shape, tolerance=tolerance)
+
+    assert isinstance(n_height_steps, int)
+    assert isinstance(theta_step, float)
+
+    dense_fractions = np.linspace(start=0, stop=1, num=1001)
+
+    def deviations(n_height_steps: int, theta_step: float) -> tuple[float, float]:
+        fractions = np.linspace(start=0, stop=1, num=n_height_steps)
+        thetas = np.arange(start=0, stop=2 * np.pi, step=theta_step)
+
+        return (max_chord_deviation(shape=shape, fractions=fractions, thetas=thetas),
+                max_height_deviation(shape=shape, fractions=fractions, dense_fractions=dense_fractions))
+
+    chord_deviation, height_deviation = deviations(n_height_steps=n_height_steps, theta_step=theta_step)
+
+    assert chord_deviation <= 1.1 * tolerance
+    assert height_deviation <= 1.1 * tolerance
+
+    chord_deviation, height_deviation = deviations(n_height_steps=n_height_steps // 2, theta_step=1.5 * theta_step)
+
+    assert chord_deviation > tolerance
+    assert height_deviation > tolerance
+
+    # Shapes created with the resolution
+    resolved_shape = shape.with_tolerance(tolerance=tolerance)
+
+    assert resolved_shape.n_height_steps_ == n_height_steps
+    assert resolved_shape.theta_step_ == theta_step
+
+    # Invalid tolerance
+    with raises(expected_exception=ValueError):
+        uniform_resolution(shape=shape, tolerance=-1.0)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import numpy as np
-from pytest import approx
+from pytest import approx, raises
 
-from gcs.geometry.summed_cosine import summed_cosine
+from gcs.geometry.summed_cosine import min_summed_cosine, summed_cosine, summed_cosine_derivative
 from ..constants import ATOL
 
 
@@ -34,3 +34,81 @@ def test_summed_cosine() -> None:
     expected = r0 * (1 + c4 * np.cos(4 * theta) + c8 * np.cos(8 * theta))
 
     np.testing.assert_allclose(actual=r, desired=expected, atol=ATOL)
+
+    # Output buffer
+    out = np.empty_like(theta)
+
+    r = summed_cosine(theta=theta, r0=r0, c4=c4, c8=c8, out=out)
+
+    assert r is out
+    np.testing.assert_allclose(actual=out, desired=expected, atol=ATOL)
+
+    # Output buffer aliasing the angles
+    out = theta.copy()
+
+    summed_cosine(theta=out, r0=r0, c4=c4, c8=c8, out=out)
+
+    np.testing.assert_allclose(actual=out, desired=expected, atol=ATOL)
+
+
+def test_min_summed_cosine() -> None:
+    """Tests for ``gcs.geometry.min_summed_cosine``.
+
+    """
+    thetas = np.linspace(start=0.0, stop=2 * np.pi, num=100001)
+
+    # Endpoint and interior minima
+    r0 = 1.5
+    for c4, c8 in [(0.0, 0.0), (0.3, -0.2), (-0.7, 0.1), (0.2, 0.4), (0.9, 0.3), (0.5, 0.0)]:
+        r = min_summed_cosine(r0=r0, c4=c4, c8=c8)
+
+        assert r == approx(expected=np.min(summed_cosine(theta=thetas, r0=r0, c4=c4, c8=c8)), abs=1e-8)
+
+    # Sharp dip between samples
+    c4 = 0.0
+    c8 = 1.0
+    coarse_thetas = np.arange(start=0, stop=2 * np.pi, step=0.5)
+
+    r = min_summed_cosine(r0=r0, c4=c4, c8=c8)
+
+    assert r == approx(expected=0.0, abs=ATOL)
+    assert np.min(summed_cosine(theta=coarse_thetas, r0=r0, c4=c4, c8=c8)) > r
+
+    # Array of parameters
+    r0s = np.array([1.0, 2.0])
+    c4s = np.array([0.3, 0.2])
+    c8s = np.array([-0.2, 0.4])
+
+    rs = min_summed_cosine(r0=r0s, c4=c4s, c8=c8s)
+
+    assert rs.shape == (2,)
+    for r0, c4, c8, r in zip(r0s, c4s, c8s, rs):
+        assert r == approx(expected=min_summed_cosine(r0=r0, c4=c4, c8=c8), abs=ATOL)
+
+
+def test_summed_cosine_derivative() -> None:
+    """Tests for ``gcs.geometry.summed_cosine_derivative``.
+
+    """
+    theta = np.linspace(start=0.0, stop=2 * np.pi, num=50)
+    r0 = 1.5
+    c4 = 0.2
+    c8 = -0.05
+    step = 1e-5
+
+    # Central differences
+    dr = summed_cosine_derivative(theta=theta, r0=r0, c4=c4, c8=c8)
+    expected = (summed_cosine(theta=theta + step, r0=r0, c4=c4, c8=c8)
+                - summed_cosine(theta=theta - step, r0=r0, c4=c4, c8=c8)) / (2 * step)
+
+    np.testing.assert_allclose(actual=dr, desired=expected, atol=1e-8)
+
+    ddr = summed_cosine_derivative(theta=theta, r0=r0, c4=c4, c8=c8, order=2)
+    expected = (summed_cosine_derivative(theta=theta + step, r0=r0, c4=c4, c8=c8)
+                - summed_cosine_derivative(theta=theta - step, r0=r0, c4=c4, c8=c8)) / (2 * step)
+
+    np.testing.assert_allclose(actual=ddr, desired=expected, atol=1e-6)
+
+    # Invalid order
+    with raises(expected_exception=ValueError):
+        summed_cosine_derivative(theta=theta, r0=r0, c4=c4, c8=c8, order=0)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+
+import numpy as np
+from pytest import raises
+
+from gcs import GCS, Cylinder
+from gcs.geometry import generate_faces, generate_vertices
+from gcs.io import MeshCache
+
+
+def test_mesh_cache(monkeypatch) -> None:
+    """Tests for ``gcs.io.MeshCache``.
+
+    """
+    directory = Path(__file__).resolve().parent / 'mesh_cache'
+
+    try:
+        cache = MeshCache(directory=directory)
+
+        assert directory.is_dir()
+        assert cache.size == 0
+
+        # Stable keys
+        shape = Cylinder(height=25, mass=2, thickness=0.5, n_height_steps=5, theta_step=0.1)
+        same_shape = GCS(**{name: np.float64(value) if isinstance(value, float) else value
+                            for name, value in shape.parameters.items()} | {'c4_base': 0.0})
+
+        assert cache.key(shape=shape) == cache.key(shape=same_shape)
+        assert cache.key(shape=shape) != cache.key(shape=shape.replace(height=30))
+
+        # Miss then hit
+        assert cache.load(shape=shape) is None
+
+        vertices, faces = cache.mesh(shape=shape)
+
+        np.testing.assert_array_equal(vertices, shape.vertices)
+        np.testing.assert_array_equal(faces, shape.faces)
+        assert cache.size > 0
+
+        vertices, faces = cache.mesh(shape=same_shape)
+
+        assert isinstance(vertices, np.memmap)
+        assert same_shape.vertices is vertices
+        assert same_shape.faces is faces
+        np.testing.assert_array_equal(vertices, shape.vertices)
+        np.testing.assert_array_equal(faces, shape.faces)
+
+        # Data types are not part of the key, and hits are converted to the shape's data types
+        typed_shape = shape.replace(vertex_dtype='float32', face_dtype='uint32')
+        vertices, faces = cache.mesh(shape=typed_shape)
+
+        assert cache.key(shape=typed_shape) == cache.key(shape=shape)
+        assert vertices.dtype == np.float32
+        assert faces.dtype == np.uint32
+        np.testing.assert_array_equal(vertices, shape.vertices.astype(np.float32))
+        np.testing.assert_array_equal(faces, shape.faces)
+
+        # Meshes filled by shapes with other data types are cached at full precision
+        cache.clear()
+        cache.mesh(shape=shape.replace(vertex_dtype='float32', face_dtype='uint32'))
+        vertices, faces = cache.mesh(shape=shape.replace())
+
+        assert vertices.dtype == np.float64
+        assert faces.dtype == np.int64
+        np.testing.assert_array_equal(vertices, generate_vertices(shape=shape))
+        np.testing.assert_array_equal(faces, generate_faces(shape=shape))
+
+        # The directory is only scanned for eviction once the size limit may be exceeded
+        evictions = []
+        monkeypatch.setattr(MeshCache, 'evict', lambda self: evictions.append(self))
+
+        small_cache = MeshCache(directory=directory, max_bytes=cache.size + 1)
+        small_cache.save(shape=shape, vertices=shape.vertices, faces=shape.faces)
+
+        assert not evictions
+
+        small_cache.save(shape=shape.replace(height=30), vertices=shape.vertices, faces=shape.faces)
+
+        assert evictions == [small_cache]
+
+        monkeypatch.undo()
+        cache.clear()
+        cache.mesh(shape=shape)
+
+        # In-memory loading
+        vertices, _ = MeshCache(directory=directory, mmap=False).load(shape=shape)
+
+        assert not isinstance(vertices, np.memmap)
+
+        # Least recently used eviction
+        for file in directory.glob('*.npy'):
+            os.utime(file, times=(0, 0))
+
+        cache = MeshCache(directory=directory, max_bytes=cache.size)
+        new_shape = shape.replace(height=30)
+
+        cache.mesh(shape=new_shape)
+
+        assert cache.load(shape=shape) is None
+        assert cache.load(shape=new_shape) is not None
+
+        # Clearing
+        cache.clear()
+
+        assert cache.size == 0
+
+        # Eviction of all meshes
+        MeshCache(directory=directory, max_bytes=0).mesh(shape=shape)
+
+        assert cache.size == 0
+
+        # Failed writes leave no files behind
+        def fail(*args, **kwargs) -> None:
+            raise OSError('disk full')
+
+        monkeypatch.setattr(np, 'save', fail)
+
+        with raises(expected_exception=OSError):
+            cache.save(shape=shape, vertices=shape.vertices, faces=shape.faces)
+
+        assert not list(directory.glob('*.tmp'))
+
+        monkeypatch.undo()
+
+        # Stale temporary files are removed on eviction, while recent ones may still be written
+        stale_file = directory / 'stale.tmp'
+        recent_file = directory / 'recent.tmp'
+        stale_file.touch()
+        recent_file.touch()
+        os.utime(stale_file, times=(0, 0))
+
+        cache.evict()
+
+        assert not stale_file.exists()
+        assert recent_file.exists()
+
+        # Concurrent eviction between loading and marking as recently used
+        cache.save(shape=shape, vertices=shape.vertices, faces=shape.faces)
+
+        def evicted(*args, **kwargs) -> None:
+            raise FileNotFoundError
+
+        monkeypatch.setattr(os, 'utime', evicted)
+
+        assert cache.load(shape=shape) is not None
+
+        monkeypatch.undo()
+
+        # Invalid size limit
+        with raises(expected_exception=ValueError):
+            MeshCache(directory=directory, max_bytes=-1)
+
+    finally:
+        if directory.exists():
+            shutil.rmtree(directory)
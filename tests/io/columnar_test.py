@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+
+import numpy as np
+from pytest import raises
+
+from gcs import Cylinder, GCSBatch, Iroko, Willow
+from gcs.io import load_columns, load_parameters_columnar, save_columns, save_parameters_columnar
+
+
+def test_columns(monkeypatch) -> None:
+    """Tests for ``gcs.io.save_columns`` and ``gcs.io.load_columns``.
+
+    """
+    directory = Path(__file__).resolve().parent / 'table'
+
+    try:
+        save_columns(directory=directory, columns={'x': [1.0, 2.0], 'n': [1, 2], 'valid': [True, False]})
+        save_columns(directory=directory, columns={'x': [3], 'n': [3], 'valid': [True]}, append=True)
+
+        # Memory-mapped
+        columns = load_columns(directory=directory)
+
+        assert list(columns) == ['x', 'n', 'valid']
+        assert isinstance(columns['x'], np.memmap)
+        assert columns['x'].dtype == np.float64
+        np.testing.assert_array_equal(columns['x'], [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(columns['n'], [1, 2, 3])
+        np.testing.assert_array_equal(columns['valid'], [True, False, True])
+
+        del columns
+
+        # Column and row subsets
+        columns = load_columns(directory=directory, names=['n'], rows=[0, 2], mmap=False)
+
+        assert list(columns) == ['n']
+        assert not isinstance(columns['n'], np.memmap)
+        np.testing.assert_array_equal(columns['n'], [1, 3])
+
+        with raises(expected_exception=ValueError):
+            load_columns(directory=directory, names=['y'])
+
+        # Invalid appends
+        with raises(expected_exception=ValueError):
+            save_columns(directory=directory, columns={'x': [1.0]}, append=True)
+        with raises(expected_exception=ValueError):
+            save_columns(directory=directory, columns={'x': [1.0], 'n': [1.5], 'valid': [True]}, append=True)
+        with raises(expected_exception=ValueError):
+            save_columns(directory=directory, columns={'x': [1.0, 2.0], 'n': [1]})
+        with raises(expected_exception=ValueError):
+            save_columns(directory=directory, columns={'x': [[1.0]]})
+
+        # Strings are never truncated
+        save_columns(directory=directory / 'labels', columns={'label': ['fan']})
+        with raises(expected_exception=ValueError):
+            save_columns(directory=directory / 'labels', columns={'label': ['earcut']}, append=True)
+        shutil.rmtree(directory / 'labels')
+
+        # Interrupted appends are discarded
+        def fail_replace(*args, **kwargs):
+            raise OSError
+
+        with monkeypatch.context() as m:
+            m.setattr(os, 'replace', fail_replace)
+
+            with raises(expected_exception=OSError):
+                save_columns(directory=directory, columns={'x': [4.0], 'n': [4], 'valid': [True]}, append=True)
+
+        assert sorted(file.name for file in directory.iterdir()) == ['metadata.json', 'n.bin', 'valid.bin', 'x.bin']
+        np.testing.assert_array_equal(load_columns(directory=directory)['n'], [1, 2, 3])
+
+        save_columns(directory=directory, columns={'x': [4.0], 'n': [4], 'valid': [True]}, append=True)
+
+        np.testing.assert_array_equal(load_columns(directory=directory)['n'], [1, 2, 3, 4])
+
+        # Replaced store
+        save_columns(directory=directory, columns={'valid': np.array([], dtype=bool), 'y': np.array([], dtype=np.float32)})
+
+        columns = load_columns(directory=directory)
+
+        assert sorted(file.name for file in directory.iterdir()) == ['metadata.json', 'valid.bin', 'y.bin']
+        assert columns['y'].dtype == np.float32
+        assert columns['y'].size == 0
+
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_parameters_columnar() -> None:
+    """Tests for ``gcs.io.save_parameters_columnar`` and ``gcs.io.load_parameters_columnar``.
+
+    """
+    directory = Path(__file__).resolve().parent / 'archive'
+
+    try:
+        shapes = [Willow(cap_triangulation='fan'), Iroko(), Cylinder(height=25, mass=2, thickness=0.5)]
+
+        # Longer string parameters can be appended
+        save_parameters_columnar(directory=directory, shapes=shapes[:1])
+        save_parameters_columnar(directory=directory, shapes=shapes[1:2], append=True)
+        save_parameters_columnar(directory=directory, shapes=GCSBatch.from_shapes(shapes[2:]), append=True)
+
+        batch = load_parameters_columnar(directory=directory)
+
+        assert len(batch) == 3
+        assert list(batch) == shapes
+
+        batch = load_parameters_columnar(directory=directory, rows=slice(1, None), mmap=False)
+
+        assert list(batch) == shapes[1:]
+
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
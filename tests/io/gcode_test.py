@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from pytest import raises
+
+from gcs import Cylinder, Iroko
+from gcs.io import save_gcode
+from gcs.metrics import material_volume
+
+
+def read_moves(file: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Reads the positions, extrusions and extrusion flags of G-code moves.
+
+    """
+    positions, extrusions, extruding = [], [], []
+
+    for line in file.read_text().splitlines():
+        words = line.split()
+        if not words or words[0] not in ('G0', 'G1') or len(words) < 4:
+            continue
+
+        values = {word[0]: float(word[1:]) for word in words[1:]}
+        positions.append([values['X'], values['Y'], values['Z']])
+        extrusions.append(values.get('E', 0.0))
+        extruding.append(words[0] == 'G1')
+
+    return np.array(positions), np.array(extrusions), np.array(extruding)
+
+
+def test_save_gcode() -> None:
+    """Tests for ``gcs.io.save_gcode``.
+
+    """
+    file_dir = Path(__file__).resolve().parent
+    file = file_dir / 'saved.gcode'
+    chunked_file = file_dir / 'chunked.gcode'
+
+    filament_area = np.pi * 1.75**2 / 4
+
+    try:
+        # Spiral
+        shape = Cylinder(height=25, mass=2, thickness=0.5)
+        radius = shape.base_perimeter / (2 * np.pi)
+        n_angles = np.arange(start=0, stop=2 * np.pi, step=shape.theta_step_).size
+
+        save_gcode(file=file, shape=shape, layer_height=0.25)
+
+        header = file.read_text().splitlines()
+        assert 'M83 ; relative extrusion' in header
+        assert 'G1 F1800' in header
+
+        positions, extrusions, extruding = read_moves(file)
+
+        # Flat first layer, then one revolution per layer up to the top
+        assert positions.shape == (100 * n_angles + 1, 3)
+        assert np.count_nonzero(~extruding) == 1
+        assert np.all(positions[:n_angles, 2] == 0.25)
+        assert np.all(np.diff(positions[n_angles - 1:, 2]) >= 0)
+        assert positions[-1, 2] == 25
+        assert np.allclose(np.linalg.norm(positions[:, :2], axis=1), radius, rtol=0, atol=1e-3)
+
+        # Extruded volume matches the material volume
+        assert np.isclose(np.sum(extrusions) * filament_area, material_volume(shape=shape), rtol=1e-3, atol=0)
+
+        # Chunks do not change the toolpath
+        save_gcode(file=chunked_file, shape=shape, layer_height=0.25, chunk=7)
+        assert chunked_file.read_text() == file.read_text()
+
+        # Layers
+        shape = Iroko(theta_step=0.05)
+        n_angles = np.arange(start=0, stop=2 * np.pi, step=shape.theta_step_).size
+
+        save_gcode(file=file, shape=shape, layer_height=0.5, spiral=False, filament_diameter=1.75)
+
+        positions, extrusions, extruding = read_moves(file)
+
+        n_layers = round(shape.height_ / 0.5)
+        assert positions.shape == (n_layers * (n_angles + 1), 3)
+        assert np.count_nonzero(~extruding) == n_layers
+
+        # Closed loops at constant heights
+        loops = positions.reshape(n_layers, n_angles + 1, 3)
+        assert np.array_equal(loops[:, 0], loops[:, -1])
+        assert np.all(loops[..., 2] == loops[:, :1, 2])
+        assert np.allclose(loops[:, 0, 2], np.arange(1, n_layers + 1) * shape.height_ / n_layers, rtol=0, atol=1e-4)
+
+        assert np.isclose(np.sum(extrusions) * filament_area, material_volume(shape=shape), rtol=1e-2, atol=0)
+
+        # Single layer
+        save_gcode(file=file, shape=shape, layer_height=100)
+        positions, _, extruding = read_moves(file)
+        assert positions.shape == (n_angles + 1, 3)
+        assert np.array_equal(positions[0], positions[-1])
+        assert np.count_nonzero(~extruding) == 1
+
+        # Invalid values
+        with raises(ValueError):
+            save_gcode(file=file, shape=shape, layer_height=0)
+        with raises(ValueError):
+            save_gcode(file=file, shape=shape, print_speed=0)
+        with raises(ValueError):
+            save_gcode(file=file, shape=shape, filament_diameter=-1)
+        with raises(ValueError):
+            save_gcode(file=file, shape=shape, chunk=0)
+    finally:
+        file.unlink(missing_ok=True)
+        chunked_file.unlink(missing_ok=True)
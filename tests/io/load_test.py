@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from gcs import Cylinder
-from gcs.io import load_parameters, save_parameters
+import numpy as np
+from pytest import raises
+
+from gcs import Cylinder, GCSBatch, Iroko, Willow
+from gcs.io import iter_parameters, load_parameters, load_ply, save_parameters, save_ply
 
 
 def test_load_parameters() -> None:
@@ -34,9 +37,124 @@ def test_load_parameters() -> None:
         assert len(shapes) == 2
         assert shapes[0] == shape1
         assert shapes[1] == shape2
+        assert isinstance(shapes[0].n_height_steps_, int)
+
+        # Batch
+        batch = load_parameters(file=multiple_file, batch=True)
+
+        assert isinstance(batch, GCSBatch)
+        np.testing.assert_array_equal(batch.height_, [25, 30])
+
+        # Omitted columns use the defaults
+        file_data = multiple_file.read_text().splitlines()
+        header = file_data[0].split(',')
+        index = header.index('triangulate_caps')
+        multiple_file.write_text('\n'.join(','.join(line.split(',')[:index]) for line in file_data))
+
+        assert load_parameters(file=multiple_file) == [shape1, shape2]
+
+        # Invalid columns
+        invalid_files = [
+            'c4_base,unknown\n0,0\n',
+            'n_height_steps\n2.5\n',
+            'triangulate_caps\nyes\n',
+            'height\nabc\n',
+        ]
+
+        for file_data in invalid_files:
+            multiple_file.write_text(file_data)
+
+            with raises(expected_exception=ValueError):
+                load_parameters(file=multiple_file)
 
     finally:
         if single_file.exists():
             single_file.unlink()
         if multiple_file.exists():
             multiple_file.unlink()
+
+
+def test_iter_parameters() -> None:
+    """Tests for ``gcs.io.iter_parameters``.
+
+    """
+    file = Path(__file__).resolve().parent / 'chunked.csv'
+
+    try:
+        shapes = [Cylinder(height=25, mass=2, thickness=0.5), Iroko(), Willow(cap_triangulation='fan')]
+
+        save_parameters(file=file, shapes=shapes)
+
+        # Individual shapes
+        assert list(iter_parameters(file=file, chunk_size=2)) == shapes
+
+        # Batches
+        batches = list(iter_parameters(file=file, chunk_size=2, batch=True))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert [shape for batch in batches for shape in batch] == shapes
+
+        with raises(expected_exception=ValueError):
+            iter_parameters(file=file, chunk_size=0)
+
+    finally:
+        if file.exists():
+            file.unlink()
+
+
+def test_load_ply() -> None:
+    """Tests for ``gcs.io.load_ply``.
+
+    """
+    file = Path(__file__).resolve().parent / 'shape.ply'
+
+    try:
+        shape = Cylinder(height=25, mass=2, thickness=0.5, n_height_steps=5, theta_step=0.1)
+
+        save_ply(file=file, shape=shape, vertex_dtype=np.float64)
+
+        # Memory-mapped
+        vertices, faces = load_ply(file=file)
+
+        assert isinstance(vertices, np.memmap)
+        np.testing.assert_array_equal(vertices, shape.vertices)
+        np.testing.assert_array_equal(faces, shape.faces)
+
+        del vertices, faces
+
+        # In memory
+        vertices, faces = load_ply(file=file, mmap=False)
+
+        assert not isinstance(vertices, np.memmap)
+        np.testing.assert_array_equal(vertices, shape.vertices)
+        np.testing.assert_array_equal(faces, shape.faces)
+
+        # Missing header
+        file.write_bytes(b'ply\n')
+
+        with raises(expected_exception=ValueError):
+            load_ply(file=file)
+
+        # Unsupported layout
+        file.write_bytes(b'ply\nformat ascii 1.0\nend_header\n')
+
+        with raises(expected_exception=ValueError):
+            load_ply(file=file)
+
+        # Unsupported property type
+        file.write_bytes(b'ply\n'
+                         b'format binary_little_endian 1.0\n'
+                         b'element vertex 0\n'
+                         b'property short x\n'
+                         b'property short y\n'
+                         b'property short z\n'
+                         b'element face 0\n'
+                         b'property list uchar uint vertex_indices\n'
+                         b'end_header\n')
+
+        with raises(expected_exception=ValueError):
+            load_ply(file=file)
+
+    finally:
+        if file.exists():
+            file.unlink()
@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
+import pickle
+import shutil
 
+import numpy as np
 import pandas as pd
+from stl.mesh import Mesh
 
-from gcs import Cylinder
-from gcs.io import save_mesh, save_parameters
+from pytest import raises
+
+from gcs import Cylinder, Willow
+from gcs.io import (load_ply,
+                    save_glb,
+                    save_mesh,
+                    save_mesh_streaming,
+                    save_meshes,
+                    save_obj,
+                    save_parameters,
+                    save_ply)
+from gcs.io.save import _save_mesh_job
 
 
 def test_save_parameters() -> None:
@@ -69,8 +84,257 @@ def test_save_mesh() -> None:
         save_mesh(file=file, shape=shape)
 
         assert file.exists()
-        assert file.stat().st_size > 0
+        assert file.stat().st_size == 84 + 50 * shape.faces.shape[0]
+
+        # Header and triangle count
+        header = file.read_bytes()[:84]
+
+        assert not header.startswith(b'solid')
+        assert np.frombuffer(header[80:], dtype='<u4')[0] == shape.faces.shape[0]
+
+        # Triangles and unit normals
+        mesh = Mesh.from_file(file, calculate_normals=False)
+
+        np.testing.assert_allclose(actual=mesh.vectors,
+                                   desired=shape.vertices[shape.faces],
+                                   rtol=1e-6)
+        np.testing.assert_allclose(actual=np.linalg.norm(mesh.normals, axis=1), desired=1.0, rtol=1e-6)
+
+        normals = np.cross(mesh.vectors[:, 1] - mesh.vectors[:, 0], mesh.vectors[:, 2] - mesh.vectors[:, 0])
+
+        assert np.all(np.einsum('ij,ij->i', normals, mesh.normals) > 0)
+
+    finally:
+        if file.exists():
+            file.unlink()
+
+
+def test_save_mesh_streaming() -> None:
+    """Tests for ``gcs.io.save_mesh_streaming``.
+
+    """
+    file = Path(__file__).resolve().parent / 'shape.stl'
+    streamed_file = Path(__file__).resolve().parent / 'streamed_shape.stl'
+
+    try:
+        for triangulate_caps, cap_triangulation in ((True, 'earcut'), (True, 'fan'), (False, 'earcut')):
+            shape = Willow(n_height_steps=8,
+                           theta_step=0.05,
+                           triangulate_caps=triangulate_caps,
+                           cap_triangulation=cap_triangulation)
+
+            save_mesh(file=file, shape=shape)
+            expected_mesh = Mesh.from_file(file, calculate_normals=False)
+
+            for chunk in (1, 3, 100):
+                save_mesh_streaming(file=streamed_file, shape=shape, chunk=chunk)
+
+                assert streamed_file.stat().st_size == file.stat().st_size
+
+                mesh = Mesh.from_file(streamed_file, calculate_normals=False)
+
+                # Same triangles in a different order
+                triangles = mesh.vectors.reshape(-1, 9)
+                expected_triangles = expected_mesh.vectors.reshape(-1, 9)
+
+                order = np.lexsort(np.round(triangles, 3).T)
+                expected_order = np.lexsort(np.round(expected_triangles, 3).T)
+
+                np.testing.assert_allclose(actual=triangles[order],
+                                           desired=expected_triangles[expected_order],
+                                           atol=1e-5)
+
+        # Invalid chunk size
+        with raises(expected_exception=ValueError):
+            save_mesh_streaming(file=streamed_file, shape=shape, chunk=0)
 
     finally:
         if file.exists():
             file.unlink()
+        if streamed_file.exists():
+            streamed_file.unlink()
+
+
+def test_save_ply() -> None:
+    """Tests for ``gcs.io.save_ply``.
+
+    """
+    file = Path(__file__).resolve().parent / 'shape.ply'
+
+    try:
+        shape = Cylinder(height=25, mass=2, thickness=0.5, n_height_steps=5, theta_step=0.1)
+
+        # Single precision
+        save_ply(file=file, shape=shape)
+
+        vertices, faces = load_ply(file=file)
+
+        assert vertices.dtype == np.float32
+        assert faces.dtype == np.uint32
+        np.testing.assert_allclose(actual=vertices, desired=shape.vertices, rtol=1e-6)
+        np.testing.assert_array_equal(faces, shape.faces)
+
+        # Double precision
+        save_ply(file=file, shape=shape, vertex_dtype=np.float64, face_dtype=np.int32)
+
+        vertices, faces = load_ply(file=file)
+
+        assert vertices.dtype == np.float64
+        assert faces.dtype == np.int32
+        np.testing.assert_array_equal(vertices, shape.vertices)
+        np.testing.assert_array_equal(faces, shape.faces)
+
+        # Invalid data types
+        with raises(expected_exception=ValueError):
+            save_ply(file=file, shape=shape, vertex_dtype=np.int32)
+        with raises(expected_exception=ValueError):
+            save_ply(file=file, shape=shape, face_dtype=np.int64)
+
+    finally:
+        if file.exists():
+            file.unlink()
+
+
+def test_save_obj() -> None:
+    """Tests for ``gcs.io.save_obj``.
+
+    """
+    file = Path(__file__).resolve().parent / 'shape.obj'
+
+    try:
+        shape = Cylinder(height=25, mass=2, thickness=0.5, n_height_steps=5, theta_step=0.1)
+
+        save_obj(file=file, shape=shape)
+
+        lines = file.read_text(encoding='ascii').splitlines()
+        vertices = np.array([line.split()[1:] for line in lines if line.startswith('v ')], dtype=float)
+        faces = np.array([line.split()[1:] for line in lines if line.startswith('f ')], dtype=int)
+
+        np.testing.assert_allclose(actual=vertices, desired=shape.vertices, rtol=1e-8)
+        np.testing.assert_array_equal(faces, shape.faces + 1)
+
+    finally:
+        if file.exists():
+            file.unlink()
+
+
+def test_save_glb() -> None:
+    """Tests for ``gcs.io.save_glb``.
+
+    """
+    file = Path(__file__).resolve().parent / 'shape.glb'
+
+    try:
+        shape = Cylinder(height=25, mass=2, thickness=0.5, n_height_steps=5, theta_step=0.1)
+
+        save_glb(file=file, shape=shape)
+
+        data = file.read_bytes()
+        magic, version, length = data[:4], *np.frombuffer(data[4:12], dtype='<u4')
+
+        assert magic == b'glTF'
+        assert version == 2
+        assert length == len(data)
+
+        json_length, _ = np.frombuffer(data[12:20], dtype='<u4')
+        gltf = json.loads(data[20:20 + json_length])
+        bin_offset = 20 + json_length + 8
+
+        assert json_length % 4 == 0
+        assert gltf['accessors'][0]['count'] == shape.vertices.shape[0]
+        assert gltf['accessors'][1]['count'] == shape.faces.size
+
+        vertices_view, indices_view = gltf['bufferViews']
+        vertices = np.frombuffer(data,
+                                 dtype='<f4',
+                                 count=vertices_view['byteLength'] // 4,
+                                 offset=bin_offset + vertices_view['byteOffset'])
+        indices = np.frombuffer(data,
+                                dtype='<u4',
+                                count=indices_view['byteLength'] // 4,
+                                offset=bin_offset + indices_view['byteOffset'])
+
+        # Metres, +Y up
+        x, y, z = shape.vertices.T / 1000
+        np.testing.assert_allclose(actual=vertices.reshape(-1, 3), desired=np.column_stack((x, z, -y)), rtol=1e-6)
+        np.testing.assert_array_equal(indices.reshape(-1, 3), shape.faces)
+        np.testing.assert_allclose(actual=gltf['accessors'][0]['max'][1], desired=shape.height_ / 1000, rtol=1e-6)
+
+    finally:
+        if file.exists():
+            file.unlink()
+
+
+def test_save_meshes(monkeypatch) -> None:
+    """Tests for ``gcs.io.save_meshes``.
+
+    """
+    directory = Path(__file__).resolve().parent / 'meshes'
+
+    try:
+        shapes = [
+            Cylinder(height=25, mass=2, thickness=0.5, n_height_steps=5, theta_step=0.1),
+            Willow(n_height_steps=5, theta_step=0.1),
+        ]
+
+        for workers in (1, 2):
+            for file_format in ('stl', 'ply', 'obj', 'glb'):
+                errors = save_meshes(directory=directory,
+                                     shapes=shapes,
+                                     file_format=file_format,
+                                     workers=workers)
+
+                assert not errors
+                assert (directory / f'shape_000000.{file_format}').exists()
+                assert (directory / f'shape_000001.{file_format}').exists()
+
+            vertices, faces = load_ply(file=directory / 'shape_000001.ply')
+
+            np.testing.assert_allclose(actual=vertices, desired=shapes[1].vertices, rtol=1e-6)
+            np.testing.assert_array_equal(faces, shapes[1].faces)
+
+            del vertices, faces
+
+            # Errors are aggregated per shape
+            blocked_file = directory / 'shape_000001.stl'
+            blocked_file.unlink()
+            blocked_file.mkdir()
+
+            errors = save_meshes(directory=directory, shapes=shapes, workers=workers)
+
+            assert list(errors) == [1]
+            assert isinstance(errors[1], OSError)
+
+            blocked_file.rmdir()
+
+        # Workers receive the shape class and data types
+        typed_shape = Willow(n_height_steps=5, theta_step=0.1, vertex_dtype='float32', face_dtype='uint32')
+        jobs = []
+
+        def save_mesh_job(shape, file, file_format) -> None:
+            jobs.append(pickle.loads(pickle.dumps(shape)))
+            _save_mesh_job(shape, file, file_format)
+
+        monkeypatch.setattr('gcs.io.save._save_mesh_job', save_mesh_job)
+
+        assert not save_meshes(directory=directory, shapes=[typed_shape], file_format='ply', workers=1)
+        assert type(jobs[0]) is Willow
+        assert jobs[0].vertex_dtype_ == 'float32'
+        assert jobs[0].face_dtype_ == 'uint32'
+
+        monkeypatch.undo()
+
+        assert not save_meshes(directory=directory, shapes=[typed_shape], file_format='ply', workers=2)
+
+        vertices, faces = load_ply(file=directory / 'shape_000000.ply')
+
+        np.testing.assert_array_equal(vertices, typed_shape.vertices)
+        np.testing.assert_array_equal(faces, typed_shape.faces)
+
+        # Invalid file format
+        with raises(expected_exception=ValueError):
+            save_meshes(directory=directory, shapes=shapes, file_format='3mf')
+
+    finally:
+        if directory.exists():
+            shutil.rmtree(directory)
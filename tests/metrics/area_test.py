@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import numpy as np
+
+from gcs import GCSBatch, Cylinder, Iroko, Willow
+from gcs.metrics import wall_area
+from tests.constants import ATOL
+
+
+def test_wall_area() -> None:
+    """Tests for ``gcs.metrics.wall_area``.
+
+    """
+    # Cylinder
+    shape = Cylinder(height=25, mass=2, thickness=0.5)
+    area = wall_area(shape=shape)
+    assert isinstance(area, float)
+    assert np.isclose(area, shape.base_perimeter * shape.height_, rtol=ATOL, atol=0)
+
+    # Independent of the sampling resolution
+    assert wall_area(shape=shape.replace(n_height_steps=2, theta_step=2)) == area
+
+    # Fine meshes of the wall
+    for shape in (Iroko(n_height_steps=400, theta_step=0.002, triangulate_caps=False),
+                  Willow(n_height_steps=400, theta_step=0.002, triangulate_caps=False)):
+        triangles = shape.vertices[shape.faces]
+        edges = np.stack((triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]), axis=1)
+        normals = np.cross(edges[:, 0], edges[:, 1])
+        expected = np.sum(np.linalg.norm(normals, axis=-1)) / 2
+        assert np.isclose(wall_area(shape=shape), expected, rtol=1e-4, atol=0)
+
+    # Batches
+    shapes = [Iroko(), Willow(), Cylinder(height=25, mass=2, thickness=0.5)]
+    areas = wall_area(shape=GCSBatch.from_shapes(shapes))
+    assert areas.shape == (3,)
+    assert np.allclose(areas, [wall_area(shape=shape) for shape in shapes], rtol=ATOL, atol=0)
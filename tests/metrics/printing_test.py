@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import raises
+
+from gcs import GCSBatch, Cylinder, Iroko, Willow
+from gcs.metrics import material_volume, print_time, toolpath_length
+from tests.constants import ATOL
+
+
+def test_material_volume() -> None:
+    """Tests for ``gcs.metrics.material_volume``.
+
+    """
+    shape = Cylinder(height=25, mass=2, thickness=0.5, density=0.001)
+    assert np.isclose(material_volume(shape=shape), 2000, rtol=0, atol=ATOL)
+
+    # Batches
+    shapes = [Iroko(), Willow()]
+    volumes = material_volume(shape=GCSBatch.from_shapes(shapes))
+    assert np.allclose(volumes, [material_volume(shape=shape) for shape in shapes], rtol=0, atol=ATOL)
+
+
+def test_toolpath_length() -> None:
+    """Tests for ``gcs.metrics.toolpath_length``.
+
+    """
+    shape = Cylinder(height=25, mass=2, thickness=0.5)
+    length = toolpath_length(shape=shape, layer_height=0.25)
+    assert np.isclose(length, 100 * shape.base_perimeter, rtol=ATOL, atol=0)
+
+    # The toolpath fills the wall volume
+    shape = Willow()
+    length = toolpath_length(shape=shape, layer_height=0.2)
+    assert np.isclose(length * 0.2 * shape.thickness_, material_volume(shape=shape), rtol=ATOL, atol=0)
+
+    # Batches
+    shapes = [Iroko(), Willow()]
+    lengths = toolpath_length(shape=GCSBatch.from_shapes(shapes), layer_height=0.2)
+    assert np.allclose(lengths, [toolpath_length(shape=shape, layer_height=0.2) for shape in shapes],
+                       rtol=ATOL, atol=0)
+
+    with raises(ValueError):
+        toolpath_length(shape=shape, layer_height=0)
+
+
+def test_print_time() -> None:
+    """Tests for ``gcs.metrics.print_time``.
+
+    """
+    shape = Iroko()
+    time = print_time(shape=shape, layer_height=0.2, print_speed=40)
+    assert np.isclose(time, toolpath_length(shape=shape, layer_height=0.2) / 40, rtol=ATOL, atol=0)
+
+    with raises(ValueError):
+        print_time(shape=shape, layer_height=0.2, print_speed=0)
+    with raises(ValueError):
+        print_time(shape=shape, layer_height=-1, print_speed=40)
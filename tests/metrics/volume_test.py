@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+
+from gcs import GCSBatch, Cylinder, Iroko, Willow
+from gcs.metrics import centroid, enclosed_volume
+from tests.constants import ATOL
+
+
+def mesh_volume(vertices: np.ndarray, faces: np.ndarray) -> float:
+    """Volume enclosed by a closed triangle mesh, from the divergence theorem.
+
+    """
+    triangles = vertices[faces]
+
+    return abs(np.sum(triangles[:, 0] * np.cross(triangles[:, 1], triangles[:, 2]))) / 6
+
+
+def mesh_centroid(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Area-weighted centroid of a triangle mesh.
+
+    """
+    triangles = vertices[faces]
+    areas = np.linalg.norm(np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]), axis=-1)
+
+    return areas @ np.mean(triangles, axis=1) / np.sum(areas)
+
+
+def test_enclosed_volume() -> None:
+    """Tests for ``gcs.metrics.enclosed_volume``.
+
+    """
+    # Cylinder
+    shape = Cylinder(height=25, mass=2, thickness=0.5)
+    radius = shape.base_perimeter / (2 * np.pi)
+    volume = enclosed_volume(shape=shape)
+    assert isinstance(volume, float)
+    assert np.isclose(volume, np.pi * radius**2 * shape.height_, rtol=ATOL, atol=0)
+
+    # Independent of the sampling resolution
+    assert enclosed_volume(shape=shape.replace(n_height_steps=2, theta_step=2)) == volume
+
+    # Fine meshes
+    for shape in (Iroko(n_height_steps=400, theta_step=0.002), Willow(n_height_steps=400, theta_step=0.002)):
+        assert np.isclose(enclosed_volume(shape=shape), mesh_volume(shape.vertices, shape.faces), rtol=1e-4, atol=0)
+
+    # Batches
+    shapes = [Iroko(), Willow(), Cylinder(height=25, mass=2, thickness=0.5)]
+    volumes = enclosed_volume(shape=GCSBatch.from_shapes(shapes))
+    assert volumes.shape == (3,)
+    assert np.allclose(volumes, [enclosed_volume(shape=shape) for shape in shapes], rtol=ATOL, atol=0)
+
+
+def test_centroid() -> None:
+    """Tests for ``gcs.metrics.centroid``.
+
+    """
+    # Cylinder
+    shape = Cylinder(height=25, mass=2, thickness=0.5)
+    assert np.allclose(centroid(shape=shape), [0, 0, 12.5], rtol=0, atol=ATOL)
+
+    # Fine meshes of the wall
+    for shape in (Iroko(n_height_steps=400, theta_step=0.002, triangulate_caps=False),
+                  Willow(n_height_steps=400, theta_step=0.002, triangulate_caps=False)):
+        expected = mesh_centroid(shape.vertices, shape.faces)
+        assert centroid(shape=shape).shape == (3,)
+        assert np.allclose(centroid(shape=shape), expected, rtol=0, atol=1e-3)
+
+    # Batches
+    shapes = [Iroko(), Willow(), Cylinder(height=25, mass=2, thickness=0.5)]
+    centroids = centroid(shape=GCSBatch.from_shapes(shapes))
+    assert centroids.shape == (3, 3)
+    assert np.allclose(centroids, [centroid(shape=shape) for shape in shapes], rtol=0, atol=ATOL)
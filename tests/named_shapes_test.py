@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pickle
+
 from gcs import GCS, Cylinder, Iroko, Willow
 
 
@@ -29,6 +31,15 @@ def test_cylinder() -> None:
     shape2 = Cylinder(height=height, mass=mass, thickness=thickness)
 
     assert shape1 == shape2
+    assert hash(shape1) == hash(shape2)
+    assert not hasattr(shape2, '__dict__')
+
+    # Pickling keeps the named shape class and all parameters
+    shape3 = Cylinder(height=height, mass=mass, thickness=thickness, n_height_steps=7)
+    unpickled_shape = pickle.loads(pickle.dumps(shape3))
+
+    assert type(unpickled_shape) is Cylinder
+    assert unpickled_shape == shape3
 
 
 def test_iroko() -> None:
@@ -53,6 +64,7 @@ def test_iroko() -> None:
     shape2 = Iroko()
 
     assert shape1 == shape2
+    assert type(pickle.loads(pickle.dumps(shape2))) is Iroko
 
 
 def test_willow() -> None:
@@ -77,4 +89,13 @@ def test_willow() -> None:
     shape2 = Willow()
 
     assert shape1 == shape2
+    assert type(pickle.loads(pickle.dumps(shape2))) is Willow
+
+    # Copies keep the named shape class
+    replaced_shape = shape2.replace(height=30, vertex_dtype='float32')
+
+    assert type(replaced_shape) is Willow
+    assert replaced_shape == GCS(**(parameters | {'height': 30}))
+    assert replaced_shape.vertex_dtype_ == 'float32'
+    assert type(shape2.with_tolerance(0.5)) is Willow
 
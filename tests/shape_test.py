@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pickle
+
 import numpy as np
 from pytest import approx, raises
 
@@ -30,6 +32,8 @@ def test_gcs() -> None:
         'theta_step': 0.01,
         'density': 0.0012,
         'triangulate_caps': False,
+        'cap_triangulation': 'earcut',
+        'adaptive_tolerance': 0.0,
     }
     shape = GCS(**parameters)
 
@@ -45,6 +49,20 @@ def test_gcs() -> None:
                                atol=ATOL)
     np.testing.assert_equal(actual=shape.faces, desired=generate_faces(shape=shape))
 
+    # Shared intermediate results
+    assert shape.rings is shape.rings
+    assert not np.any(np.isnan(shape.rings._scaling_factors))
+
+    # Adaptive sampling
+    adaptive_shape = shape.replace(adaptive_tolerance=0.05, triangulate_caps=True)
+    n_rings = adaptive_shape.rings.fractions_.size
+    n_thetas = adaptive_shape.rings.thetas_.size
+
+    assert n_rings < parameters['n_height_steps']
+    assert adaptive_shape.vertices.shape == (n_rings * n_thetas, 3)
+    assert np.max(adaptive_shape.faces) == n_rings * n_thetas - 1
+    assert adaptive_shape.valid == shape.valid
+
     # Equality
     same_shape = GCS(**shape.parameters)
     different_shape = GCS(**(shape.parameters | {'height': 30}))
@@ -53,6 +71,61 @@ def test_gcs() -> None:
     assert shape != different_shape
     assert shape != 'wrong type'
 
+    # Hashing
+    assert hash(shape) == hash(same_shape)
+    assert len({shape, same_shape, different_shape}) == 2
+
+    # Immutability
+    with raises(expected_exception=AttributeError):
+        shape.height_ = 30
+    with raises(expected_exception=AttributeError):
+        del shape.height_
+    with raises(expected_exception=AttributeError):
+        shape.new_attribute = 0
+
+    # Derived copies
+    replaced_shape = shape.replace(height=30)
+
+    assert replaced_shape == different_shape
+    assert shape.parameters == parameters
+
+    with raises(expected_exception=TypeError):
+        shape.replace(unknown=0)
+
+    # Attached meshes
+    attached_shape = shape.replace(height=35)
+    vertices = np.zeros(shape=(4, 3))
+    faces = np.zeros(shape=(2, 3), dtype=int)
+
+    attached_shape.attach_mesh(vertices=vertices, faces=faces)
+
+    assert attached_shape.vertices is vertices
+    assert attached_shape.faces is faces
+
+    with raises(expected_exception=ValueError):
+        attached_shape.attach_mesh(vertices=vertices[:, :2], faces=faces)
+    with raises(expected_exception=ValueError):
+        attached_shape.attach_mesh(vertices=vertices, faces=faces.ravel())
+
+    # Pickling keeps parameters only
+    unpickled_shape = pickle.loads(pickle.dumps(shape))
+
+    assert type(unpickled_shape) is GCS
+    assert unpickled_shape == shape
+    assert 'vertices' not in unpickled_shape._cache
+
+    # Data types are output options, kept by copies but not part of the shape identity
+    typed_shape = shape.replace(vertex_dtype='float32', face_dtype='uint32')
+
+    assert typed_shape == shape
+    assert hash(typed_shape) == hash(shape)
+    assert typed_shape.parameters == parameters
+    assert typed_shape.replace(height=30).vertex_dtype_ == 'float32'
+    assert pickle.loads(pickle.dumps(typed_shape)).face_dtype_ == 'uint32'
+    assert typed_shape.vertices.dtype == np.float32
+    assert '_radii' not in typed_shape.rings.__dict__
+    assert typed_shape.faces.dtype == np.uint32
+
     # Invalid number of height steps
     invalid_parameters = parameters | {'n_height_steps': 1}
     with raises(expected_exception=ValueError):
@@ -71,3 +144,22 @@ def test_gcs() -> None:
     invalid_parameters = parameters | {'density': 0.0}
     with raises(expected_exception=ValueError):
         GCS(**invalid_parameters)
+
+    # Invalid cap triangulation
+    invalid_parameters = parameters | {'cap_triangulation': 'strip'}
+    with raises(expected_exception=ValueError):
+        GCS(**invalid_parameters)
+
+    # Invalid adaptive tolerance
+    invalid_parameters = parameters | {'adaptive_tolerance': -0.1}
+    with raises(expected_exception=ValueError):
+        GCS(**invalid_parameters)
+
+    # Invalid data types
+    invalid_parameters = parameters | {'vertex_dtype': 'float16'}
+    with raises(expected_exception=ValueError):
+        GCS(**invalid_parameters)
+
+    invalid_parameters = parameters | {'face_dtype': 'int16'}
+    with raises(expected_exception=ValueError):
+        GCS(**invalid_parameters)
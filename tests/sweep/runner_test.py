@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+
+import numpy as np
+from pytest import raises
+
+from gcs import GCSBatch, Iroko, Willow
+from gcs.io import load_columns, load_parameters_columnar
+from gcs.sweep import run_sweep, sample_parameters
+
+
+def test_run_sweep(monkeypatch) -> None:
+    """Tests for ``gcs.sweep.run_sweep``.
+
+    """
+    directory = Path(__file__).resolve().parent / 'sweep'
+
+    shapes = sample_parameters(ranges={'c4_base': (-1, 1), 'mass': (0.05, 2)}, n_samples=16,
+                               seed=0, c8_base=0, c4_top=0, c8_top=0, twist_linear=0, twist_amplitude=0,
+                               twist_cycles=0, perimeter_ratio=0.2, height=25, thickness=0.5, n_height_steps=5, theta_step=0.5)
+
+    try:
+        for workers in [1, 2]:
+            run_sweep(directory=directory, shapes=shapes, chunk_size=2, workers=workers)
+
+            results = load_columns(directory=directory)
+            order = np.argsort(results['index'])
+
+            assert 'meshed' not in results and 'mesh_error' not in results
+            np.testing.assert_array_equal(results['index'][order], np.arange(len(shapes)))
+            np.testing.assert_array_equal(results['valid'][order], shapes.valid)
+            np.testing.assert_array_equal(results['valid_base_perimeter'][order], shapes.valid_base_perimeter)
+            np.testing.assert_array_equal(results['valid_radius'][order], shapes.valid_radius)
+            np.testing.assert_array_equal(results['base_perimeter'][order], shapes.base_perimeter)
+            np.testing.assert_array_equal(results['top_perimeter'][order], shapes.top_perimeter)
+            np.testing.assert_array_equal(results['min_radius'][order], shapes.min_radius)
+
+            # Parameters are stored in the columnar parameter layout
+            loaded = load_parameters_columnar(directory=directory)
+            np.testing.assert_array_equal(loaded.c4_base_[order], shapes.c4_base_)
+            np.testing.assert_array_equal(loaded.cap_triangulation_, shapes.cap_triangulation_)
+
+        assert not shapes.valid.all() and shapes.valid.any()
+
+        # Meshes of valid shapes
+        run_sweep(directory=directory, shapes=[Iroko(), Willow(), Iroko().replace(mass=0.05)],
+                  workers=1, mesh_format='ply')
+
+        results = load_columns(directory=directory)
+
+        np.testing.assert_array_equal(results['meshed'], [True, True, False])
+        np.testing.assert_array_equal(results['mesh_error'], ['', '', ''])
+        assert sorted(file.name for file in (directory / 'meshes').iterdir()) == ['shape_000000.ply',
+                                                                                  'shape_000001.ply']
+
+        # Mesh failures are recorded, and meshes of earlier sweeps are removed
+        def fail(*args) -> None:
+            raise ValueError('x' * 200)
+
+        monkeypatch.setattr('gcs.sweep.runner._save_mesh_job', fail)
+        run_sweep(directory=directory, shapes=GCSBatch.from_shapes([Iroko()]), workers=1, mesh_format='stl')
+        monkeypatch.undo()
+
+        results = load_columns(directory=directory)
+
+        np.testing.assert_array_equal(results['meshed'], [False])
+        assert results['mesh_error'][0] == ('ValueError: ' + 'x' * 200)[:128]
+        assert not list((directory / 'meshes').iterdir())
+
+        run_sweep(directory=directory, shapes=[Willow()], workers=1, mesh_format='ply')
+        run_sweep(directory=directory, shapes=[Willow()], workers=1)
+
+        assert not (directory / 'meshes').exists()
+
+        # Empty sweep
+        run_sweep(directory=directory, shapes=[], workers=1)
+
+        assert len(load_columns(directory=directory)['index']) == 0
+
+        with raises(ValueError):
+            run_sweep(directory=directory, shapes=shapes, chunk_size=0)
+        with raises(ValueError):
+            run_sweep(directory=directory, shapes=shapes, mesh_format='step')
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import raises
+
+from gcs import GCSBatch
+from gcs.sweep import sample_parameters
+
+FIXED = {
+    'c8_base': 0,
+    'c8_top': 0,
+    'twist_linear': 0,
+    'twist_amplitude': 0,
+    'twist_cycles': 0,
+    'perimeter_ratio': 1,
+    'height': 25,
+    'mass': 2,
+    'thickness': 0.5,
+}
+
+
+def test_sample_parameters() -> None:
+    """Tests for ``gcs.sweep.sample_parameters``.
+
+    """
+    ranges = {'c4_base': (-0.5, 0.5), 'c4_top': (0, 0.2)}
+
+    # Grid
+    shapes = sample_parameters(ranges=ranges, n_samples=3, method='grid', **FIXED)
+
+    assert isinstance(shapes, GCSBatch)
+    assert len(shapes) == 9
+    np.testing.assert_array_equal(shapes.c4_base_, np.repeat([-0.5, 0, 0.5], 3))
+    np.testing.assert_allclose(shapes.c4_top_, np.tile([0, 0.1, 0.2], 3))
+    np.testing.assert_array_equal(shapes.height_, 25)
+
+    # Random samplers stay within the ranges and are reproducible
+    for method in ['lhs', 'sobol']:
+        shapes = sample_parameters(ranges=ranges, n_samples=64, method=method, seed=0, **FIXED)
+
+        assert len(shapes) == 64
+        assert np.all((shapes.c4_base_ >= -0.5) & (shapes.c4_base_ <= 0.5))
+        assert np.all((shapes.c4_top_ >= 0) & (shapes.c4_top_ <= 0.2))
+        assert np.unique(shapes.c4_base_).size == 64
+
+        repeated = sample_parameters(ranges=ranges, n_samples=64, method=method, seed=0, **FIXED)
+        np.testing.assert_array_equal(shapes.c4_base_, repeated.c4_base_)
+
+    # Latin hypercube samples each stratum once
+    shapes = sample_parameters(ranges={'c4_base': (0, 1)}, n_samples=10, method='lhs', seed=1, c4_top=0, **FIXED)
+    np.testing.assert_array_equal(np.sort(np.floor(shapes.c4_base_ * 10)), np.arange(10))
+
+    # Integer parameters are rounded, and zero-width ranges are fixed
+    shapes = sample_parameters(ranges={'n_height_steps': (10, 20), 'c4_base': (0.1, 0.1)},
+                               n_samples=16, c4_top=0, **FIXED)
+
+    assert shapes.n_height_steps_.dtype.kind == 'i'
+    assert np.all((shapes.n_height_steps_ >= 10) & (shapes.n_height_steps_ <= 20))
+    np.testing.assert_array_equal(shapes.c4_base_, 0.1)
+
+    with raises(ValueError):
+        sample_parameters(ranges=ranges, n_samples=4, method='random', **FIXED)
+    with raises(ValueError):
+        sample_parameters(ranges=ranges, n_samples=0, **FIXED)
+    with raises(ValueError):
+        sample_parameters(ranges={}, n_samples=4, c4_base=0, c4_top=0, **FIXED)
+    with raises(ValueError):
+        sample_parameters(ranges={'cap_triangulation': (0, 1)} | ranges, n_samples=4, **FIXED)
+    with raises(ValueError):
+        sample_parameters(ranges={'diameter': (0, 1)} | ranges, n_samples=4, **FIXED)
+    with raises(ValueError):
+        sample_parameters(ranges=ranges | {'height': (10, 20)}, n_samples=4, **FIXED)
+    with raises(ValueError):
+        sample_parameters(ranges={'c4_base': (0.5, -0.5), 'c4_top': (0, 0.2)}, n_samples=4, **FIXED)
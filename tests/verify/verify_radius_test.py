@@ -4,6 +4,8 @@ import numpy as np
 from pytest import approx
 
 from gcs import Cylinder, GCS
+from gcs.geometry.polar_curves import optimal_scaling_factor
+from gcs.geometry.summed_cosine import summed_cosine
 from gcs.verify.verify_radius import min_radius, verify_radius
 from ..constants import ATOL
 
@@ -13,14 +15,35 @@ def test_min_radius() -> None:
 
     """
     # Circle radius
-    thetas = np.arange(start=0, stop=2 * np.pi, step=0.01)
     expected_min_r = 2.0
     perimeter = 2 * np.pi * expected_min_r
+    thetas = np.arange(start=0, stop=2 * np.pi, step=0.01)
 
-    min_r = min_radius(thetas=thetas, perimeter=perimeter, c4=0.0, c8=0.0)
+    min_r = min_radius(thetas, perimeter, 0.0, 0.0)
 
     assert min_r == approx(expected=expected_min_r, abs=ATOL)
 
+    # Batch of curves
+    c4s = np.array([0.0, 0.2, 0.4])
+    c8s = np.array([0.0, -0.05, 0.1])
+
+    min_rs = min_radius(thetas=thetas, perimeter=perimeter, c4=c4s, c8=c8s)
+
+    assert min_rs.shape == (3,)
+    for c4, c8, min_r in zip(c4s, c8s, min_rs):
+        assert min_r == approx(expected=min_radius(thetas=thetas, perimeter=perimeter, c4=c4, c8=c8),
+                               abs=ATOL)
+
+    # Lobed profile against dense sampling
+    c4 = 0.5
+    c8 = 0.3
+    dense_thetas = np.linspace(start=0, stop=2 * np.pi, num=100001)
+    r0 = optimal_scaling_factor(length=perimeter, c4=c4, c8=c8, n_steps=thetas.size)
+
+    min_r = min_radius(thetas=thetas, perimeter=perimeter, c4=c4, c8=c8)
+
+    assert min_r == approx(expected=np.min(summed_cosine(theta=dense_thetas, r0=r0, c4=c4, c8=c8)), abs=1e-8)
+
 
 def test_verify_radius() -> None:
     """Tests for ``gcs.verify.verify_radius``.